@@ -0,0 +1,79 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+def _encode(payload: Dict[str, Any]) -> str:
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+def _decode(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return payload
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the key of the last row on a page as an opaque cursor."""
+    return _encode({"id": int(last_id)})
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by encode_cursor back into the last seen id."""
+    return _decode(cursor)["id"]
+
+def encode_rank_cursor(rank: float, last_id: int) -> str:
+    """Cursor of a page ordered by rank (descending), then id."""
+    return _encode({"rank": rank, "id": int(last_id)})
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """Decode a cursor produced by encode_rank_cursor into (rank, id)."""
+    payload = _decode(cursor)
+    rank = payload.get("rank")
+    if not isinstance(rank, (int, float)) or isinstance(rank, bool):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return float(rank), payload["id"]
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    # Total number of matching rows, only filled in when a count was requested
+    total: Optional[int] = None
+    total_estimated: bool = False
+
+    @classmethod
+    def from_items(cls, items: List[T], limit: int, keyset: bool = True) -> "Page[T]":
+        """
+        Build a page from up to ``limit + 1`` rows ordered by id.
+        The extra row only signals that another page exists and is not returned.
+        Rows in any other order (``keyset=False``) get no cursor and are paged by offset.
+        """
+        if len(items) > limit:
+            items = items[:limit]
+            if keyset and items:
+                return cls(items=items, next_cursor=encode_cursor(items[-1].id))
+        return cls(items=items)
+
+    @classmethod
+    def from_ranked(cls, hits: List[T], limit: int) -> "Page[T]":
+        """
+        Build a page from up to ``limit + 1`` search hits ordered by rank, then id.
+        The cursor holds the rank and id of the last hit returned.
+        """
+        if len(hits) > limit:
+            hits = hits[:limit]
+            last = hits[-1]
+            return cls(items=hits, next_cursor=encode_rank_cursor(last.rank, last.item.id))
+        return cls(items=hits)
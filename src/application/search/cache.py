@@ -0,0 +1,92 @@
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Deque, Dict, Optional, Tuple
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.config import (
+    NL_TRANSLATION_CACHE_SIZE, NL_TRANSLATION_CACHE_TTL, NL_TRANSLATOR, NL_TRANSLATOR_TIMEOUT
+)
+from .model import LocalModelStub, ModelTranslator
+from .rules import RuleBasedTranslator
+from .translation import QueryTranslator, Translation, TranslationError, normalize_text
+
+# Latencies kept for the percentile in the stats
+LATENCY_WINDOW = 1000
+
+@dataclass
+class TranslatorStats:
+    translator: str
+    calls: int
+    cache_hits: int
+    cache_misses: int
+    errors: int
+    # Over the last LATENCY_WINDOW calls that reached the translator
+    latency_avg_ms: float
+    latency_p95_ms: float
+    latency_max_ms: float
+    cache: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class CachingTranslator:
+    """
+    Translations cached by normalized text and the day they were made for, so a repeated
+    question skips the translator; the day is part of the key because relative dates
+    resolve against it. Failures are not cached. Also times every call that reaches the
+    translator.
+    """
+
+    def __init__(self, translator: QueryTranslator, cache: LRUCache):
+        self.translator = translator
+        self.cache = cache
+        self.calls = 0
+        self.errors = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def translate(self, text: str, today: date) -> Tuple[Translation, bool, float]:
+        """The translation, whether it came from the cache, and the seconds spent translating."""
+        key = (normalize_text(text), today.isoformat())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, True, 0.0
+        self.calls += 1
+        started = time.perf_counter()
+        try:
+            translation = await self.translator.translate(text, today)
+        except TranslationError:
+            self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._latencies.append(elapsed)
+        self.cache.set(key, translation)
+        return translation, False, elapsed
+
+    def stats(self) -> TranslatorStats:
+        latencies = sorted(self._latencies)
+        cache = self.cache.stats()
+        return TranslatorStats(
+            translator=self.translator.name,
+            calls=self.calls,
+            cache_hits=cache.hits,
+            cache_misses=cache.misses,
+            errors=self.errors,
+            latency_avg_ms=round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            latency_p95_ms=round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 3) if latencies else 0.0,
+            latency_max_ms=round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            cache=cache.to_dict(),
+        )
+
+def create_translator(name: str, timeout: Optional[float] = None) -> QueryTranslator:
+    if name == "rules":
+        return RuleBasedTranslator()
+    if name == "model":
+        return ModelTranslator(LocalModelStub(), timeout=timeout)
+    raise ValueError(f"Unknown translator {name!r}")
+
+nl_translator = CachingTranslator(
+    create_translator(NL_TRANSLATOR, timeout=NL_TRANSLATOR_TIMEOUT),
+    LRUCache(maxsize=NL_TRANSLATION_CACHE_SIZE, ttl=NL_TRANSLATION_CACHE_TTL),
+)
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import re
+from datetime import date
+from typing import Awaitable, Callable, Optional
+from .rules import RuleBasedTranslator
+from .translation import (
+    ENTITY_QUERIES, QueryTranslator, Translation, TranslationError, filter_fields, normalize_text,
+    query_from_filters, query_to_filters
+)
+
+# Takes a prompt and returns the model's completion
+Completion = Callable[[str], Awaitable[str]]
+
+PROMPT = """Translate a search phrase into filters for one of the entities below.
+Today is {today}. Dates are ISO 8601; created_to is exclusive.
+{entities}
+Answer with a JSON object only: {{"entity": "<entity>", "filters": {{...}}}}.
+Leave out filters the phrase does not mention.
+Search: {text}"""
+
+_SEARCH_LINE = re.compile(r"^Search: (.*)$", re.MULTILINE)
+_TODAY = re.compile(r"^Today is (\d{4}-\d{2}-\d{2})\.", re.MULTILINE)
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+def build_prompt(text: str, today: date) -> str:
+    entities = "\n".join(f"- {entity}: {', '.join(filter_fields(entity))}" for entity in ENTITY_QUERIES)
+    return PROMPT.format(today=today.isoformat(), entities=entities, text=text)
+
+class ModelTranslator(QueryTranslator):
+    """
+    Translator backed by a language model: the phrase goes out in a prompt listing the
+    filters of each entity, and the JSON answer is validated into a list query exactly
+    like API input. Answers that are late or do not validate raise TranslationError.
+    """
+    name = "model"
+
+    def __init__(self, complete: Completion, timeout: Optional[float] = None):
+        self.complete = complete
+        self.timeout = timeout
+
+    async def translate(self, text: str, today: date) -> Translation:
+        text = normalize_text(text)
+        if not text:
+            raise TranslationError("Nothing to search for")
+        try:
+            answer = await asyncio.wait_for(self.complete(build_prompt(text, today)), self.timeout)
+        except asyncio.TimeoutError:
+            raise TranslationError(f"The model did not answer within {self.timeout}s") from None
+        return self.parse(answer)
+
+    def parse(self, answer: str) -> Translation:
+        # Models like to wrap JSON in prose or code fences
+        match = _JSON_OBJECT.search(answer)
+        try:
+            payload = json.loads(match.group(0) if match else answer)
+        except json.JSONDecodeError as e:
+            raise TranslationError(f"The model answered with invalid JSON: {e}") from e
+        if not isinstance(payload, dict):
+            raise TranslationError("The model answer is not an object")
+        entity = payload.get("entity")
+        query = query_from_filters(entity, payload.get("filters") or {})
+        return Translation(entity=entity, query=query, translator=self.name)
+
+class LocalModelStub:
+    """
+    Stand-in for a model endpoint, used until one is deployed: it answers the prompt
+    the way a model is asked to, by running the rule translator on the search line.
+    """
+
+    def __init__(self):
+        self.rules = RuleBasedTranslator()
+
+    async def __call__(self, prompt: str) -> str:
+        search, today = _SEARCH_LINE.search(prompt), _TODAY.search(prompt)
+        if search is None or today is None:
+            return "{}"
+        translation = self.rules.translate_text(search.group(1), date.fromisoformat(today.group(1)))
+        return json.dumps({"entity": translation.entity, "filters": query_to_filters(translation.query)})
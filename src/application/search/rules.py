@@ -0,0 +1,341 @@
+import math
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from src.domain.services.specifications import (
+    SpecConstraint, SpecificationError, canonical_unit, format_range_filter, parse_quantity
+)
+from .translation import MAX_ID, QueryTranslator, Translation, TranslationError, normalize_text, query_from_filters
+
+# Entity nouns; the entity mentioned first is searched
+ENTITY_WORDS = {
+    "requests": r"requests?|rfqs?",
+    "offers": r"offers?|quotes?|quotations?|bids?|proposals?",
+    "equipment": r"equipment|devices?|machines?|assets?|inventory",
+}
+
+CATEGORIES = {
+    "server": "server", "servers": "server", "network": "network", "networking": "network",
+    "storage": "storage", "medical": "medical", "industrial": "industrial", "lab": "laboratory",
+    "laboratory": "laboratory", "office": "office", "safety": "safety",
+}
+
+STATUSES = {
+    "requests": {
+        "draft": "draft", "pending": "pending", "open": "pending", "approved": "approved", "rejected": "rejected",
+        "completed": "completed", "cancelled": "cancelled", "canceled": "cancelled", "in progress": "in_progress",
+    },
+    "offers": {
+        "draft": "draft", "pending": "pending", "open": "pending", "accepted": "accepted", "rejected": "rejected",
+        "cancelled": "cancelled", "canceled": "cancelled", "expired": "expired",
+    },
+    "equipment": {
+        "available": "available", "in use": "in_use", "in maintenance": "maintenance",
+        "maintenance": "maintenance", "retired": "retired", "reserved": "reserved",
+    },
+}
+
+PRIORITIES = {
+    "urgent": "high", "high priority": "high", "high-priority": "high", "critical": "high",
+    "medium priority": "medium", "normal priority": "medium", "low priority": "low", "low-priority": "low",
+}
+
+CURRENCIES = {
+    "$": "USD", "usd": "USD", "dollar": "USD", "dollars": "USD",
+    "€": "EUR", "eur": "EUR", "euro": "EUR", "euros": "EUR",
+    "£": "GBP", "gbp": "GBP", "pound": "GBP", "pounds": "GBP",
+}
+
+# Categories a request can ask for; the rest only describe equipment
+REQUEST_CATEGORIES = {"server", "network", "storage"}
+
+MULTIPLIERS = {"k": 1e3, "thousand": 1e3, "m": 1e6, "mm": 1e6, "million": 1e6}
+
+# Money fields of each entity: (lower bound, upper bound)
+AMOUNT_FIELDS = {"requests": ("min_budget", "max_budget"), "offers": ("min_price", "max_price")}
+
+# Words that join the parts of a phrase rather than filter anything
+FILLER_WORDS = frozenset(
+    "a an the all any some and or with for from of in on at to by that which are is were was "
+    "show me find list get give search my our please".split()
+)
+
+LOWER = r"over|above|more than|greater than|at least|min(?:imum)?|>=|>"
+UPPER = r"under|below|less than|at most|up to|max(?:imum)?|<=|<"
+
+def _words(options) -> str:
+    return "|".join(re.escape(option) for option in sorted(options, key=len, reverse=True))
+
+_ENTITY = re.compile("|".join(rf"\b(?P<{entity}>{words})\b" for entity, words in ENTITY_WORDS.items()))
+_CATEGORY = re.compile(rf"\b({_words(CATEGORIES)})\b")
+_PRIORITY = re.compile(rf"\b({_words(PRIORITIES)})\b")
+_CURRENCY_WORD = re.compile(rf"(?:^|(?<=[\s\d]))({_words(CURRENCIES)})(?=$|[\s\d])")
+_AMOUNT = (
+    rf"(?P<{{name}}_symbol>[$€£])?\s*(?P<{{name}}>\d+(?:,\d{{{{3}}}})*(?:\.\d+)?(?:e[+-]?\d+)?)\s*"
+    rf"(?P<{{name}}_multiplier>{_words(MULTIPLIERS)})?\b\s*(?P<{{name}}_code>{_words(c for c in CURRENCIES if c.isalpha())})?\b"
+)
+_BETWEEN = re.compile(rf"\b(?:between|from)\s+{_AMOUNT.format(name='low')}\s*(?:and|to|-)\s*{_AMOUNT.format(name='high')}")
+_BOUND = re.compile(rf"(?:(?P<lower>{LOWER})|(?P<upper>{UPPER}))\s*{_AMOUNT.format(name='amount')}")
+_SPEC = re.compile(
+    rf"\b(?P<key>[a-z][a-z_]*)\s+(?:of\s+)?(?:(?P<lower>{LOWER})|(?P<upper>{UPPER}))\s*"
+    r"(?P<value>\d+(?:,\d{3})*(?:\.\d+)?\s*[a-z]+)\b"
+)
+_CLIENT = re.compile(r"\b(?:from|for|of|by) client (?:#|id )?(\d+)\b")
+_REQUEST_ID = re.compile(r"\b(?:for|on|to) request (?:#|id )?(\d+)\b")
+_EQUIPMENT_ID = re.compile(r"\bequipment (?:#|id )(\d+)\b")
+_RELATIVE = re.compile(r"\b(?:in the |during the )?(?:(last|past) (\d+) (day|week|month|year)s?|(this|last|past) (week|month|year)|today|yesterday)\b")
+_SINCE = re.compile(r"\b(since|after|before|until) (\d{4}-\d{2}-\d{2})\b")
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def _months_before(day: date, months: int) -> date:
+    first = _add_months(day.replace(day=1), -months)
+    last = _add_months(first, 1) - timedelta(days=1)
+    return first.replace(day=min(day.day, last.day))
+
+def _calendar_before(start: date, unit: str) -> date:
+    if unit == "week":
+        return start - timedelta(weeks=1)
+    if unit == "month":
+        return _add_months(start, -1)
+    return start.replace(year=start.year - 1)
+
+def _id(match: re.Match, name: str) -> int:
+    value = int(match.group(1))
+    if not 1 <= value <= MAX_ID:
+        raise TranslationError(f"No {name} has id {value}")
+    return value
+
+def _start(day: date) -> datetime:
+    return datetime.combine(day, time())
+
+def _amount(match: re.Match, name: str) -> Tuple[float, Optional[str]]:
+    value = float(match.group(name).replace(",", ""))
+    multiplier = match.group(f"{name}_multiplier")
+    if multiplier:
+        value *= MULTIPLIERS[multiplier]
+    if not math.isfinite(value):
+        raise TranslationError(f"Amount out of range: {match.group(0).strip()!r}")
+    currency = match.group(f"{name}_symbol") or match.group(f"{name}_code")
+    return value, CURRENCIES.get(currency) if currency else None
+
+class RuleBasedTranslator(QueryTranslator):
+    """
+    Deterministic translator built from keyword and pattern rules; needs no model and
+    answers in microseconds. It understands the entity ("offers", "equipment",
+    requests by default), categories, statuses, priorities, amounts with currencies
+    ("over 10k EUR", "between $5k and $8k"), spec bounds ("power over 400W"), client
+    and request ids and created_at windows ("last month", "past 7 days",
+    "since 2025-05-01"). Words it does not know are ignored and listed in the notes.
+    """
+    name = "rules"
+
+    async def translate(self, text: str, today: date) -> Translation:
+        return self.translate_text(text, today)
+
+    def translate_text(self, text: str, today: date) -> Translation:
+        text = normalize_text(text)
+        if not text:
+            raise TranslationError("Nothing to search for")
+        filters: Dict[str, Any] = {}
+        notes: List[str] = []
+
+        # Spec bounds first, so "power over 400W" is not read as an amount
+        constraints, text = self.spec_constraints(text)
+        entity = self.entity(text, bool(constraints))
+        if constraints:
+            if entity == "equipment":
+                filters["spec_ranges"] = [text for constraint in constraints for text in format_range_filter(constraint)]
+            else:
+                notes.append("Specification bounds only apply to equipment")
+        filters.update(self.created_window(text, today, entity, notes))
+        filters.update(self.amounts(text, entity, notes))
+
+        category = sorted({CATEGORIES[word] for word in _CATEGORY.findall(text)})
+        if category and entity == "equipment":
+            filters["category"] = category
+        elif category and entity == "requests" and REQUEST_CATEGORIES.issuperset(category):
+            filters["equipment_category"] = category
+        elif category:
+            notes.append(f"Category {', '.join(category)} does not apply to {entity}")
+        statuses = STATUSES[entity]
+        status = sorted({statuses[word] for word in re.findall(rf"\b({_words(statuses)})\b", text)})
+        if status:
+            filters["status"] = status
+        priority = _PRIORITY.search(text)
+        if priority:
+            if entity == "requests":
+                filters["priority"] = PRIORITIES[priority.group(1)]
+            else:
+                notes.append("Priorities only apply to requests")
+        filters.update(self.ids(text, entity))
+        notes.extend(f"Ignored {fragment!r}" for fragment in self.ignored(text, entity, filters))
+
+        return Translation(entity=entity, query=query_from_filters(entity, filters), translator=self.name, notes=notes)
+
+    @staticmethod
+    def entity(text: str, spec_bounds: bool = False) -> str:
+        match = _ENTITY.search(text)
+        if match:
+            return match.lastgroup
+        # Without a noun, spec bounds and statuses only equipment has ("available servers") decide
+        if spec_bounds or re.search(rf"\b({_words(set(STATUSES['equipment']) - set(STATUSES['requests']))})\b", text):
+            return "equipment"
+        return "requests"
+
+    @staticmethod
+    def spec_constraints(text: str) -> Tuple[List[SpecConstraint], str]:
+        """Bounds on numeric specifications, and the text without them."""
+        constraints = []
+
+        def take(match: re.Match) -> str:
+            value = match.group("value")
+            unit = re.sub(r"^[\d.,\s]+", "", value)
+            try:
+                canonical_unit(unit)
+                quantity = parse_quantity(value)
+            except SpecificationError:
+                return match.group(0)
+            operator = match.group("lower") or match.group("upper")
+            inclusive = operator.startswith(("at ", "min", "max", "up", ">=", "<="))
+            if match.group("lower"):
+                constraints.append(SpecConstraint(match.group("key"), quantity.unit, minimum=quantity.value,
+                                                  min_inclusive=inclusive))
+            else:
+                constraints.append(SpecConstraint(match.group("key"), quantity.unit, maximum=quantity.value,
+                                                  max_inclusive=inclusive))
+            return " "
+
+        return constraints, _SPEC.sub(take, text)
+
+    @staticmethod
+    def amounts(text: str, entity: str, notes: List[str]) -> Dict[str, Any]:
+        filters: Dict[str, Any] = {}
+        currency = None
+        between = _BETWEEN.search(text)
+        if between:
+            (low, low_currency), (high, high_currency) = _amount(between, "low"), _amount(between, "high")
+            bounds = {"lower": low, "upper": high}
+            currency = low_currency or high_currency
+        else:
+            bounds = {}
+            for match in _BOUND.finditer(text):
+                value, stated = _amount(match, "amount")
+                bounds["lower" if match.group("lower") else "upper"] = value
+                currency = stated or currency
+        if bounds.get("lower", -math.inf) > bounds.get("upper", math.inf):
+            raise TranslationError(f"Empty amount range: {bounds['lower']:g} to {bounds['upper']:g}")
+        mentioned = _CURRENCY_WORD.search(text)
+        currency = currency or (CURRENCIES[mentioned.group(1)] if mentioned else None)
+        if entity not in AMOUNT_FIELDS:
+            if bounds or currency:
+                notes.append("Amounts and currencies do not apply to equipment")
+            return filters
+        lower_field, upper_field = AMOUNT_FIELDS[entity]
+        if "lower" in bounds:
+            filters[lower_field] = bounds["lower"]
+        if "upper" in bounds:
+            filters[upper_field] = bounds["upper"]
+        if currency:
+            filters["currency"] = currency
+        return filters
+
+    @staticmethod
+    def ignored(text: str, entity: str, filters: Dict[str, Any]) -> List[str]:
+        """The fragments of ``text`` no rule understood, without filler words at their ends."""
+        # Phrases first, so "request 12" is not read as the entity noun
+        patterns = [pattern for pattern, name in (
+            (_CLIENT, "client_id"), (_REQUEST_ID, "request_id"), (_EQUIPMENT_ID, "equipment_id")
+        ) if name in filters]
+        patterns += [_BETWEEN, _BOUND, _RELATIVE, _SINCE, _ENTITY, _CATEGORY, _PRIORITY, _CURRENCY_WORD,
+                     re.compile(rf"\b({_words(STATUSES[entity])})\b")]
+        for pattern in patterns:
+            text = pattern.sub("\0", text)
+        fragments = []
+        for fragment in re.split(r"[\0,;]", text):
+            words = re.findall(r"[^\s:()]+", fragment)
+            while words and words[0] in FILLER_WORDS:
+                words.pop(0)
+            while words and words[-1] in FILLER_WORDS:
+                words.pop()
+            if words:
+                fragments.append(" ".join(words))
+        return fragments
+
+    @staticmethod
+    def created_window(text: str, today: date, entity: str, notes: List[str]) -> Dict[str, Any]:
+        window: Dict[str, Any] = {}
+        relative = _RELATIVE.search(text)
+        if relative:
+            try:
+                window = RuleBasedTranslator.relative_window(relative, today)
+            except TranslationError:
+                raise
+            except (ValueError, OverflowError) as e:
+                raise TranslationError(f"Dates out of range: {relative.group(0)!r}") from e
+        for keyword, day in _SINCE.findall(text):
+            try:
+                moment = _start(date.fromisoformat(day))
+            except ValueError as e:
+                raise TranslationError(f"Invalid date: {day!r}") from e
+            window["created_from" if keyword in ("since", "after") else "created_to"] = moment
+        if window.get("created_from", datetime.min) >= window.get("created_to", datetime.max):
+            raise TranslationError(f"Empty date range: {window['created_from']:%Y-%m-%d} to {window['created_to']:%Y-%m-%d}")
+        if window and entity == "equipment":
+            notes.append("Creation dates do not apply to equipment")
+            return {}
+        return window
+
+    @staticmethod
+    def relative_window(relative: re.Match, today: date) -> Dict[str, datetime]:
+        """The created_at window of a _RELATIVE match. Dates past year 1 or 9999 raise ValueError."""
+        _, count, count_unit, which, unit = relative.groups()
+        if which == "past":
+            # "past month" is a rolling window like "past 1 month"; "last month" a calendar one
+            count, count_unit, which = 1, unit, None
+        tomorrow = today + timedelta(days=1)
+        if count:
+            # Rolling windows end with today
+            count = int(count)
+            if count < 1:
+                raise TranslationError(f"Empty date range: {relative.group(0)!r}")
+            if count_unit == "day":
+                start = today - timedelta(days=count - 1)
+            elif count_unit == "week":
+                start = today - timedelta(weeks=count) + timedelta(days=1)
+            else:
+                months = count * 12 if count_unit == "year" else count
+                start = _months_before(today, months) + timedelta(days=1)
+            end = tomorrow
+        elif relative.group(0).endswith("today"):
+            start, end = today, tomorrow
+        elif relative.group(0).endswith("yesterday"):
+            start, end = today - timedelta(days=1), today
+        elif unit == "week":
+            start = today - timedelta(days=today.weekday())
+            end = start + timedelta(weeks=1)
+        elif unit == "month":
+            start = today.replace(day=1)
+            end = _add_months(start, 1)
+        else:
+            start, end = date(today.year, 1, 1), date(today.year + 1, 1, 1)
+        if which == "last":
+            # "last month" is the calendar month before this one
+            start, end = _calendar_before(start, unit), start
+        return {"created_from": _start(start), "created_to": _start(end)}
+
+    @staticmethod
+    def ids(text: str, entity: str) -> Dict[str, Any]:
+        filters = {}
+        client = _CLIENT.search(text)
+        if client and entity == "requests":
+            filters["client_id"] = _id(client, "client")
+        request = _REQUEST_ID.search(text)
+        if request and entity == "offers":
+            filters["request_id"] = _id(request, "request")
+        equipment = _EQUIPMENT_ID.search(text)
+        if equipment and entity == "offers":
+            filters["equipment_id"] = _id(equipment, "equipment")
+        return filters
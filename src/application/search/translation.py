@@ -0,0 +1,107 @@
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from typing import Any, Dict, List, Union
+from pydantic import TypeAdapter, ValidationError
+from src.application.use_cases.equipment.queries.list_equipment import ListEquipmentQuery
+from src.application.use_cases.offer.queries.list_offers import ListOffersQuery
+from src.application.use_cases.request.queries.list_requests import ListRequestsQuery
+from src.domain.services.specifications import SpecificationError, format_range_filter, parse_range_filter
+
+ListQuery = Union[ListRequestsQuery, ListOffersQuery, ListEquipmentQuery]
+
+# Entity searched -> the list query its filters are expressed in
+ENTITY_QUERIES = {
+    "requests": ListRequestsQuery,
+    "offers": ListOffersQuery,
+    "equipment": ListEquipmentQuery,
+}
+
+# Fields of the list queries that page results rather than filter them
+PAGING_FIELDS = frozenset({"skip", "limit", "cursor", "count"})
+
+# Ids are Postgres integers
+MAX_ID = 2 ** 31 - 1
+
+class TranslationError(ValueError):
+    """Text that could not be turned into a query, or a backend that failed to."""
+
+@dataclass(frozen=True)
+class Translation:
+    """
+    Structured query for a natural-language search. Translations are cached and shared
+    between callers, so the query must not be mutated; copy it with dataclasses.replace.
+    """
+    entity: str
+    query: ListQuery
+    # Name of the backend that produced it
+    translator: str
+    # Parts of the text that do not apply to the entity or were not understood
+    notes: List[str] = field(default_factory=list)
+
+class QueryTranslator(ABC):
+    """Turns a search phrase into a list query of one entity."""
+    name: str = "translator"
+
+    @abstractmethod
+    async def translate(self, text: str, today: date) -> Translation:
+        """
+        Translate ``text``; relative dates ("last month") are resolved against ``today``.
+        Raises TranslationError when the text cannot be translated.
+        """
+
+_SPACES = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """
+    The form of a phrase translations are cached under: Unicode-normalized, lower case,
+    with runs of whitespace collapsed and trailing punctuation removed. Translators
+    must give the same result for every text with the same normalized form.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _SPACES.sub(" ", text).strip().rstrip("?!.").strip()
+
+def filter_fields(entity: str) -> List[str]:
+    return [item.name for item in fields(ENTITY_QUERIES[entity]) if item.name not in PAGING_FIELDS]
+
+def query_to_filters(query: ListQuery) -> Dict[str, Any]:
+    """The filters a query sets (other than defaults), as JSON-compatible values."""
+    filters = {}
+    for item in fields(query):
+        value = getattr(query, item.name)
+        if item.name in PAGING_FIELDS or value is None or value == item.default:
+            continue
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif item.name == "spec_ranges":
+            value = [text for constraint in value for text in format_range_filter(constraint)]
+        filters[item.name] = value
+    return filters
+
+def query_from_filters(entity: str, filters: Dict[str, Any]) -> ListQuery:
+    """
+    Build the list query of ``entity`` from filters as query_to_filters returns them,
+    validating names and types. Raises TranslationError for anything invalid.
+    """
+    query_class = ENTITY_QUERIES.get(entity)
+    if query_class is None:
+        raise TranslationError(f"Unknown entity {entity!r}")
+    if not isinstance(filters, dict):
+        raise TranslationError("Filters must be an object")
+    unknown = set(filters) - set(filter_fields(entity))
+    if unknown:
+        raise TranslationError(f"Unknown filters for {entity}: {', '.join(sorted(unknown))}")
+    values = dict(filters)
+    for name, value in values.items():
+        if name.endswith("_id") and isinstance(value, int) and not 1 <= value <= MAX_ID:
+            raise TranslationError(f"Invalid filters for {entity}: {name} {value} is out of range")
+    try:
+        if "spec_ranges" in values:
+            values["spec_ranges"] = [
+                constraint for text in values["spec_ranges"] for constraint in parse_range_filter(text)
+            ]
+        return TypeAdapter(query_class).validate_python(values)
+    except (SpecificationError, TypeError, ValidationError) as e:
+        raise TranslationError(f"Invalid filters for {entity}: {e}") from e
@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+from ...base import QueryHandler
+from src.infrastructure.repositories.client import ClientRepository
+from src.domain.entities.client import Client
+from .list_clients import ListClientsQuery, ListClientsHandler
+
+class ExportClientsHandler(QueryHandler[ListClientsQuery]):
+    """Streams every client matching the list filters; pagination fields are ignored."""
+
+    def __init__(self, repository: ClientRepository):
+        self.repository = repository
+
+    async def handle(self, query: ListClientsQuery) -> AsyncIterator[Client]:
+        filters = ListClientsHandler.build_filters(query)
+        async for client in self.repository.iter_all(filters=filters):
+            yield client
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.domain.entities.client import Client
+from src.domain.repositories.base import RowVersion
 from src.infrastructure.repositories.client import ClientRepository
 from ...base import Query, QueryHandler
 
@@ -14,4 +15,8 @@ class GetClientHandler(QueryHandler[GetClientQuery]):
         self.repository = repository
 
     async def handle(self, query: GetClientQuery) -> Optional[Client]:
-        return await self.repository.get_by_id(query.client_id) 
\ No newline at end of file
+        return await self.repository.get_by_id(query.client_id)
+
+    async def version(self, query: GetClientQuery) -> Optional[RowVersion]:
+        """Version of the row without loading it, for conditional requests."""
+        return await self.repository.get_version(query.client_id) 
\ No newline at end of file
@@ -1,29 +1,72 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Dict, Any
 
 from src.domain.entities.client import Client
 from src.infrastructure.repositories.client import ClientRepository
 from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_cursor
+from src.domain.repositories.base import RowVersion
 
 @dataclass
 class ListClientsQuery(Query):
     name: Optional[str] = None
     email: Optional[str] = None
     company_name: Optional[str] = None
+    is_active: Optional[bool] = None
+    # Rows whose tags contain all of these pairs
+    tags: Optional[Dict[str, Any]] = None
+    # "substring" (ILIKE) or "fuzzy" (trigram similarity, ranked, offset paging only)
+    match: str = "substring"
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
+    # "exact", "estimate" or "auto"; None skips counting
+    count: Optional[str] = None
 
 class ListClientsHandler(QueryHandler[ListClientsQuery]):
     def __init__(self, repository: ClientRepository):
         self.repository = repository
 
-    async def handle(self, query: ListClientsQuery) -> List[Client]:
+    @staticmethod
+    def build_filters(query: ListClientsQuery) -> Dict[str, Any]:
         filters = {}
+        text_operator = 'similar' if query.match == 'fuzzy' else 'icontains'
         if query.name:
-            filters['name__icontains'] = query.name
+            filters[f'name__{text_operator}'] = query.name
         if query.email:
-            filters['email__icontains'] = query.email
+            filters[f'email__{text_operator}'] = query.email
         if query.company_name:
-            filters['company_name__icontains'] = query.company_name
+            filters[f'company_name__{text_operator}'] = query.company_name
+        if query.is_active is not None:
+            filters['is_active'] = query.is_active
+        if query.tags:
+            filters['tags__contains'] = query.tags
+        return filters
 
-        return await self.repository.list(filters=filters, skip=query.skip, limit=query.limit) 
\ No newline at end of file
+    async def handle(self, query: ListClientsQuery) -> Page[Client]:
+        filters = self.build_filters(query)
+
+        # Fetch one extra row to know whether there is a next page
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        items = await self.repository.list(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(items, query.limit, keyset=query.match != "fuzzy")
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
+
+    async def version(self, query: ListClientsQuery) -> Page[RowVersion]:
+        """
+        The page ``handle`` would return, with row versions in place of entities.
+        Only ids and modification times are read, for conditional requests.
+        """
+        filters = self.build_filters(query)
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repository.list_versions(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(rows, query.limit, keyset=query.match != "fuzzy")
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
\ No newline at end of file
@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+from ...base import QueryHandler
+from src.infrastructure.repositories.equipment import EquipmentRepository
+from src.domain.entities.equipment import Equipment
+from .list_equipment import ListEquipmentQuery, ListEquipmentHandler
+
+class ExportEquipmentHandler(QueryHandler[ListEquipmentQuery]):
+    """Streams all equipment matching the list filters; pagination fields are ignored."""
+
+    def __init__(self, repository: EquipmentRepository):
+        self.repository = repository
+
+    async def handle(self, query: ListEquipmentQuery) -> AsyncIterator[Equipment]:
+        filters = ListEquipmentHandler.build_filters(query)
+        async for item in self.repository.iter_all(filters=filters):
+            yield item
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.domain.entities.equipment import Equipment
+from src.domain.repositories.base import RowVersion
 from src.infrastructure.repositories.equipment import EquipmentRepository
 from ...base import Query, QueryHandler
 
@@ -14,4 +15,8 @@ class GetEquipmentHandler(QueryHandler[GetEquipmentQuery]):
         self.repository = repository
 
     async def handle(self, query: GetEquipmentQuery) -> Optional[Equipment]:
-        return await self.repository.get_by_id(query.equipment_id) 
\ No newline at end of file
+        return await self.repository.get_by_id(query.equipment_id)
+
+    async def version(self, query: GetEquipmentQuery) -> Optional[RowVersion]:
+        """Version of the row without loading it, for conditional requests."""
+        return await self.repository.get_version(query.equipment_id) 
\ No newline at end of file
@@ -1,29 +1,90 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Union, Dict, Any
 
 from src.domain.entities.equipment import Equipment
+from src.domain.services.specifications import SpecConstraint
 from src.infrastructure.repositories.equipment import EquipmentRepository
 from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_cursor
+from src.domain.repositories.base import RowVersion
 
 @dataclass
 class ListEquipmentQuery(Query):
-    category: Optional[str] = None
-    status: Optional[str] = None
+    category: Optional[Union[str, List[str]]] = None
+    status: Optional[Union[str, List[str]]] = None
     manufacturer: Optional[str] = None
+    name: Optional[str] = None
+    model: Optional[str] = None
+    is_active: Optional[bool] = None
+    # Rows whose JSONB columns contain these pairs, and specification keys that must be present
+    tags: Optional[Dict[str, Any]] = None
+    specifications: Optional[Dict[str, Any]] = None
+    spec_keys: Optional[List[str]] = None
+    # Bounds on numeric specifications, compared in canonical units
+    spec_ranges: Optional[List[SpecConstraint]] = None
+    # "substring" (ILIKE) or "fuzzy" (trigram similarity, ranked, offset paging only)
+    match: str = "substring"
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
+    # "exact", "estimate" or "auto"; None skips counting
+    count: Optional[str] = None
 
 class ListEquipmentHandler(QueryHandler[ListEquipmentQuery]):
     def __init__(self, repository: EquipmentRepository):
         self.repository = repository
 
-    async def handle(self, query: ListEquipmentQuery) -> List[Equipment]:
+    @staticmethod
+    def build_filters(query: ListEquipmentQuery) -> Dict[str, Any]:
         filters = {}
+        text_operator = 'similar' if query.match == 'fuzzy' else 'icontains'
         if query.category:
             filters['category'] = query.category
         if query.status:
             filters['status'] = query.status
         if query.manufacturer:
-            filters['manufacturer'] = query.manufacturer
+            # Exact in substring mode, where the btree index serves it
+            filters['manufacturer__similar' if query.match == 'fuzzy' else 'manufacturer'] = query.manufacturer
+        if query.name:
+            filters[f'name__{text_operator}'] = query.name
+        if query.model:
+            filters[f'model__{text_operator}'] = query.model
+        if query.is_active is not None:
+            filters['is_active'] = query.is_active
+        if query.tags:
+            filters['tags__contains'] = query.tags
+        if query.specifications:
+            filters['specifications__contains'] = query.specifications
+        if query.spec_keys:
+            filters['specifications__has_key'] = query.spec_keys
+        if query.spec_ranges:
+            filters['specifications__range'] = tuple(query.spec_ranges)
+        return filters
 
-        return await self.repository.list(filters=filters, skip=query.skip, limit=query.limit) 
\ No newline at end of file
+    async def handle(self, query: ListEquipmentQuery) -> Page[Equipment]:
+        filters = self.build_filters(query)
+
+        # Fetch one extra row to know whether there is a next page
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        items = await self.repository.list(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(items, query.limit, keyset=query.match != "fuzzy")
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
+
+    async def version(self, query: ListEquipmentQuery) -> Page[RowVersion]:
+        """
+        The page ``handle`` would return, with row versions in place of entities.
+        Only ids and modification times are read, for conditional requests.
+        """
+        filters = self.build_filters(query)
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repository.list_versions(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(rows, query.limit, keyset=query.match != "fuzzy")
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
\ No newline at end of file
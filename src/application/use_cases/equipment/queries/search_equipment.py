@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Optional
+from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_rank_cursor
+from src.domain.entities.equipment import Equipment
+from src.domain.repositories.base import SearchHit
+from src.infrastructure.repositories.equipment import EquipmentRepository
+from .list_equipment import ListEquipmentQuery, ListEquipmentHandler
+
+@dataclass
+class SearchEquipmentQuery(Query):
+    text: str
+    # Structured filters, as accepted by the list endpoint; their paging fields are ignored
+    filters: ListEquipmentQuery = field(default_factory=ListEquipmentQuery)
+    limit: int = 20
+    cursor: Optional[str] = None
+
+class SearchEquipmentHandler(QueryHandler[SearchEquipmentQuery]):
+    def __init__(self, repository: EquipmentRepository):
+        self.repository = repository
+
+    async def handle(self, query: SearchEquipmentQuery) -> Page[SearchHit[Equipment]]:
+        filters = ListEquipmentHandler.build_filters(query.filters)
+        after = decode_rank_cursor(query.cursor) if query.cursor else None
+        # Fetch one extra hit to know whether there is a next page
+        hits = await self.repository.search(query.text, filters, limit=query.limit + 1, after=after)
+        return Page.from_ranked(hits, query.limit)
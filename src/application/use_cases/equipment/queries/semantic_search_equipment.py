@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from ...base import Query, QueryHandler
+from src.domain.entities.equipment import Equipment
+from src.domain.repositories.base import SimilarityHit
+from src.infrastructure.repositories.equipment import EquipmentRepository
+from src.infrastructure.search.semantic import SemanticIndex, semantic_indexes
+
+@dataclass
+class SemanticSearchEquipmentQuery(Query):
+    text: str
+    limit: int = 10
+
+class SemanticSearchEquipmentHandler(QueryHandler[SemanticSearchEquipmentQuery]):
+    """
+    Equipment whose text is closest to a free-form description, by the in-memory
+    semantic index. Unlike full-text search, no word has to match exactly.
+    """
+
+    def __init__(self, repository: EquipmentRepository, index: Optional[SemanticIndex] = None):
+        self.repository = repository
+        self.index = index or semantic_indexes["equipment"]
+
+    async def handle(self, query: SemanticSearchEquipmentQuery) -> List[SimilarityHit[Equipment]]:
+        hits = await self.index.similar_to_text(self.repository.session, query.text, query.limit)
+        if not hits:
+            return []
+        equipment = {
+            item.id: item
+            for item in await self.repository.list(filters={'id': [row_id for row_id, _ in hits]}, limit=len(hits))
+        }
+        return [
+            SimilarityHit(item=equipment[row_id], score=score)
+            for row_id, score in hits
+            if row_id in equipment
+        ]
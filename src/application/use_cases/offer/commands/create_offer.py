@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.infrastructure.repositories.offer import OfferRepository
 from ...base import Command, CommandHandler
@@ -13,7 +14,8 @@ class CreateOfferHandler(CommandHandler[CreateOfferCommand]):
     def __init__(self, repository: OfferRepository):
         self.repository = repository
 
-    async def handle(self, command: CreateOfferCommand) -> Offer:
+    async def handle(self, command: CreateOfferCommand) -> Optional[Offer]:
+        # None when the request does not exist (or was deleted)
         offer = Offer(
             request_id=command.dto.request_id,
             equipment_id=command.dto.equipment_id,
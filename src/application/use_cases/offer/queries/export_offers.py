@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+from ...base import QueryHandler
+from src.infrastructure.repositories.offer import OfferRepository
+from src.domain.entities.offer import Offer
+from .list_offers import ListOffersQuery, ListOffersHandler
+
+class ExportOffersHandler(QueryHandler[ListOffersQuery]):
+    """Streams every offer matching the list filters; pagination fields are ignored."""
+
+    def __init__(self, repository: OfferRepository):
+        self.repository = repository
+
+    async def handle(self, query: ListOffersQuery) -> AsyncIterator[Offer]:
+        filters = ListOffersHandler.build_filters(query)
+        async for offer in self.repository.iter_all(filters=filters):
+            yield offer
@@ -3,6 +3,7 @@ from typing import Optional
 from ...base import Query, QueryHandler
 from src.infrastructure.repositories.offer import OfferRepository
 from src.domain.entities.offer import Offer
+from src.domain.repositories.base import RowVersion
 
 @dataclass
 class GetOfferQuery(Query):
@@ -13,4 +14,8 @@ class GetOfferHandler(QueryHandler[GetOfferQuery]):
         self.repository = repository
 
     async def handle(self, query: GetOfferQuery) -> Optional[Offer]:
-        return await self.repository.get_by_id(query.offer_id) 
\ No newline at end of file
+        return await self.repository.get_by_id(query.offer_id)
+
+    async def version(self, query: GetOfferQuery) -> Optional[RowVersion]:
+        """Version of the row without loading it, for conditional requests."""
+        return await self.repository.get_version(query.offer_id) 
\ No newline at end of file
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Union, Dict, Any
 from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_cursor
+from src.domain.repositories.base import RowVersion
 from src.infrastructure.repositories.offer import OfferRepository
 from src.domain.entities.offer import Offer
 
@@ -8,17 +11,28 @@ from src.domain.entities.offer import Offer
 class ListOffersQuery(Query):
     request_id: Optional[int] = None
     equipment_id: Optional[int] = None
-    status: Optional[str] = None
+    status: Optional[Union[str, List[str]]] = None
     min_price: Optional[float] = None
     max_price: Optional[float] = None
+    currency: Optional[str] = None
+    is_active: Optional[bool] = None
+    # Offers including all of these additional services
+    services: Optional[List[str]] = None
+    # created_at window [created_from, created_to); lets Postgres skip monthly partitions
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
+    # "exact", "estimate" or "auto"; None skips counting
+    count: Optional[str] = None
 
 class ListOffersHandler(QueryHandler[ListOffersQuery]):
     def __init__(self, repository: OfferRepository):
         self.repository = repository
 
-    async def handle(self, query: ListOffersQuery) -> List[Offer]:
+    @staticmethod
+    def build_filters(query: ListOffersQuery) -> Dict[str, Any]:
         filters = {}
         if query.request_id:
             filters['request_id'] = query.request_id
@@ -30,5 +44,43 @@ class ListOffersHandler(QueryHandler[ListOffersQuery]):
             filters['price__gte'] = query.min_price
         if query.max_price is not None:
             filters['price__lte'] = query.max_price
+        if query.currency:
+            filters['currency'] = query.currency
+        if query.is_active is not None:
+            filters['is_active'] = query.is_active
+        if query.services:
+            # Stored as {service: true}, so containment only matches enabled services
+            filters['additional_services__contains'] = {service: True for service in query.services}
+        if query.created_from:
+            filters['created_at__gte'] = query.created_from
+        if query.created_to:
+            filters['created_at__lt'] = query.created_to
+        return filters
 
-        return await self.repository.list(filters=filters, skip=query.skip, limit=query.limit) 
\ No newline at end of file
+    async def handle(self, query: ListOffersQuery) -> Page[Offer]:
+        filters = self.build_filters(query)
+
+        # Fetch one extra row to know whether there is a next page
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        items = await self.repository.list(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(items, query.limit)
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
+
+    async def version(self, query: ListOffersQuery) -> Page[RowVersion]:
+        """
+        The page ``handle`` would return, with row versions in place of entities.
+        Only ids and modification times are read, for conditional requests.
+        """
+        filters = self.build_filters(query)
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repository.list_versions(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(rows, query.limit)
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
\ No newline at end of file
@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+from ...base import QueryHandler
+from src.infrastructure.repositories.request import RequestRepository
+from src.domain.entities.request import Request
+from .list_requests import ListRequestsQuery, ListRequestsHandler
+
+class ExportRequestsHandler(QueryHandler[ListRequestsQuery]):
+    """Streams every request matching the list filters; pagination fields are ignored."""
+
+    def __init__(self, repository: RequestRepository):
+        self.repository = repository
+
+    async def handle(self, query: ListRequestsQuery) -> AsyncIterator[Request]:
+        filters = ListRequestsHandler.build_filters(query)
+        async for request in self.repository.iter_all(filters=filters):
+            yield request
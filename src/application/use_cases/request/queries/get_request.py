@@ -3,6 +3,7 @@ from typing import Optional
 from ...base import Query, QueryHandler
 from src.infrastructure.repositories.request import RequestRepository
 from src.domain.entities.request import Request
+from src.domain.repositories.base import RowVersion
 
 @dataclass
 class GetRequestQuery(Query):
@@ -13,4 +14,8 @@ class GetRequestHandler(QueryHandler[GetRequestQuery]):
         self.repository = repository
 
     async def handle(self, query: GetRequestQuery) -> Optional[Request]:
-        return await self.repository.get_by_id(query.request_id) 
\ No newline at end of file
+        return await self.repository.get_by_id(query.request_id)
+
+    async def version(self, query: GetRequestQuery) -> Optional[RowVersion]:
+        """Version of the row without loading it, for conditional requests."""
+        return await self.repository.get_version(query.request_id) 
\ No newline at end of file
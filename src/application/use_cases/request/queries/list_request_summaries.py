@@ -0,0 +1,27 @@
+from ...base import QueryHandler
+from src.application.dto.pagination import Page, decode_cursor
+from src.domain.entities.request import RequestSummary
+from src.infrastructure.repositories.request import RequestRepository
+from .list_requests import ListRequestsQuery, ListRequestsHandler
+
+class ListRequestSummariesHandler(QueryHandler[ListRequestsQuery]):
+    """
+    The page of requests the list endpoint returns for the same query, each with its
+    offer count, price range, best and latest offer, read in a single query.
+    """
+
+    def __init__(self, repository: RequestRepository):
+        self.repository = repository
+
+    async def handle(self, query: ListRequestsQuery) -> Page[RequestSummary]:
+        filters = ListRequestsHandler.build_filters(query)
+
+        # Fetch one extra row to know whether there is a next page
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        summaries = await self.repository.list_summaries(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(summaries, query.limit)
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
@@ -1,25 +1,41 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Union, Dict, Any
 from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_cursor
+from src.domain.repositories.base import RowVersion
 from src.infrastructure.repositories.request import RequestRepository
 from src.domain.entities.request import Request
 
 @dataclass
 class ListRequestsQuery(Query):
     client_id: Optional[int] = None
-    equipment_category: Optional[str] = None
-    status: Optional[str] = None
+    equipment_category: Optional[Union[str, List[str]]] = None
+    status: Optional[Union[str, List[str]]] = None
     priority: Optional[str] = None
     min_budget: Optional[float] = None
     max_budget: Optional[float] = None
+    currency: Optional[str] = None
+    is_active: Optional[bool] = None
+    # Rows whose JSONB columns contain these pairs, and specification keys that must be present
+    tags: Optional[Dict[str, Any]] = None
+    specifications: Optional[Dict[str, Any]] = None
+    spec_keys: Optional[List[str]] = None
+    # created_at window [created_from, created_to); lets Postgres skip monthly partitions
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
+    # "exact", "estimate" or "auto"; None skips counting
+    count: Optional[str] = None
 
 class ListRequestsHandler(QueryHandler[ListRequestsQuery]):
     def __init__(self, repository: RequestRepository):
         self.repository = repository
 
-    async def handle(self, query: ListRequestsQuery) -> List[Request]:
+    @staticmethod
+    def build_filters(query: ListRequestsQuery) -> Dict[str, Any]:
         filters = {}
         if query.client_id:
             filters['client_id'] = query.client_id
@@ -33,5 +49,46 @@ class ListRequestsHandler(QueryHandler[ListRequestsQuery]):
             filters['budget_min__gte'] = query.min_budget
         if query.max_budget is not None:
             filters['budget_max__lte'] = query.max_budget
+        if query.currency:
+            filters['currency'] = query.currency
+        if query.is_active is not None:
+            filters['is_active'] = query.is_active
+        if query.tags:
+            filters['tags__contains'] = query.tags
+        if query.specifications:
+            filters['required_specifications__contains'] = query.specifications
+        if query.spec_keys:
+            filters['required_specifications__has_key'] = query.spec_keys
+        if query.created_from:
+            filters['created_at__gte'] = query.created_from
+        if query.created_to:
+            filters['created_at__lt'] = query.created_to
+        return filters
 
-        return await self.repository.list(filters=filters, skip=query.skip, limit=query.limit) 
\ No newline at end of file
+    async def handle(self, query: ListRequestsQuery) -> Page[Request]:
+        filters = self.build_filters(query)
+
+        # Fetch one extra row to know whether there is a next page
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        items = await self.repository.list(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(items, query.limit)
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
+
+    async def version(self, query: ListRequestsQuery) -> Page[RowVersion]:
+        """
+        The page ``handle`` would return, with row versions in place of entities.
+        Only ids and modification times are read, for conditional requests.
+        """
+        filters = self.build_filters(query)
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repository.list_versions(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(rows, query.limit)
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
\ No newline at end of file
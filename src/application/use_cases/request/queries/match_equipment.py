@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from ...base import Query, QueryHandler
+from src.domain.services.matching import EquipmentMatch, MatchScorer
+from src.infrastructure.repositories.factory import RepositoryFactory
+from src.infrastructure.repositories.request import RequestRepository
+
+@dataclass
+class MatchRequestEquipmentQuery(Query):
+    request_id: str
+    limit: int = 10
+
+class MatchRequestEquipmentHandler(QueryHandler[MatchRequestEquipmentQuery]):
+    """
+    Finds the equipment best matching a request. Candidates are prefiltered and turned
+    into numeric features in SQL, then scored together by MatchScorer; only the top
+    rows are loaded as entities.
+    """
+
+    def __init__(
+        self,
+        repository: RequestRepository,
+        repositories: Optional[RepositoryFactory] = None,
+        scorer: Optional[MatchScorer] = None
+    ):
+        self.repository = repository
+        # Equipment is read in the same unit of work as the request
+        repositories = repositories or RepositoryFactory(
+            repository.session, cache_reads=repository.cache_reads, replica_reads=repository.replica_reads
+        )
+        self.equipment = repositories.get_equipment_repository()
+        self.scorer = scorer or MatchScorer()
+
+    async def handle(self, query: MatchRequestEquipmentQuery) -> Optional[List[EquipmentMatch]]:
+        """Best matches first, or None if the request does not exist."""
+        request = await self.repository.get_by_id(query.request_id)
+        category = await self.repository.get_stored_category(query.request_id)
+        if request is None or category is None:
+            return None
+        candidates = await self.equipment.match_candidates(
+            category, request.required_specifications, request.currency
+        )
+        scored = self.scorer.top(candidates, request.quantity, request.budget_max, query.limit)
+        if not scored:
+            return []
+        equipment = {
+            item.id: item
+            for item in await self.equipment.list(
+                filters={'id': [candidate.equipment_id for candidate in scored]}, limit=len(scored)
+            )
+        }
+        return [
+            EquipmentMatch(equipment=equipment[candidate.equipment_id], score=candidate.score,
+                           breakdown=candidate.breakdown)
+            for candidate in scored
+            if candidate.equipment_id in equipment
+        ]
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Optional
+from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_rank_cursor
+from src.domain.entities.request import Request
+from src.domain.repositories.base import SearchHit
+from src.infrastructure.repositories.request import RequestRepository
+from .list_requests import ListRequestsQuery, ListRequestsHandler
+
+@dataclass
+class SearchRequestsQuery(Query):
+    text: str
+    # Structured filters, as accepted by the list endpoint; their paging fields are ignored
+    filters: ListRequestsQuery = field(default_factory=ListRequestsQuery)
+    limit: int = 20
+    cursor: Optional[str] = None
+
+class SearchRequestsHandler(QueryHandler[SearchRequestsQuery]):
+    def __init__(self, repository: RequestRepository):
+        self.repository = repository
+
+    async def handle(self, query: SearchRequestsQuery) -> Page[SearchHit[Request]]:
+        filters = ListRequestsHandler.build_filters(query.filters)
+        after = decode_rank_cursor(query.cursor) if query.cursor else None
+        # Fetch one extra hit to know whether there is a next page
+        hits = await self.repository.search(query.text, filters, limit=query.limit + 1, after=after)
+        return Page.from_ranked(hits, query.limit)
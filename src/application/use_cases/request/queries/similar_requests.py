@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from ...base import Query, QueryHandler
+from src.domain.entities.request import Request
+from src.domain.repositories.base import SimilarityHit
+from src.infrastructure.repositories.request import RequestRepository
+from src.infrastructure.search.semantic import SemanticIndex, semantic_indexes
+
+@dataclass
+class SimilarRequestsQuery(Query):
+    request_id: str
+    limit: int = 10
+
+class SimilarRequestsHandler(QueryHandler[SimilarRequestsQuery]):
+    """Requests whose text is closest to a request's, by the in-memory semantic index."""
+
+    def __init__(self, repository: RequestRepository, index: Optional[SemanticIndex] = None):
+        self.repository = repository
+        self.index = index or semantic_indexes["requests"]
+
+    async def handle(self, query: SimilarRequestsQuery) -> Optional[List[SimilarityHit[Request]]]:
+        """Most similar first, or None if the request does not exist."""
+        try:
+            request_id = int(query.request_id)
+        except ValueError:
+            return None
+        hits = await self.index.similar_to_row(self.repository.session, request_id, query.limit)
+        if hits is None:
+            return None
+        if not hits:
+            return []
+        requests = {
+            item.id: item
+            for item in await self.repository.list(filters={'id': [row_id for row_id, _ in hits]}, limit=len(hits))
+        }
+        return [
+            SimilarityHit(item=requests[row_id], score=score)
+            for row_id, score in hits
+            if row_id in requests
+        ]
@@ -0,0 +1,69 @@
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel
+from ...base import Query, QueryHandler
+from src.application.search.cache import CachingTranslator, nl_translator
+from src.application.search.translation import query_to_filters
+from src.application.use_cases.equipment.queries.list_equipment import ListEquipmentHandler
+from src.application.use_cases.offer.queries.list_offers import ListOffersHandler
+from src.application.use_cases.request.queries.list_requests import ListRequestsHandler
+from src.domain.entities.equipment import Equipment
+from src.domain.entities.offer import Offer
+from src.domain.entities.request import Request
+from src.infrastructure.repositories.factory import RepositoryFactory
+
+@dataclass
+class NaturalLanguageSearchQuery(Query):
+    text: str
+    limit: int = 20
+    cursor: Optional[str] = None
+    # Day relative dates are resolved against; today in UTC, like stored timestamps, when not given
+    today: Optional[date] = None
+
+class NaturalLanguageSearchResult(BaseModel):
+    text: str
+    entity: str
+    # The structured query the text was translated to, as list endpoint filters
+    filters: Dict[str, Any]
+    translator: str
+    cached: bool
+    translation_ms: float
+    notes: List[str] = []
+    items: List[Union[Request, Offer, Equipment]]
+    next_cursor: Optional[str] = None
+
+class NaturalLanguageSearchHandler(QueryHandler[NaturalLanguageSearchQuery]):
+    """
+    Translates a search phrase into the list query of the entity it asks for and runs
+    it through that entity's list handler, so results, paging and caching are the
+    same as on the list endpoint.
+    """
+
+    def __init__(self, repositories: RepositoryFactory, translator: Optional[CachingTranslator] = None):
+        # Searches any entity, all read in the unit of work of the factory
+        self.repositories = repositories
+        self.repository = repositories.get_request_repository()
+        self.translator = translator or nl_translator
+
+    async def handle(self, query: NaturalLanguageSearchQuery) -> NaturalLanguageSearchResult:
+        """Raises TranslationError when the text cannot be translated."""
+        translation, cached, elapsed = await self.translator.translate(query.text, query.today or datetime.now(timezone.utc).date())
+        if translation.entity == "offers":
+            handler = ListOffersHandler(self.repositories.get_offer_repository())
+        elif translation.entity == "equipment":
+            handler = ListEquipmentHandler(self.repositories.get_equipment_repository())
+        else:
+            handler = ListRequestsHandler(self.repository)
+        page = await handler.handle(replace(translation.query, limit=query.limit, cursor=query.cursor))
+        return NaturalLanguageSearchResult(
+            text=query.text,
+            entity=translation.entity,
+            filters=query_to_filters(translation.query),
+            translator=translation.translator,
+            cached=cached,
+            translation_ms=round(elapsed * 1000, 3),
+            notes=translation.notes,
+            items=page.items,
+            next_cursor=page.next_cursor,
+        )
@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+from ...base import QueryHandler
+from src.infrastructure.repositories.user import UserRepository
+from src.domain.entities.user import User
+from .list_users import ListUsersQuery, ListUsersHandler
+
+class ExportUsersHandler(QueryHandler[ListUsersQuery]):
+    """Streams every user matching the list filters; pagination fields are ignored."""
+
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+
+    async def handle(self, query: ListUsersQuery) -> AsyncIterator[User]:
+        filters = ListUsersHandler.build_filters(query)
+        async for user in self.repository.iter_all(filters=filters):
+            yield user
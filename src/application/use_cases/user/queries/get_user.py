@@ -3,6 +3,7 @@ from typing import Optional
 from ...base import Query, QueryHandler
 from src.infrastructure.repositories.user import UserRepository
 from src.domain.entities.user import User
+from src.domain.repositories.base import RowVersion
 
 @dataclass
 class GetUserQuery(Query):
@@ -13,4 +14,8 @@ class GetUserHandler(QueryHandler[GetUserQuery]):
         self.repository = repository
 
     async def handle(self, query: GetUserQuery) -> Optional[User]:
-        return await self.repository.get_by_id(query.user_id) 
\ No newline at end of file
+        return await self.repository.get_by_id(query.user_id)
+
+    async def version(self, query: GetUserQuery) -> Optional[RowVersion]:
+        """Version of the row without loading it, for conditional requests."""
+        return await self.repository.get_version(query.user_id) 
\ No newline at end of file
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Dict, Any
 from ...base import Query, QueryHandler
+from src.application.dto.pagination import Page, decode_cursor
+from src.domain.repositories.base import RowVersion
 from src.infrastructure.repositories.user import UserRepository
 from src.domain.entities.user import User
 
@@ -9,20 +11,57 @@ class ListUsersQuery(Query):
     username: Optional[str] = None
     email: Optional[str] = None
     role: Optional[str] = None
+    is_active: Optional[bool] = None
+    # "substring" (ILIKE) or "fuzzy" (trigram similarity, ranked, offset paging only)
+    match: str = "substring"
     skip: int = 0
     limit: int = 100
+    cursor: Optional[str] = None
+    # "exact", "estimate" or "auto"; None skips counting
+    count: Optional[str] = None
 
 class ListUsersHandler(QueryHandler[ListUsersQuery]):
     def __init__(self, repository: UserRepository):
         self.repository = repository
 
-    async def handle(self, query: ListUsersQuery) -> List[User]:
+    @staticmethod
+    def build_filters(query: ListUsersQuery) -> Dict[str, Any]:
         filters = {}
+        text_operator = 'similar' if query.match == 'fuzzy' else 'icontains'
         if query.username:
-            filters['username__icontains'] = query.username
+            filters[f'username__{text_operator}'] = query.username
         if query.email:
-            filters['email__icontains'] = query.email
+            filters[f'email__{text_operator}'] = query.email
         if query.role:
             filters['role'] = query.role
+        if query.is_active is not None:
+            filters['is_active'] = query.is_active
+        return filters
 
-        return await self.repository.list(filters=filters, skip=query.skip, limit=query.limit) 
\ No newline at end of file
+    async def handle(self, query: ListUsersQuery) -> Page[User]:
+        filters = self.build_filters(query)
+
+        # Fetch one extra row to know whether there is a next page
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        items = await self.repository.list(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(items, query.limit, keyset=query.match != "fuzzy")
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
+
+    async def version(self, query: ListUsersQuery) -> Page[RowVersion]:
+        """
+        The page ``handle`` would return, with row versions in place of entities.
+        Only ids and modification times are read, for conditional requests.
+        """
+        filters = self.build_filters(query)
+        after_id = decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repository.list_versions(
+            filters=filters, skip=query.skip, limit=query.limit + 1, after_id=after_id
+        )
+        page = Page.from_items(rows, query.limit, keyset=query.match != "fuzzy")
+        if query.count:
+            page.total, page.total_estimated = await self.repository.count_rows(filters, mode=query.count)
+        return page
\ No newline at end of file
@@ -2,7 +2,7 @@ from .base import BaseEntity
 from .user import User
 from .client import Client
 from .equipment import Equipment
-from .request import Request
+from .request import Request, RequestSummary
 from .offer import Offer
 
 __all__ = [
@@ -11,5 +11,6 @@ __all__ = [
     "Client",
     "Equipment",
     "Request",
+    "RequestSummary",
     "Offer",
 ] 
\ No newline at end of file
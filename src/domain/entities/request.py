@@ -1,6 +1,7 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional, List
-from pydantic import Field
+from pydantic import BaseModel, Field
 from .base import BaseEntity
 
 class Request(BaseEntity):
@@ -20,4 +21,23 @@ class Request(BaseEntity):
     tags: List[str] = Field(default_factory=list)
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+class RequestSummary(BaseModel):
+    """A request with figures over its live offers, so overviews need no query per request."""
+    request: Request
+    offer_count: int = 0
+    # Prices of the offers in the request's currency; None without any
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+    avg_price: Optional[float] = None
+    # Cheapest offer in the request's currency (the oldest on equal prices)
+    best_offer_id: Optional[int] = None
+    # Most recently created offer, in any currency
+    latest_offer_id: Optional[int] = None
+    latest_offer_status: Optional[str] = None
+
+    @property
+    def id(self) -> Optional[int]:
+        """Key of the summarized request, which pages are ordered by."""
+        return self.request.id
@@ -1,8 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List
+from datetime import datetime
+from typing import Generic, TypeVar, Optional, List, NamedTuple
+from pydantic import BaseModel
 
 T = TypeVar('T')
 
+class RowVersion(NamedTuple):
+    """Primary key and last modification time of a row; enough to tell if it changed."""
+    id: int
+    updated_at: Optional[datetime]
+
+class SearchHit(BaseModel, Generic[T]):
+    """An entity matching a full-text search, its rank and a highlighted snippet."""
+    item: T
+    rank: float
+    headline: str
+
+class SimilarityHit(BaseModel, Generic[T]):
+    """An entity found by semantic search and its cosine similarity to the query, in (0, 1]."""
+    item: T
+    score: float
+
 class BaseRepository(ABC, Generic[T]):
     @abstractmethod
     async def get(self, id: int) -> Optional[T]:
@@ -0,0 +1,128 @@
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+_WORD = re.compile(r"\w+")
+# Word character trigrams make "servers" close to "server"; they count for less than words
+TRIGRAM_WEIGHT = 0.5
+
+def document_text(values: Iterable[Any]) -> str:
+    """
+    The text embedded for a row: its values in order, with JSON objects flattened to
+    "key value" pairs and lists to their items. None and booleans are left out.
+    """
+    parts: List[str] = []
+
+    def add(value: Any) -> None:
+        if value is None or isinstance(value, bool):
+            return
+        if isinstance(value, dict):
+            for key, item in value.items():
+                parts.append(str(key).replace("_", " "))
+                add(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                add(item)
+        else:
+            parts.append(str(value))
+
+    for value in values:
+        add(value)
+    return " ".join(parts)
+
+def features(text: str) -> Counter:
+    """Weighted terms of a text: words, word pairs and character trigrams of words."""
+    words = _WORD.findall(text.lower())
+    terms: Counter = Counter(words)
+    terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    for word in words:
+        if len(word) > 3:
+            padded = f"#{word}#"
+            for start in range(len(padded) - 2):
+                terms[padded[start:start + 3]] += TRIGRAM_WEIGHT
+    return terms
+
+class TextEncoder(ABC):
+    """
+    Turns texts into vectors of unit length, so the dot product of two vectors is their
+    cosine similarity. Encoders must be deterministic across processes, since vectors
+    built by one worker are compared with those of another.
+    """
+    name: str = "encoder"
+    dimensions: int
+
+    def fit(self, texts: Sequence[str]) -> None:
+        """Learn corpus statistics, if the encoder uses any. Called before a full build."""
+
+    def get_state(self) -> Optional[np.ndarray]:
+        """What ``fit`` learned, saved with index snapshots so vectors stay comparable."""
+        return None
+
+    def set_state(self, state: Optional[np.ndarray]) -> None:
+        """Restore what ``get_state`` returned, instead of fitting again."""
+
+    @abstractmethod
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """A float32 array of shape (len(texts), dimensions); texts without terms are zero rows."""
+
+class HashingEncoder(TextEncoder):
+    """
+    TF-IDF over hashed terms: every term lands in one of ``dimensions`` buckets (by CRC32,
+    which unlike hash() is the same in every process) with a sign that makes collisions
+    cancel out on average. Term frequencies are dampened logarithmically and, once
+    ``fit`` has seen the corpus, weighted by the inverse document frequency of their
+    bucket. Needs no model or network access.
+    """
+    name = "hashing"
+
+    def __init__(self, dimensions: int = 256, idf: Optional[np.ndarray] = None):
+        self.dimensions = dimensions
+        self.idf = idf
+        self._buckets: Dict[str, Tuple[int, float]] = {}
+
+    def _bucket(self, term: str) -> Tuple[int, float]:
+        bucket = self._buckets.get(term)
+        if bucket is None:
+            digest = zlib.crc32(term.encode())
+            bucket = (digest % self.dimensions, 1.0 if digest >> 31 else -1.0)
+            # Bounded: vocabularies of free text keep growing
+            if len(self._buckets) < 1_000_000:
+                self._buckets[term] = bucket
+        return bucket
+
+    def fit(self, texts: Sequence[str]) -> None:
+        document_frequency = np.zeros(self.dimensions, dtype=np.float64)
+        for text in texts:
+            buckets = {self._bucket(term)[0] for term in features(text)}
+            document_frequency[list(buckets)] += 1
+        self.idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+
+    def get_state(self) -> Optional[np.ndarray]:
+        return self.idf
+
+    def set_state(self, state: Optional[np.ndarray]) -> None:
+        self.idf = state
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for term, count in features(text).items():
+                bucket, sign = self._bucket(term)
+                vectors[row, bucket] += sign * (1 + math.log(count)) if count >= 1 else sign * count
+        if self.idf is not None:
+            vectors *= self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+ENCODERS = {"hashing": HashingEncoder}
+
+def create_encoder(name: str, dimensions: int) -> TextEncoder:
+    encoder_class = ENCODERS.get(name)
+    if encoder_class is None:
+        raise ValueError(f"Unknown text encoder {name!r}")
+    return encoder_class(dimensions=dimensions)
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from pydantic import BaseModel
+from src.domain.entities.equipment import Equipment
+
+# Feature codes produced by the candidate query, used as indexes into the score tables
+CATEGORY_OTHER, CATEGORY_EXACT = 1, 2
+SPEC_MISSING, SPEC_DIFFERENT, SPEC_EQUAL = 0, 1, 2
+STATUSES = ("available", "reserved", "in_use", "maintenance", "retired")
+
+# Score of each code. A category only fits through "other" halfway; a specification
+# present with another value earns a little credit, since it may still be close.
+CATEGORY_SCORES = np.array([0.0, 0.5, 1.0])
+SPEC_SCORES = np.array([0.0, 0.25, 1.0])
+AVAILABILITY_SCORES = np.array([1.0, 0.5, 0.3, 0.2, 0.0])
+# Score given when there is nothing to judge by (no price history or no budget)
+NEUTRAL = 0.5
+
+DEFAULT_WEIGHTS = {"category": 0.3, "specifications": 0.4, "availability": 0.2, "price": 0.1}
+
+class EquipmentMatch(BaseModel):
+    """Equipment proposed for a request, its score in [0, 1] and the score of each criterion."""
+    equipment: Equipment
+    score: float
+    breakdown: Dict[str, float]
+
+@dataclass
+class MatchCandidates:
+    """
+    Features of the candidate equipment for one request, one array entry per row.
+    ``specifications`` has a column per required specification.
+    """
+    ids: np.ndarray
+    category: np.ndarray
+    status: np.ndarray
+    specifications: np.ndarray
+    # Average unit price in past offers, NaN without any
+    unit_price: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[float]], spec_count: int) -> "MatchCandidates":
+        """
+        Build from rows of (id, category code, status code, unit price, spec codes...),
+        where a negative unit price means no history. One array conversion for all rows.
+        """
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), 4 + spec_count)
+        unit_price = matrix[:, 3]
+        return cls(
+            ids=matrix[:, 0].astype(np.int64),
+            category=matrix[:, 1].astype(np.intp),
+            status=matrix[:, 2].astype(np.intp),
+            specifications=matrix[:, 4:].astype(np.intp),
+            unit_price=np.where(unit_price < 0, np.nan, unit_price)
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+@dataclass
+class ScoredCandidate:
+    equipment_id: int
+    score: float
+    breakdown: Dict[str, float]
+
+class MatchScorer:
+    """
+    Scores candidate equipment for a request, all rows at once with array operations.
+
+    Each criterion scores in [0, 1]; the total is their weighted sum, with the weights
+    normalized to add up to 1:
+
+    - category: exact category, or a fit through "other"
+    - specifications: mean credit over the required specifications (1 without any)
+    - availability: by equipment status
+    - price: 1 if the usual unit price times the quantity fits the maximum budget,
+      falling linearly to 0 at twice the budget
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        weights = weights or DEFAULT_WEIGHTS
+        total = sum(weights.values())
+        self.weights = {name: weight / total for name, weight in weights.items()}
+
+    @staticmethod
+    def price_scores(unit_price: np.ndarray, quantity: int, budget_max: Optional[float]) -> np.ndarray:
+        if not budget_max:
+            return np.full(len(unit_price), NEUTRAL)
+        overrun = (unit_price * quantity - budget_max) / budget_max
+        scores = np.clip(1.0 - overrun, 0.0, 1.0)
+        return np.where(np.isnan(unit_price), NEUTRAL, scores)
+
+    def breakdown(self, candidates: MatchCandidates, quantity: int, budget_max: Optional[float]) -> Dict[str, np.ndarray]:
+        if candidates.specifications.shape[1]:
+            specifications = SPEC_SCORES[candidates.specifications].mean(axis=1)
+        else:
+            specifications = np.ones(len(candidates))
+        return {
+            "category": CATEGORY_SCORES[candidates.category],
+            "specifications": specifications,
+            "availability": AVAILABILITY_SCORES[candidates.status],
+            "price": self.price_scores(candidates.unit_price, quantity, budget_max),
+        }
+
+    def top(
+        self, candidates: MatchCandidates, quantity: int, budget_max: Optional[float], limit: int
+    ) -> List[ScoredCandidate]:
+        """The ``limit`` best candidates, best first; ties go to the lower id."""
+        if not len(candidates) or limit <= 0:
+            return []
+        scores = self.breakdown(candidates, quantity, budget_max)
+        total = sum(self.weights.get(name, 0.0) * values for name, values in scores.items())
+        best = np.arange(len(total))
+        if limit < len(total):
+            # Everything scoring at least the limit-th best score, so ties are broken by id
+            threshold = np.partition(total, len(total) - limit)[len(total) - limit]
+            best = np.flatnonzero(total >= threshold)
+        best = best[np.lexsort((candidates.ids[best], -total[best]))][:limit]
+        return [
+            ScoredCandidate(
+                equipment_id=int(candidates.ids[index]),
+                score=round(float(total[index]), 6),
+                breakdown={name: round(float(values[index]), 6) for name, values in scores.items()}
+            )
+            for index in best
+        ]
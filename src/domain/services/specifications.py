@@ -0,0 +1,233 @@
+import math
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+# unit -> (canonical unit, factor to it). Values are stored in the canonical unit, so
+# "1.5kW" and "1500 W" compare equal. Lookups are exact first, then case-insensitive
+# for the spellings that stay unambiguous ("mW" and "MW" do not).
+UNITS: Dict[str, Tuple[str, float]] = {
+    "mW": ("W", 1e-3), "W": ("W", 1.0), "kW": ("W", 1e3), "MW": ("W", 1e6), "hp": ("W", 745.699872),
+    "mg": ("kg", 1e-6), "g": ("kg", 1e-3), "kg": ("kg", 1.0), "t": ("kg", 1e3),
+    "lb": ("kg", 0.45359237), "lbs": ("kg", 0.45359237),
+    "mm": ("m", 1e-3), "cm": ("m", 1e-2), "m": ("m", 1.0), "in": ("m", 0.0254), "ft": ("m", 0.3048),
+    "mV": ("V", 1e-3), "V": ("V", 1.0), "kV": ("V", 1e3),
+    "mA": ("A", 1e-3), "A": ("A", 1.0),
+    "Hz": ("Hz", 1.0), "kHz": ("Hz", 1e3), "MHz": ("Hz", 1e6), "GHz": ("Hz", 1e9),
+    "B": ("B", 1.0), "KB": ("B", 1e3), "MB": ("B", 1e6), "GB": ("B", 1e9), "TB": ("B", 1e12), "PB": ("B", 1e15),
+    "bps": ("bps", 1.0), "Kbps": ("bps", 1e3), "Mbps": ("bps", 1e6), "Gbps": ("bps", 1e9),
+    "ml": ("l", 1e-3), "l": ("l", 1.0),
+    "rpm": ("rpm", 1.0),
+}
+
+def _folded_units() -> Dict[str, Tuple[str, float]]:
+    folded: Dict[str, Optional[Tuple[str, float]]] = {}
+    for unit, canonical in UNITS.items():
+        key = unit.lower()
+        folded[key] = None if key in folded and folded[key] != canonical else canonical
+    return {unit: canonical for unit, canonical in folded.items() if canonical is not None}
+
+_UNITS_FOLDED = _folded_units()
+
+# Unitless numbers (port counts, cores, ...) are stored with an empty unit
+UNITLESS = ""
+
+# Names of the parts of a multi-part value such as "120x80x60mm"
+AXES = ("length", "width", "height")
+
+# Longest key a normalized value is stored under (equipment_spec_values.key)
+MAX_KEY_LENGTH = 100
+
+_NUMBER = r"\d+(?:,\d{3})*(?:\.\d+)?|\.\d+"
+_QUANTITY = re.compile(rf"^\s*({_NUMBER})\s*([a-zA-Z]*)\s*$")
+_PARTS = re.compile(r"\s*[x×*]\s*(?=[\d.])")
+_RANGE = re.compile(rf"^\s*({_NUMBER})\s*([a-zA-Z]*)\s*(?:-|–|to)\s*({_NUMBER})\s*([a-zA-Z]*)\s*$")
+_LOWER = re.compile(r"^(?:min(?:imum)?\.?|at least|from|>=|≥|>)\s*", re.IGNORECASE)
+_UPPER = re.compile(r"^(?:max(?:imum)?\.?|at most|up to|<=|≤|<)\s*", re.IGNORECASE)
+_LOWER_SUFFIX = re.compile(r"\s*(?:\+|or more|min(?:imum)?\.?)$", re.IGNORECASE)
+_UPPER_SUFFIX = re.compile(r"\s*(?:or less|max(?:imum)?\.?)$", re.IGNORECASE)
+_OPERATOR = re.compile(r"^\s*([^<>=]+?)\s*(>=|<=|>|<|=)\s*(.+)$")
+
+class SpecificationError(ValueError):
+    """A specification value or constraint that cannot be read as a quantity."""
+
+@dataclass(frozen=True)
+class Quantity:
+    value: float
+    unit: str
+
+@dataclass(frozen=True)
+class SpecValue:
+    """A numeric specification of an equipment item, in the canonical unit."""
+    key: str
+    value: float
+    unit: str
+
+@dataclass(frozen=True)
+class SpecConstraint:
+    """Bounds a specification must fall within, in the canonical unit; None is unbounded."""
+    key: str
+    unit: str
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    min_inclusive: bool = True
+    max_inclusive: bool = True
+
+    def accepts(self, value: float) -> bool:
+        if self.minimum is not None and (value < self.minimum or (value == self.minimum and not self.min_inclusive)):
+            return False
+        if self.maximum is not None and (value > self.maximum or (value == self.maximum and not self.max_inclusive)):
+            return False
+        return True
+
+def normalize_key(key: str) -> str:
+    return key.strip().lower()
+
+def canonical_unit(unit: str) -> Tuple[str, float]:
+    """(canonical unit, factor) of a unit spelling; raises SpecificationError for unknown units."""
+    if not unit:
+        return UNITLESS, 1.0
+    canonical = UNITS.get(unit) or _UNITS_FOLDED.get(unit.lower())
+    if canonical is None:
+        raise SpecificationError(f"Unknown unit {unit!r}")
+    return canonical
+
+def _number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+def _canonical(value: float, factor: float) -> float:
+    # Twelve significant digits, so "50000g" and "50kg" store exactly the same number
+    return float(f"{value * factor:.12g}")
+
+def parse_quantity(text: str, default_unit: str = "") -> Quantity:
+    """Read one number with an optional unit, e.g. "1.5 kW" or "48"."""
+    match = _QUANTITY.match(text)
+    if not match:
+        raise SpecificationError(f"Not a quantity: {text!r}")
+    unit, factor = canonical_unit(match.group(2) or default_unit)
+    return Quantity(_canonical(_number(match.group(1)), factor), unit)
+
+def parse_quantities(value: Any) -> Tuple[Quantity, ...]:
+    """
+    Read a specification value as one quantity or, for "120x80x60mm", one per part;
+    parts without a unit take the unit of the last part. A leading "max"/"min" is
+    ignored here. Raises SpecificationError for values that are not numeric.
+    """
+    if isinstance(value, bool):
+        raise SpecificationError(f"Not a quantity: {value!r}")
+    if isinstance(value, (int, float)):
+        if not math.isfinite(value):
+            raise SpecificationError(f"Not a quantity: {value!r}")
+        return (Quantity(float(value), UNITLESS),)
+    if not isinstance(value, str):
+        raise SpecificationError(f"Not a quantity: {value!r}")
+    text = _UPPER.sub("", _LOWER.sub("", value.strip()))
+    text = _UPPER_SUFFIX.sub("", _LOWER_SUFFIX.sub("", text))
+    parts = _PARTS.split(text)
+    if len(parts) > len(AXES):
+        raise SpecificationError(f"Too many parts: {value!r}")
+    last_unit = _QUANTITY.match(parts[-1])
+    default_unit = last_unit.group(2) if last_unit else ""
+    return tuple(parse_quantity(part, default_unit) for part in parts)
+
+def spec_keys(key: str, count: int) -> Tuple[str, ...]:
+    """Keys the parts of a value are stored under: "dimensions.length", ... for several parts."""
+    key = normalize_key(key)
+    return (key,) if count == 1 else tuple(f"{key}.{axis}" for axis in AXES[:count])
+
+def spec_values(specifications: Optional[Dict[str, Any]]) -> List[SpecValue]:
+    """
+    The numeric specifications of an equipment item, one per key; values that are not
+    numeric, and keys longer than MAX_KEY_LENGTH, are skipped. Keys differing only in
+    case collapse, the last one winning.
+    """
+    values: Dict[str, SpecValue] = {}
+    for key, value in (specifications or {}).items():
+        try:
+            quantities = parse_quantities(value)
+        except SpecificationError:
+            continue
+        for name, quantity in zip(spec_keys(key, len(quantities)), quantities):
+            if len(name) <= MAX_KEY_LENGTH:
+                values[name] = SpecValue(name, quantity.value, quantity.unit)
+    return list(values.values())
+
+def parse_requirement(key: str, value: Any) -> List[SpecConstraint]:
+    """
+    Constraints for a request's required specification. "max 40kg" is an upper bound,
+    "min 400W" or "400W+" a lower bound and "100-200W" a range. A bare value asks for
+    at least that much ("500W" is met by 750 W); for several parts, every part is bounded.
+    Raises SpecificationError for values that are not numeric.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        upper = bool(_UPPER.match(text) or _UPPER_SUFFIX.search(text))
+        strict = text.startswith(("<", ">")) and not text.startswith(("<=", ">="))
+        ranged = _RANGE.match(text)
+        if ranged:
+            low_text, low_unit, high_text, high_unit = ranged.groups()
+            low = parse_quantity(low_text, low_unit or high_unit)
+            high = parse_quantity(high_text, high_unit or low_unit)
+            if low.unit != high.unit:
+                raise SpecificationError(f"Mixed units: {value!r}")
+            return [SpecConstraint(normalize_key(key), low.unit, minimum=low.value, maximum=high.value)]
+    else:
+        upper = strict = False
+    quantities = parse_quantities(value)
+    return [
+        SpecConstraint(name, quantity.unit, maximum=quantity.value, max_inclusive=not strict)
+        if upper else
+        SpecConstraint(name, quantity.unit, minimum=quantity.value, min_inclusive=not strict)
+        for name, quantity in zip(spec_keys(key, len(quantities)), quantities)
+    ]
+
+def requirement_constraints(specifications: Optional[Dict[str, Any]]) -> Dict[str, List[SpecConstraint]]:
+    """Constraints of each numeric required specification, keyed by the original key."""
+    constraints = {}
+    for key, value in (specifications or {}).items():
+        try:
+            constraints[key] = parse_requirement(key, value)
+        except SpecificationError:
+            continue
+    return constraints
+
+def parse_range_filter(text: str) -> List[SpecConstraint]:
+    """
+    Read a filter such as "power>=400W", "weight<=50kg" or "ports=48". A multi-part
+    value ("dimensions<=120x80x60cm") bounds every part.
+    """
+    match = _OPERATOR.match(text)
+    if not match:
+        raise SpecificationError(f"Expected key, operator (>=, <=, >, <, =) and value, got {text!r}")
+    key, operator, value = match.groups()
+    quantities = parse_quantities(value)
+    inclusive = operator in (">=", "<=", "=")
+    return [
+        SpecConstraint(
+            name, quantity.unit,
+            minimum=quantity.value if operator in (">=", ">", "=") else None,
+            maximum=quantity.value if operator in ("<=", "<", "=") else None,
+            min_inclusive=inclusive, max_inclusive=inclusive
+        )
+        for name, quantity in zip(spec_keys(key, len(quantities)), quantities)
+    ]
+
+def _plain(value: float) -> str:
+    # Positional notation, which parse_quantity reads back: 1e12 becomes "1000000000000"
+    return format(Decimal(repr(value)).normalize(), "f")
+
+def format_range_filter(constraint: SpecConstraint) -> List[str]:
+    """Filters in the syntax of parse_range_filter that together express ``constraint``."""
+    def value(number: float) -> str:
+        return f"{_plain(number)}{constraint.unit}"
+
+    if (constraint.minimum is not None and constraint.minimum == constraint.maximum
+            and constraint.min_inclusive and constraint.max_inclusive):
+        return [f"{constraint.key}={value(constraint.minimum)}"]
+    filters = []
+    if constraint.minimum is not None:
+        filters.append(f"{constraint.key}{'>=' if constraint.min_inclusive else '>'}{value(constraint.minimum)}")
+    if constraint.maximum is not None:
+        filters.append(f"{constraint.key}{'<=' if constraint.max_inclusive else '<'}{value(constraint.maximum)}")
+    return filters
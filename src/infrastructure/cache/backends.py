@@ -0,0 +1,133 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.cache.resp import CONNECTION_ERRORS, RespClient, RespError
+
+logger = logging.getLogger(__name__)
+
+class CacheBackend(ABC):
+    """
+    Byte-oriented key/value store used by the repository caches.
+    Backends never raise on lookup failures: an unavailable cache behaves as a miss.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    async def delete_many(self, keys: List[str]) -> None:
+        for key in keys:
+            await self.delete(key)
+
+    async def clear(self) -> None:
+        """Drop every entry this process may rely on (e.g. after missing invalidations)."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process LRU cache with a time to live. Each worker keeps its own copy."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats().to_dict()
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by all workers, stored in a server speaking the Redis protocol.
+    Keys are namespaced with ``prefix``; size limits are left to the server's
+    maxmemory policy. Connection failures are counted and treated as misses.
+    """
+
+    # Keys examined per SCAN call when clearing
+    SCAN_COUNT = 1000
+
+    def __init__(self, client: RespClient, prefix: str = "", ttl: Optional[float] = None):
+        self._client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def _execute(self, *args) -> Any:
+        try:
+            return await self._client.execute(*args)
+        except (RespError, *CONNECTION_ERRORS) as e:
+            self.errors += 1
+            logger.warning("Cache command %s failed: %r", args[0], e)
+            return None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self._execute("GET", self.prefix + key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is None:
+            await self._execute("SET", self.prefix + key, value)
+        else:
+            await self._execute("SET", self.prefix + key, value, "PX", max(1, int(ttl * 1000)))
+
+    async def delete(self, key: str) -> None:
+        await self._execute("DEL", self.prefix + key)
+
+    async def delete_many(self, keys: List[str]) -> None:
+        if keys:
+            await self._execute("DEL", *(self.prefix + key for key in keys))
+
+    async def clear(self) -> None:
+        """
+        Delete every key under the prefix. The cache is shared, so this clears it for all
+        workers; SCAN walks the keys in batches rather than blocking the server like KEYS.
+        """
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self.prefix) + "*"
+        cursor = b"0"
+        while True:
+            reply = await self._execute("SCAN", cursor, "MATCH", pattern, "COUNT", self.SCAN_COUNT)
+            if reply is None:
+                return
+            cursor, keys = reply
+            if keys:
+                await self._execute("DEL", *keys)
+            if cursor == b"0":
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+    async def close(self) -> None:
+        await self._client.close()
@@ -0,0 +1,122 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import func, select
+from src.infrastructure.cache.backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from src.infrastructure.cache.invalidation import INVALIDATION_CHANNEL
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.cache.resp import RespClient
+from src.infrastructure.cache.results import list_cache
+from src.infrastructure.search.semantic import mark_all_stale, mark_written
+from src.infrastructure.database.config import (
+    CACHE_BACKEND, CACHE_REDIS_POOL_SIZE, CACHE_REDIS_TIMEOUT, CACHE_REDIS_URL, CACHE_REPLICA_LAG, ENTITY_CACHE_SIZES,
+    ENTITY_CACHE_TTL
+)
+
+logger = logging.getLogger(__name__)
+
+def create_entity_caches(backend: str = CACHE_BACKEND) -> Dict[str, CacheBackend]:
+    """
+    One cache per table so hot, rarely changing tables (equipment) can be sized
+    separately. Tables with a size of 0 are not cached.
+    """
+    tables = [table for table, size in ENTITY_CACHE_SIZES.items() if size > 0]
+    if backend == "memory":
+        return {table: MemoryCacheBackend(maxsize=ENTITY_CACHE_SIZES[table], ttl=ENTITY_CACHE_TTL) for table in tables}
+    if backend == "redis":
+        client = RespClient(CACHE_REDIS_URL, timeout=CACHE_REDIS_TIMEOUT, pool_size=CACHE_REDIS_POOL_SIZE)
+        return {table: RedisCacheBackend(client, prefix=f"entity:{table}:", ttl=ENTITY_CACHE_TTL) for table in tables}
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+entity_caches: Dict[str, CacheBackend] = create_entity_caches()
+
+# Session.info key holding the (table, id) pairs written in the current transaction
+_PENDING_INVALIDATIONS = "entity_cache_invalidations"
+
+# (table, id) of the rows written in the last CACHE_REPLICA_LAG seconds
+_recent_writes = LRUCache(maxsize=100_000, ttl=CACHE_REPLICA_LAG)
+
+def recently_written(table: str, entity_id: str) -> bool:
+    """Whether a replica may not have caught up with the last write of a row yet."""
+    return _recent_writes.get((table, entity_id)) is not None
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_PAYLOAD_LIMIT = 7999
+
+async def _evict(table: str, entity_ids: List[str]) -> None:
+    for entity_id in entity_ids:
+        _recent_writes.set((table, entity_id), True)
+        mark_written(table, entity_id)
+    cache = entity_caches.get(table)
+    if cache is not None:
+        await cache.delete_many(entity_ids)
+    list_cache.bump(table)
+
+def notification_payloads(table: str, entity_ids: List[str]) -> List[str]:
+    """Notifications "<table>:<id>,<id>,..." naming ``entity_ids``, each within the NOTIFY limit."""
+    payloads: List[str] = []
+    chunk: List[str] = []
+    size = len(table) + 1
+    for entity_id in entity_ids:
+        if chunk and size + len(entity_id) > NOTIFY_PAYLOAD_LIMIT:
+            payloads.append(f"{table}:{','.join(chunk)}")
+            chunk, size = [], len(table) + 1
+        chunk.append(entity_id)
+        size += len(entity_id) + 1
+    if chunk:
+        payloads.append(f"{table}:{','.join(chunk)}")
+    return payloads
+
+async def invalidate_entities(session: Any, table: str, entity_ids: Iterable[Any]) -> None:
+    """
+    Record writes to rows of ``table``: drop them from the cache and make cached list
+    results for the table stale, now and again once the transaction commits, so a
+    read that races the commit cannot keep serving the old data. On Postgres the
+    other workers are told through NOTIFY, which is only delivered on commit; all
+    the ids go out in one statement.
+    """
+    entity_ids = [str(entity_id) for entity_id in entity_ids]
+    if not entity_ids:
+        return
+    await _evict(table, entity_ids)
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).update((table, entity_id) for entity_id in entity_ids)
+    connection = await session.connection()
+    if connection.dialect.name == "postgresql":
+        await session.execute(select(*(
+            func.pg_notify(INVALIDATION_CHANNEL, payload) for payload in notification_payloads(table, entity_ids)
+        )))
+
+async def invalidate_entity(session: Any, table: str, entity_id: int) -> None:
+    await invalidate_entities(session, table, [entity_id])
+
+async def flush_invalidations(session: Any) -> None:
+    """Apply the invalidations of a transaction that has just committed."""
+    tables: Dict[str, List[str]] = {}
+    for table, entity_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        tables.setdefault(table, []).append(entity_id)
+    for table, entity_ids in tables.items():
+        await _evict(table, entity_ids)
+
+def discard_invalidations(session: Any) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+async def apply_invalidation(payload: str) -> None:
+    """Handle a "<table>:<id>,<id>,..." notification sent by another worker."""
+    table, _, entity_ids = payload.partition(":")
+    if not entity_ids:
+        logger.warning("Ignoring malformed cache invalidation %r", payload)
+        return
+    await _evict(table, entity_ids.split(","))
+
+async def clear_caches() -> None:
+    """Forget everything cached, e.g. after invalidations may have been missed; search indexes are rebuilt."""
+    for cache in entity_caches.values():
+        await cache.clear()
+    list_cache.bump_all()
+    mark_all_stale()
+
+async def close_entity_caches() -> None:
+    for cache in entity_caches.values():
+        await cache.close()
+
+def entity_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {table: cache.stats() for table, cache in entity_caches.items()}
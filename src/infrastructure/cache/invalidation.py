@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel carrying "<table>:<id>" payloads for written entities
+INVALIDATION_CHANNEL = "entity_cache_invalidation"
+
+class InvalidationListener:
+    """
+    Applies cache invalidations broadcast by other workers through Postgres NOTIFY.
+
+    Writers send the notification inside their transaction, so Postgres delivers
+    it only once the write is committed. The listener keeps a dedicated connection
+    to the primary. Notifications sent while it is disconnected are lost, so
+    ``on_reconnect`` runs once it is connected again to drop whatever may be stale.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        on_message: Callable[[str], Awaitable[None]],
+        on_reconnect: Callable[[], Awaitable[None]],
+        retry_delay: float = 1.0,
+        keepalive: float = 30.0
+    ):
+        self.dsn = dsn
+        self._on_message = on_message
+        self._on_reconnect = on_reconnect
+        self.retry_delay = retry_delay
+        self.keepalive = keepalive
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        await self._on_message(payload)
+
+    async def _run(self) -> None:
+        # Set whenever notifications may have been missed
+        missed = False
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Cache invalidation listener cannot connect: %r", e)
+                missed = True
+                await asyncio.sleep(self.retry_delay)
+                continue
+            try:
+                await connection.add_listener(INVALIDATION_CHANNEL, self._notify)
+                if missed:
+                    await self._on_reconnect()
+                    missed = False
+                # Termination is not always reported (e.g. a silently dropped link),
+                # so the connection is also probed periodically
+                while True:
+                    await asyncio.sleep(self.keepalive)
+                    await connection.fetchval("SELECT 1")
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                logger.warning("Cache invalidation listener disconnected: %r", e)
+                missed = True
+            finally:
+                if not connection.is_closed():
+                    await connection.close(timeout=self.retry_delay)
@@ -0,0 +1,136 @@
+import asyncio
+from typing import Any, List, Optional, Set, Union
+from urllib.parse import unquote, urlsplit
+
+# Failures that leave the connection unusable; the client reconnects on the next command
+CONNECTION_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+class RespError(Exception):
+    """Error reply sent by the server."""
+    pass
+
+def encode_command(*args: Union[str, bytes, int, float]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one RESP2 reply; error replies are raised as RespError."""
+    line = await reader.readuntil(b"\r\n")
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b"+":
+        return body.decode()
+    if prefix == b"-":
+        raise RespError(body.decode())
+    if prefix == b":":
+        return int(body)
+    if prefix == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RespError(f"Unexpected reply prefix: {prefix!r}")
+
+class RespConnection:
+    """One connection to the server, used by one command at a time."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, timeout: float):
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+
+    @classmethod
+    async def open(
+        cls, host: str, port: int, timeout: float, password: Optional[str] = None, db: int = 0
+    ) -> "RespConnection":
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        connection = cls(reader, writer, timeout)
+        try:
+            if password:
+                await connection.send("AUTH", password)
+            if db:
+                await connection.send("SELECT", db)
+        except BaseException:
+            connection.abort()
+            raise
+        return connection
+
+    async def send(self, *args: Union[str, bytes, int, float]) -> Any:
+        self.writer.write(encode_command(*args))
+        await self.writer.drain()
+        return await asyncio.wait_for(read_reply(self.reader), self.timeout)
+
+    def abort(self) -> None:
+        self.writer.close()
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except CONNECTION_ERRORS:
+            pass
+
+class RespClient:
+    """
+    Minimal client for servers speaking the Redis protocol (Redis, Valkey, KeyDB...).
+
+    Commands run on a pool of up to ``pool_size`` connections, one command per
+    connection at a time, so a slow reply does not hold up the lookups of other
+    requests. Connections are opened as needed and kept open; one that fails or
+    times out is dropped and replaced on a later command.
+    """
+
+    def __init__(self, url: str, timeout: float = 1.0, pool_size: int = 4):
+        parsed = urlsplit(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: List[RespConnection] = []
+        self._busy: Set[RespConnection] = set()
+
+    async def execute(self, *args: Union[str, bytes, int, float]) -> Any:
+        async with self._slots:
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                connection = await RespConnection.open(self.host, self.port, self.timeout, self.password, self.db)
+            self._busy.add(connection)
+            try:
+                reply = await connection.send(*args)
+            except RespError:
+                self._release(connection)
+                raise
+            except BaseException:
+                # A reply cut short by a timeout or a cancellation may still arrive and
+                # would be read as the answer to the next command, so the connection
+                # cannot be reused
+                self._busy.discard(connection)
+                connection.abort()
+                raise
+            self._release(connection)
+            return reply
+
+    def _release(self, connection: RespConnection) -> None:
+        if connection in self._busy:
+            self._busy.discard(connection)
+            self._idle.append(connection)
+
+    async def close(self) -> None:
+        """Close every connection; commands still running fail with a connection error."""
+        connections = self._idle + list(self._busy)
+        self._idle, self._busy = [], set()
+        for connection in connections:
+            await connection.close()
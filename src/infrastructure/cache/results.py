@@ -0,0 +1,95 @@
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.config import CACHE_REPLICA_LAG, LIST_CACHE_SIZE, LIST_CACHE_TTL
+
+class VersionedResultCache:
+    """
+    Query results cached per table and tagged with the table's version when loaded.
+
+    Every committed write to a table bumps its version, which makes all cached
+    results for that table stale. The first caller to find a stale entry reloads
+    it inline; callers arriving while that refresh runs get the stale result
+    instead of repeating the query (stale-while-revalidate). Cold misses are not
+    coalesced since there is nothing to serve in the meantime.
+
+    Results loaded from a replica within ``lag`` seconds of a write to their table are
+    returned but not stored: the replica may not have the write yet, and storing them
+    under the new version would serve the old data until the next write.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self, maxsize: int, ttl: Optional[float] = None, lag: float = 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._entries = LRUCache(maxsize=maxsize, ttl=ttl, clock=clock)
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._bumped_at: Dict[str, float] = {}
+        self._refreshing: Set[Hashable] = set()
+        self.lag = lag
+        self._clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def bump(self, table: str) -> None:
+        self._versions[table] += 1
+        self._bumped_at[table] = self._clock()
+
+    def bump_all(self) -> None:
+        for table in list(self._versions):
+            self.bump(table)
+
+    def _lagging(self, table: str) -> bool:
+        bumped_at = self._bumped_at.get(table)
+        return bumped_at is not None and self._clock() - bumped_at < self.lag
+
+    async def get_or_load(
+        self, table: str, key: Hashable, load: Callable[[], Awaitable[Any]], replica: bool = False
+    ) -> Any:
+        cache_key = (table, key)
+        version = self._versions[table]
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            entry_version, value = entry
+            if entry_version == version:
+                self.hits += 1
+                return value
+            if cache_key in self._refreshing:
+                self.stale_hits += 1
+                return value
+        self.misses += 1
+        self._refreshing.add(cache_key)
+        try:
+            value = await load()
+        finally:
+            self._refreshing.discard(cache_key)
+        if replica and self._lagging(table):
+            self.uncached += 1
+            return value
+        # Tagged with the version seen before loading: a write committed meanwhile
+        # leaves the entry stale rather than hiding the write
+        self._entries.set(cache_key, (version, value))
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self._entries.stats()
+        return {
+            "size": entries.size,
+            "maxsize": entries.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "evictions": entries.evictions,
+            "expirations": entries.expirations
+        }
+
+list_cache = VersionedResultCache(maxsize=LIST_CACHE_SIZE, ttl=LIST_CACHE_TTL, lag=CACHE_REPLICA_LAG)
@@ -1,5 +1,5 @@
-from typing import Generator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 from dotenv import load_dotenv
@@ -19,14 +19,134 @@ DATABASE_URL = os.getenv(
     f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
+# Optional comma-separated read replicas; query handlers are routed to them
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+# After a client writes, its reads stay on the primary for this many seconds
+DB_PRIMARY_STICKY_SECONDS = float(os.getenv("DB_PRIMARY_STICKY_SECONDS", "5"))
+
+# Row counts: "auto" counts exactly only when the planner expects at most this many rows
+COUNT_EXACT_THRESHOLD = int(os.getenv("COUNT_EXACT_THRESHOLD", "10000"))
+# Seconds a computed row count is reused for identical filters
+COUNT_CACHE_TTL = float(os.getenv("COUNT_CACHE_TTL", "30"))
+
+# Fuzzy text filters (pg_trgm) match rows at least this similar to the search text. The
+# trigram index prefilters at pg_trgm.similarity_threshold (0.3 by default), so lower
+# values only take effect when that setting is lowered too.
+TRIGRAM_SIMILARITY_THRESHOLD = float(os.getenv("TRIGRAM_SIMILARITY_THRESHOLD", "0.3"))
+
+# Soft-deleted rows are hard-deleted once older than PURGE_RETENTION_DAYS, in batches of
+# PURGE_BATCH_SIZE rows with PURGE_BATCH_PAUSE seconds between them, and only between
+# PURGE_WINDOW_START and PURGE_WINDOW_END (UTC, HH:MM; the window may span midnight)
+PURGE_ENABLED = os.getenv("PURGE_ENABLED", "True").lower() == "true"
+PURGE_RETENTION_DAYS = float(os.getenv("PURGE_RETENTION_DAYS", "30"))
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "500"))
+PURGE_BATCH_PAUSE = float(os.getenv("PURGE_BATCH_PAUSE", "0.5"))
+PURGE_WINDOW_START = os.getenv("PURGE_WINDOW_START", "01:00")
+PURGE_WINDOW_END = os.getenv("PURGE_WINDOW_END", "05:00")
+
+# requests and offers are partitioned by month of created_at. Partitions are created
+# PARTITION_PREMAKE_MONTHS ahead of the current month; partitions whose month ended more
+# than PARTITION_RETENTION_MONTHS ago are detached and dropped, rows and all (0 keeps them)
+PARTITION_MAINTENANCE_ENABLED = os.getenv("PARTITION_MAINTENANCE_ENABLED", "True").lower() == "true"
+PARTITION_PREMAKE_MONTHS = int(os.getenv("PARTITION_PREMAKE_MONTHS", "3"))
+PARTITION_RETENTION_MONTHS = int(os.getenv("PARTITION_RETENTION_MONTHS", "0"))
+
+# Equipment matching judges prices by offers made in this many past days
+MATCH_PRICE_HISTORY_DAYS = int(os.getenv("MATCH_PRICE_HISTORY_DAYS", "365"))
+
+# Read-through cache for get_by_id: seconds an entity is reused and the maximum number
+# of cached entities per table (0 disables caching for that table). Clients inside their
+# sticky window bypass the caches.
+ENTITY_CACHE_TTL = float(os.getenv("ENTITY_CACHE_TTL", "60"))
+ENTITY_CACHE_SIZES = {
+    "equipment": int(os.getenv("ENTITY_CACHE_SIZE_EQUIPMENT", "5000")),
+    "clients": int(os.getenv("ENTITY_CACHE_SIZE_CLIENTS", "2000")),
+    "users": int(os.getenv("ENTITY_CACHE_SIZE_USERS", "1000")),
+    "requests": int(os.getenv("ENTITY_CACHE_SIZE_REQUESTS", "1000")),
+    "offers": int(os.getenv("ENTITY_CACHE_SIZE_OFFERS", "1000")),
+}
+# "memory" keeps a cache per worker; "redis" shares one through a Redis-protocol server.
+# Either way, writes are broadcast to every worker with Postgres NOTIFY.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_REDIS_TIMEOUT = float(os.getenv("CACHE_REDIS_TIMEOUT", "0.5"))
+# Connections each worker keeps to the cache server
+CACHE_REDIS_POOL_SIZE = int(os.getenv("CACHE_REDIS_POOL_SIZE", "4"))
+
+# Seconds after a write during which what replicas return for the written rows (and
+# list results of their table) is not cached, since a lagging replica may still hold
+# the old version
+CACHE_REPLICA_LAG = float(os.getenv("CACHE_REPLICA_LAG", "30"))
+
+# List query results cached per worker until the table is written to
+LIST_CACHE_SIZE = int(os.getenv("LIST_CACHE_SIZE", "2000"))
+LIST_CACHE_TTL = float(os.getenv("LIST_CACHE_TTL", "30"))
+
+# Natural-language search (/search/nl): "rules" translates with keyword rules, "model"
+# asks a language model (a local stand-in until an endpoint is configured). Translations
+# are cached per worker by normalized text.
+NL_TRANSLATOR = os.getenv("NL_TRANSLATOR", "rules")
+NL_TRANSLATOR_TIMEOUT = float(os.getenv("NL_TRANSLATOR_TIMEOUT", "5"))
+NL_TRANSLATION_CACHE_SIZE = int(os.getenv("NL_TRANSLATION_CACHE_SIZE", "1000"))
+NL_TRANSLATION_CACHE_TTL = float(os.getenv("NL_TRANSLATION_CACHE_TTL", "3600"))
+
+# Semantic search: in-memory vector indexes over request and equipment text, one per
+# worker, built on first use and updated as rows are written. Rows written recently
+# are re-read for SEMANTIC_INDEX_RECHECK seconds in case a replica served them stale.
+SEMANTIC_ENCODER = os.getenv("SEMANTIC_ENCODER", "hashing")
+SEMANTIC_DIMENSIONS = int(os.getenv("SEMANTIC_DIMENSIONS", "256"))
+SEMANTIC_BUILD_BATCH_SIZE = int(os.getenv("SEMANTIC_BUILD_BATCH_SIZE", "2000"))
+SEMANTIC_INDEX_RECHECK = float(os.getenv("SEMANTIC_INDEX_RECHECK", "30"))
+# With SEMANTIC_SNAPSHOT_DIR set (a directory local to the host), indexes are saved there
+# and memory-mapped by every worker instead of built by each; changes go to a delta log
+# folded into a new snapshot every SEMANTIC_LOG_COMPACT_RECORDS records. Snapshots older
+# than SEMANTIC_SNAPSHOT_MAX_AGE seconds are rebuilt; keep it below PURGE_RETENTION_DAYS,
+# since rows purged since a snapshot can no longer be told apart from unchanged ones.
+SEMANTIC_SNAPSHOT_DIR = os.getenv("SEMANTIC_SNAPSHOT_DIR", "")
+SEMANTIC_SNAPSHOT_MAX_AGE = float(os.getenv("SEMANTIC_SNAPSHOT_MAX_AGE", "604800"))
+SEMANTIC_LOG_COMPACT_RECORDS = int(os.getenv("SEMANTIC_LOG_COMPACT_RECORDS", "50000"))
+
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
-# Create async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=DEBUG,
-    future=True
-)
+# Connection pool settings. Size them so that
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays below Postgres max_connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", "60"))
+# Set to 0 when running behind pgbouncer in transaction pooling mode
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+def create_database_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the configured pool settings."""
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args = {
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": DB_COMMAND_TIMEOUT,
+        }
+    return create_async_engine(
+        url,
+        echo=DEBUG,
+        future=True,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args
+    )
+
+# The single engine (and connection pool) shared by the whole application
+engine = create_database_engine(DATABASE_URL)
+
+# One engine per read replica, each with its own pool
+replica_engines = [create_database_engine(url) for url in DATABASE_REPLICA_URLS]
 
 # Create async session factory
 async_session = sessionmaker(
@@ -38,14 +158,3 @@ async_session = sessionmaker(
 
 # Create declarative base
 Base = declarative_base()
-
-async def get_session() -> Generator[AsyncSession, None, None]:
-    async with async_session() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close() 
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""partition requests and offers
+
+Revision ID: a7c3e9b5d2f8
+Revises: f1d6b8e3a5c2
+Create Date: 2025-06-18 09:41:52.318604
+
+Rebuilds requests and offers as tables partitioned by month of created_at, so list
+queries with a created_at window only scan the months they need, each partition is
+vacuumed and indexed on its own, and old months can be dropped whole instead of
+deleted row by row.
+
+Postgres cannot partition an existing table in place: each table is copied into a
+new partitioned one, which is then renamed. Both tables are locked for the whole
+copy, so run this during a maintenance window. Indexes on partitioned tables cannot
+be built concurrently.
+
+The primary key becomes (id, created_at), since it must contain the partition key,
+and ids keep coming from the same sequence. No foreign key can reference requests
+any more, so offers.request_id loses its constraint; the application checks that
+an offer's request exists instead. Monthly partitions are created from the oldest
+row to PREMAKE_MONTHS ahead, plus a DEFAULT partition; PartitionMaintainer creates
+the following months.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9b5d2f8'
+down_revision: Union[str, None] = 'f1d6b8e3a5c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_MONTHS = 3
+
+# The generated search_vector column is copied by LIKE ... INCLUDING GENERATED and
+# computed again on insert, so it is not listed
+COLUMNS = {
+    'requests': [
+        'id', 'title', 'description', 'client_id', 'equipment_category', 'required_specifications',
+        'quantity', 'priority', 'status', 'budget_min', 'budget_max', 'currency', 'desired_delivery_date',
+        'notes', 'tags', 'created_at', 'updated_at', 'is_active', 'deleted_at',
+    ],
+    'offers': [
+        'id', 'request_id', 'equipment_id', 'price', 'currency', 'quantity', 'delivery_date',
+        'warranty_period_months', 'status', 'terms_and_conditions', 'notes', 'additional_services',
+        'discount_percentage', 'payment_terms', 'custom_payment_terms', 'created_at', 'updated_at',
+        'is_active', 'deleted_at',
+    ],
+}
+
+# table -> [(column, referenced table)], foreign keys that survive partitioning
+FOREIGN_KEYS = {
+    'requests': [('client_id', 'clients')],
+    'offers': [('equipment_id', 'equipment')],
+}
+
+LIVE = 'deleted_at IS NULL'
+ACTIVE = 'is_active AND deleted_at IS NULL'
+
+# (name, table, columns, index options, predicate)
+INDEXES = [
+    ('ix_requests_client_id_id', 'requests', ['client_id', 'id'], {}, None),
+    ('ix_requests_status_id', 'requests', ['status', 'id'], {}, LIVE),
+    ('ix_requests_equipment_category_id', 'requests', ['equipment_category', 'id'], {}, LIVE),
+    ('ix_requests_priority_id', 'requests', ['priority', 'id'], {}, LIVE),
+    ('ix_requests_budget_min', 'requests', ['budget_min'], {}, LIVE),
+    ('ix_requests_budget_max', 'requests', ['budget_max'], {}, LIVE),
+    ('ix_requests_active_status_id', 'requests', ['status', 'id'], {}, ACTIVE),
+    ('ix_requests_required_specifications_gin', 'requests', ['required_specifications'],
+     {'postgresql_using': 'gin'}, LIVE),
+    ('ix_requests_tags_gin', 'requests', ['tags'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'tags': 'jsonb_path_ops'}}, LIVE),
+    ('ix_requests_search_vector', 'requests', ['search_vector'], {'postgresql_using': 'gin'}, LIVE),
+    ('ix_requests_deleted_at', 'requests', ['deleted_at'], {}, 'deleted_at IS NOT NULL'),
+    ('ix_offers_request_id_id', 'offers', ['request_id', 'id'], {}, None),
+    ('ix_offers_equipment_id_id', 'offers', ['equipment_id', 'id'], {}, None),
+    ('ix_offers_status_id', 'offers', ['status', 'id'], {}, LIVE),
+    ('ix_offers_price', 'offers', ['price'], {}, LIVE),
+    ('ix_offers_active_status_id', 'offers', ['status', 'id'], {}, ACTIVE),
+    ('ix_offers_additional_services_gin', 'offers', ['additional_services'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'additional_services': 'jsonb_path_ops'}}, LIVE),
+    ('ix_offers_deleted_at', 'offers', ['deleted_at'], {}, 'deleted_at IS NOT NULL'),
+]
+
+
+def create_monthly_partitions(table, parent) -> None:
+    """Partitions of ``parent`` for every month from the oldest row of ``table`` on."""
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', first_row),
+                    date_trunc('month', now() AT TIME ZONE 'utc') + interval '{PREMAKE_MONTHS} months',
+                    interval '1 month'
+                )::date
+                FROM (
+                    SELECT coalesce(min(coalesce(created_at, updated_at)), now() AT TIME ZONE 'utc') AS first_row
+                    FROM {table}
+                ) bounds
+            LOOP
+                EXECUTE 'CREATE TABLE ' || quote_ident('{table}_' || to_char(month, 'YYYY_MM'))
+                    || ' PARTITION OF {parent} FOR VALUES FROM (' || quote_literal(month)
+                    || ') TO (' || quote_literal((month + interval '1 month')::date) || ')';
+            END LOOP;
+        END
+        $$
+    """)
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {parent} DEFAULT')
+
+
+def rebuild(table, partitioned) -> None:
+    """Copy ``table`` into a new (partitioned or plain) table of the same name."""
+    new = f'{table}_rebuild'
+    columns = ', '.join(COLUMNS[table])
+    values = columns
+    # The DROP TABLE below would otherwise take the id sequence with it
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY NONE')
+    if partitioned:
+        op.execute(
+            f'CREATE TABLE {new} (LIKE {table} INCLUDING DEFAULTS INCLUDING GENERATED) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        create_monthly_partitions(table, new)
+        values = columns.replace(
+            'created_at', "coalesce(created_at, updated_at, now() AT TIME ZONE 'utc')"
+        )
+    else:
+        op.execute(f'CREATE TABLE {new} (LIKE {table} INCLUDING DEFAULTS INCLUDING GENERATED)')
+        op.alter_column(new, 'created_at', nullable=True)
+    op.execute(f'INSERT INTO {new} ({columns}) SELECT {values} FROM {table}')
+    op.drop_table(table)
+    op.rename_table(new, table)
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+
+    op.create_primary_key(f'{table}_pkey', table, ['id', 'created_at'] if partitioned else ['id'])
+    for column, referenced in FOREIGN_KEYS[table]:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referenced, [column], ['id'])
+    for name, index_table, index_columns, options, predicate in INDEXES:
+        if index_table == table:
+            op.create_index(
+                name, table, index_columns,
+                postgresql_where=sa.text(predicate) if predicate else None,
+                **options
+            )
+    if not partitioned:
+        op.create_index(f'ix_{table}_id', table, ['id'])
+    op.execute(f'ANALYZE {table}')
+
+
+def upgrade() -> None:
+    op.drop_constraint('offers_request_id_fkey', 'offers', type_='foreignkey')
+    for table in COLUMNS:
+        rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    for table in reversed(list(COLUMNS)):
+        rebuild(table, partitioned=False)
+    op.create_foreign_key('offers_request_id_fkey', 'offers', 'requests', ['request_id'], ['id'])
@@ -0,0 +1,45 @@
+"""equipment spec values
+
+Revision ID: b4e8d2f6a9c1
+Revises: a7c3e9b5d2f8
+Create Date: 2025-06-24 10:12:07.583114
+
+Adds equipment_spec_values, the numeric equipment specifications in canonical units
+("1.5kW" is stored as 1500 W), so range filters and request constraints can use an
+index instead of parsing JSON strings. The application keeps it in step with
+equipment.specifications on every write. Existing equipment is normalized by
+scripts/backfill_spec_values.py, in batches, after upgrading; until then range
+filters don't match it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8d2f6a9c1'
+down_revision: Union[str, None] = 'a7c3e9b5d2f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'equipment_spec_values',
+        sa.Column('equipment_id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('value', sa.Float(), nullable=False),
+        sa.Column('unit', sa.String(length=10), nullable=False),
+        sa.ForeignKeyConstraint(['equipment_id'], ['equipment.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('equipment_id', 'key'),
+    )
+    op.create_index(
+        'ix_equipment_spec_values_key_unit_value', 'equipment_spec_values',
+        ['key', 'unit', 'value', 'equipment_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_equipment_spec_values_key_unit_value', table_name='equipment_spec_values')
+    op.drop_table('equipment_spec_values')
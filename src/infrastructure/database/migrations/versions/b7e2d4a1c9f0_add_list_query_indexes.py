@@ -0,0 +1,66 @@
+"""add list query indexes
+
+Revision ID: b7e2d4a1c9f0
+Revises: f5b4c9293d39
+Create Date: 2025-05-12 10:02:41.318204
+
+Indexes are built with CREATE INDEX CONCURRENTLY, which cannot run inside a
+transaction, so every statement runs in an autocommit block. Writes keep flowing
+while the indexes build. If a build fails it leaves an INVALID index behind;
+rerunning the migration drops and rebuilds it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a1c9f0'
+down_revision: Union[str, None] = 'f5b4c9293d39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("is_active")
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    # Foreign keys, also serving "filter by parent, page by id"
+    ('ix_requests_client_id_id', 'requests', ['client_id', 'id'], None),
+    ('ix_offers_request_id_id', 'offers', ['request_id', 'id'], None),
+    ('ix_offers_equipment_id_id', 'offers', ['equipment_id', 'id'], None),
+    # Equality filters of the list queries, followed by the keyset sort column
+    ('ix_requests_status_id', 'requests', ['status', 'id'], None),
+    ('ix_requests_equipment_category_id', 'requests', ['equipment_category', 'id'], None),
+    ('ix_requests_priority_id', 'requests', ['priority', 'id'], None),
+    ('ix_offers_status_id', 'offers', ['status', 'id'], None),
+    ('ix_equipment_category_id', 'equipment', ['category', 'id'], None),
+    ('ix_equipment_status_id', 'equipment', ['status', 'id'], None),
+    ('ix_equipment_manufacturer_id', 'equipment', ['manufacturer', 'id'], None),
+    ('ix_users_role_id', 'users', ['role', 'id'], None),
+    # Range filters
+    ('ix_requests_budget_min', 'requests', ['budget_min'], None),
+    ('ix_requests_budget_max', 'requests', ['budget_max'], None),
+    ('ix_offers_price', 'offers', ['price'], None),
+    # Dashboards listing active rows only
+    ('ix_requests_active_status_id', 'requests', ['status', 'id'], ACTIVE),
+    ('ix_offers_active_status_id', 'offers', ['status', 'id'], ACTIVE),
+    ('ix_equipment_active_category_id', 'equipment', ['category', 'id'], ACTIVE),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                postgresql_where=where
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
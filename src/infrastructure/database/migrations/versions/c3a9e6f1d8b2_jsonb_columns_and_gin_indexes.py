@@ -0,0 +1,81 @@
+"""jsonb columns and gin indexes
+
+Revision ID: c3a9e6f1d8b2
+Revises: b7e2d4a1c9f0
+Create Date: 2025-05-19 09:41:07.552180
+
+Converting a column from JSON to JSONB rewrites its table under an ACCESS
+EXCLUSIVE lock, so run this during a maintenance window on large tables. The GIN
+indexes are built afterwards with CREATE INDEX CONCURRENTLY, as in b7e2d4a1c9f0.
+
+Columns that are only filtered by containment (@>) use the smaller
+jsonb_path_ops operator class; specifications also need key existence (?, ?&),
+which only the default jsonb_ops supports.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e6f1d8b2'
+down_revision: Union[str, None] = 'b7e2d4a1c9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ('clients', 'tags'),
+    ('equipment', 'specifications'),
+    ('equipment', 'tags'),
+    ('requests', 'required_specifications'),
+    ('requests', 'tags'),
+    ('offers', 'additional_services'),
+]
+
+# (name, table, column, operator class or None for jsonb_ops)
+INDEXES = [
+    ('ix_clients_tags_gin', 'clients', 'tags', 'jsonb_path_ops'),
+    ('ix_equipment_specifications_gin', 'equipment', 'specifications', None),
+    ('ix_equipment_tags_gin', 'equipment', 'tags', 'jsonb_path_ops'),
+    ('ix_requests_required_specifications_gin', 'requests', 'required_specifications', None),
+    ('ix_requests_tags_gin', 'requests', 'tags', 'jsonb_path_ops'),
+    ('ix_offers_additional_services_gin', 'offers', 'additional_services', 'jsonb_path_ops'),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    with op.get_context().autocommit_block():
+        for name, table, column, ops in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name, table, [column],
+                postgresql_using='gin',
+                postgresql_ops={column: ops} if ops else {},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table, column in reversed(COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json'
+        )
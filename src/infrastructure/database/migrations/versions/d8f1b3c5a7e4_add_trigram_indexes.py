@@ -0,0 +1,56 @@
+"""add trigram indexes
+
+Revision ID: d8f1b3c5a7e4
+Revises: c3a9e6f1d8b2
+Create Date: 2025-05-26 14:12:55.904317
+
+GIN trigram indexes (pg_trgm) for the text filters of the list endpoints. They serve
+ILIKE '%text%' substring filters, which a btree index cannot, and the fuzzy
+similarity (%) filters. Creating the extension needs a role allowed to do so; on
+managed databases it may have to be enabled beforehand. The indexes are built
+concurrently, as in b7e2d4a1c9f0.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f1b3c5a7e4'
+down_revision: Union[str, None] = 'c3a9e6f1d8b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column)
+COLUMNS = [
+    ('users', 'username'),
+    ('users', 'email'),
+    ('clients', 'name'),
+    ('clients', 'email'),
+    ('clients', 'company_name'),
+    ('equipment', 'name'),
+    ('equipment', 'model'),
+    ('equipment', 'manufacturer'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        for table, column in COLUMNS:
+            name = f'ix_{table}_{column}_trgm'
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name, table, [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        for table, column in reversed(COLUMNS):
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,65 @@
+"""add search vectors
+
+Revision ID: e2c7a9d4f6b1
+Revises: d8f1b3c5a7e4
+Create Date: 2025-06-02 11:27:19.640823
+
+Adds a generated tsvector column, search_vector, to requests, equipment and clients
+for full-text search, with a GIN index on each. Adding a stored generated column
+rewrites the table under an ACCESS EXCLUSIVE lock, so run this during a maintenance
+window on large tables. The indexes are built concurrently, as in b7e2d4a1c9f0.
+
+The expressions must stay in sync with search_weights and TEXT_SEARCH_CONFIG in
+the models.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c7a9d4f6b1'
+down_revision: Union[str, None] = 'd8f1b3c5a7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (column, weight)
+DOCUMENTS = {
+    'requests': [('title', 'A'), ('description', 'B'), ('notes', 'C')],
+    'equipment': [('name', 'A'), ('model', 'A'), ('manufacturer', 'B')],
+    'clients': [('name', 'A'), ('company_name', 'A'), ('notes', 'C')],
+}
+
+
+def vector_expression(columns) -> str:
+    return ' || '.join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+def upgrade() -> None:
+    for table, columns in DOCUMENTS.items():
+        op.execute(
+            f'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector '
+            f'GENERATED ALWAYS AS ({vector_expression(columns)}) STORED'
+        )
+
+    with op.get_context().autocommit_block():
+        for table in DOCUMENTS:
+            name = f'ix_{table}_search_vector'
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name, table, ['search_vector'],
+                postgresql_using='gin',
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(list(DOCUMENTS)):
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table in reversed(list(DOCUMENTS)):
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,122 @@
+"""soft delete
+
+Revision ID: f1d6b8e3a5c2
+Revises: e2c7a9d4f6b1
+Create Date: 2025-06-10 08:54:31.207716
+
+Adds deleted_at to every table and makes the secondary indexes partial on live rows
+(deleted_at IS NULL), which every read is scoped to. Unique indexes become unique
+among live rows, so a deleted row's email or serial number can be used again.
+Foreign key indexes stay complete: parent deletes and the purger must see every
+child row.
+
+Each index is rebuilt under a temporary name with CREATE INDEX CONCURRENTLY, then
+the old one is dropped and the new one renamed, so no query runs without an index.
+Downgrading fails if deleted rows share a key that must be unique again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d6b8e3a5c2'
+down_revision: Union[str, None] = 'e2c7a9d4f6b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['users', 'clients', 'equipment', 'requests', 'offers']
+
+LIVE = 'deleted_at IS NULL'
+ACTIVE = 'is_active'
+
+# (name, table, columns, index options, predicate before this revision)
+INDEXES = [
+    ('ix_users_username', 'users', ['username'], {'unique': True}, None),
+    ('ix_users_email', 'users', ['email'], {'unique': True}, None),
+    ('ix_clients_email', 'clients', ['email'], {'unique': True}, None),
+    ('ix_equipment_serial_number', 'equipment', ['serial_number'], {'unique': True}, None),
+    ('ix_requests_status_id', 'requests', ['status', 'id'], {}, None),
+    ('ix_requests_equipment_category_id', 'requests', ['equipment_category', 'id'], {}, None),
+    ('ix_requests_priority_id', 'requests', ['priority', 'id'], {}, None),
+    ('ix_requests_budget_min', 'requests', ['budget_min'], {}, None),
+    ('ix_requests_budget_max', 'requests', ['budget_max'], {}, None),
+    ('ix_requests_active_status_id', 'requests', ['status', 'id'], {}, ACTIVE),
+    ('ix_offers_status_id', 'offers', ['status', 'id'], {}, None),
+    ('ix_offers_price', 'offers', ['price'], {}, None),
+    ('ix_offers_active_status_id', 'offers', ['status', 'id'], {}, ACTIVE),
+    ('ix_equipment_category_id', 'equipment', ['category', 'id'], {}, None),
+    ('ix_equipment_status_id', 'equipment', ['status', 'id'], {}, None),
+    ('ix_equipment_manufacturer_id', 'equipment', ['manufacturer', 'id'], {}, None),
+    ('ix_equipment_active_category_id', 'equipment', ['category', 'id'], {}, ACTIVE),
+    ('ix_users_role_id', 'users', ['role', 'id'], {}, None),
+    # JSONB
+    ('ix_clients_tags_gin', 'clients', ['tags'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'tags': 'jsonb_path_ops'}}, None),
+    ('ix_equipment_specifications_gin', 'equipment', ['specifications'], {'postgresql_using': 'gin'}, None),
+    ('ix_equipment_tags_gin', 'equipment', ['tags'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'tags': 'jsonb_path_ops'}}, None),
+    ('ix_requests_required_specifications_gin', 'requests', ['required_specifications'],
+     {'postgresql_using': 'gin'}, None),
+    ('ix_requests_tags_gin', 'requests', ['tags'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'tags': 'jsonb_path_ops'}}, None),
+    ('ix_offers_additional_services_gin', 'offers', ['additional_services'],
+     {'postgresql_using': 'gin', 'postgresql_ops': {'additional_services': 'jsonb_path_ops'}}, None),
+    # Full-text search
+    ('ix_requests_search_vector', 'requests', ['search_vector'], {'postgresql_using': 'gin'}, None),
+    ('ix_equipment_search_vector', 'equipment', ['search_vector'], {'postgresql_using': 'gin'}, None),
+    ('ix_clients_search_vector', 'clients', ['search_vector'], {'postgresql_using': 'gin'}, None),
+] + [
+    # Trigram
+    (f'ix_{table}_{column}_trgm', table, [column],
+     {'postgresql_using': 'gin', 'postgresql_ops': {column: 'gin_trgm_ops'}}, None)
+    for table, column in [
+        ('users', 'username'), ('users', 'email'), ('clients', 'name'), ('clients', 'email'),
+        ('clients', 'company_name'), ('equipment', 'name'), ('equipment', 'model'), ('equipment', 'manufacturer'),
+    ]
+]
+
+
+def live(predicate):
+    return f'{predicate} AND {LIVE}' if predicate else LIVE
+
+
+def rebuild(name, table, columns, options, predicate) -> None:
+    temporary = f'{name}_rebuild'
+    op.drop_index(temporary, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.create_index(
+        temporary, table, columns,
+        postgresql_where=sa.text(predicate) if predicate else None,
+        postgresql_concurrently=True,
+        **options
+    )
+    op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.execute(f'ALTER INDEX {temporary} RENAME TO {name}')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, options, predicate in INDEXES:
+            rebuild(name, table, columns, options, live(predicate))
+        for table in TABLES:
+            op.drop_index(f'ix_{table}_deleted_at', table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                f'ix_{table}_deleted_at', table, ['deleted_at'],
+                postgresql_where=sa.text('deleted_at IS NOT NULL'),
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(f'ix_{table}_deleted_at', table_name=table, postgresql_concurrently=True, if_exists=True)
+        for name, table, columns, options, predicate in reversed(INDEXES):
+            rebuild(name, table, columns, options, predicate)
+
+    for table in reversed(TABLES):
+        op.drop_column(table, 'deleted_at')
@@ -1,8 +1,22 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, JSON, ForeignKey, Numeric
-from sqlalchemy.orm import relationship
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
+from sqlalchemy import (
+    DDL, event, MetaData, Table, Column, Integer, String, DateTime, Boolean, Float, JSON, ForeignKey, Numeric,
+    Index, PrimaryKeyConstraint, Sequence, text
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declared_attr, relationship
+from sqlalchemy.schema import sort_tables
 from .config import Base
 
+# JSONB on Postgres (indexable, supports containment), plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Text search configuration of the generated search_vector columns. Changing it needs
+# a migration that recreates the columns.
+TEXT_SEARCH_CONFIG = "english"
+
 class BaseModel(Base):
     __abstract__ = True
     
@@ -10,12 +24,81 @@ class BaseModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # Set by soft deletes; such rows are invisible to every read and purged later
+    deleted_at = Column(DateTime, nullable=True)
+
+# Secondary indexes lead with the filtered column and end with id, matching the list
+# queries' keyset paging (WHERE <filter> AND id > :after_id ORDER BY id LIMIT n).
+# They are partial on live rows, which every read is scoped to, so soft-deleted rows
+# don't bloat them. Foreign key indexes cover all rows: deleting a parent, and the
+# purger's check for remaining children, must find soft-deleted children too.
+LIVE = text("deleted_at IS NULL")
+ACTIVE = text("is_active AND deleted_at IS NULL")
+
+def trigram_index(table: str, column: str) -> Index:
+    """GIN trigram index serving ILIKE '%text%' and fuzzy (%) matches; needs pg_trgm."""
+    return Index(
+        f"ix_{table}_{column}_trgm", column,
+        postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}, postgresql_where=LIVE
+    )
+
+def unique_live_index(table: str, column: str) -> Index:
+    """Uniqueness among live rows only, so a deleted row's key can be reused."""
+    return Index(f"ix_{table}_{column}", column, unique=True, postgresql_where=LIVE, sqlite_where=LIVE)
+
+def purge_index(table: str) -> Index:
+    """Small index over soft-deleted rows, for the purger."""
+    return Index(f"ix_{table}_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL"))
+
+class PartitionedModel(BaseModel):
+    """
+    A table partitioned by month of created_at on Postgres (see PartitionMaintainer).
+
+    Postgres requires the partition key in the primary key, so it is (id, created_at);
+    ids still come from the table's own sequence and stay unique. No foreign key can
+    point at such a table, so references to it are declared with ``references`` in
+    the column info instead and enforced by the application.
+    """
+    __abstract__ = True
+
+    @declared_attr
+    def id(cls):
+        return Column(Integer, Sequence(f"{cls.__tablename__}_id_seq"), primary_key=True)
+
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+
+    @declared_attr
+    def __table_args__(cls):
+        # id first, so lookups by id alone can still use the primary key index
+        return (
+            PrimaryKeyConstraint("id", "created_at"),
+            *cls.indexes,
+            {"postgresql_partition_by": "RANGE (created_at)"}
+        )
+
+def add_default_partition(model) -> None:
+    """
+    Give a table created from the models (tests, benchmarks) a DEFAULT partition, so
+    rows can be inserted before any monthly partition exists.
+    """
+    event.listen(
+        model.__table__, "after_create",
+        DDL("CREATE TABLE %(fullname)s_default PARTITION OF %(fullname)s DEFAULT").execute_if(dialect="postgresql")
+    )
 
 class User(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id", postgresql_where=LIVE),
+        trigram_index("users", "username"),
+        trigram_index("users", "email"),
+        unique_live_index("users", "username"),
+        unique_live_index("users", "email"),
+        purge_index("users"),
+    )
     
-    username = Column(String(50), unique=True, index=True, nullable=False)
-    email = Column(String(100), unique=True, index=True, nullable=False)
+    username = Column(String(50), nullable=False)
+    email = Column(String(100), nullable=False)
     full_name = Column(String(100), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     role = Column(String(20), nullable=False)
@@ -23,39 +106,113 @@ class User(BaseModel):
 
 class Client(BaseModel):
     __tablename__ = "clients"
+    __table_args__ = (
+        Index(
+            "ix_clients_tags_gin", "tags",
+            postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}, postgresql_where=LIVE
+        ),
+        trigram_index("clients", "name"),
+        trigram_index("clients", "email"),
+        trigram_index("clients", "company_name"),
+        unique_live_index("clients", "email"),
+        purge_index("clients"),
+    )
     
     name = Column(String(100), nullable=False)
-    email = Column(String(100), unique=True, index=True, nullable=False)
+    email = Column(String(100), nullable=False)
     phone_number = Column(String(20), nullable=True)
     address = Column(String(255), nullable=True)
     company_name = Column(String(100), nullable=True)
     contact_person = Column(String(100), nullable=True)
     notes = Column(String(1000), nullable=True)
-    tags = Column(JSON, nullable=True)
+    tags = Column(JSONType, nullable=True)
+
+    # Columns of the full-text search document and their weights (see add_search_vector)
+    search_weights = {"name": "A", "company_name": "A", "notes": "C"}
 
 class Equipment(BaseModel):
     __tablename__ = "equipment"
+    __table_args__ = (
+        Index("ix_equipment_category_id", "category", "id", postgresql_where=LIVE),
+        Index("ix_equipment_status_id", "status", "id", postgresql_where=LIVE),
+        Index("ix_equipment_manufacturer_id", "manufacturer", "id", postgresql_where=LIVE),
+        Index("ix_equipment_active_category_id", "category", "id", postgresql_where=ACTIVE),
+        Index(
+            "ix_equipment_specifications_gin", "specifications",
+            postgresql_using="gin", postgresql_where=LIVE
+        ),
+        Index(
+            "ix_equipment_tags_gin", "tags",
+            postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}, postgresql_where=LIVE
+        ),
+        trigram_index("equipment", "name"),
+        trigram_index("equipment", "model"),
+        trigram_index("equipment", "manufacturer"),
+        unique_live_index("equipment", "serial_number"),
+        purge_index("equipment"),
+    )
     
     name = Column(String(100), nullable=False)
     model = Column(String(100), nullable=False)
-    serial_number = Column(String(100), unique=True, index=True, nullable=False)
+    serial_number = Column(String(100), nullable=False)
     manufacturer = Column(String(100), nullable=False)
     category = Column(String(20), nullable=False)
     status = Column(String(20), nullable=False)
     purchase_date = Column(DateTime, nullable=True)
     warranty_end_date = Column(DateTime, nullable=True)
     location = Column(String(255), nullable=True)
-    specifications = Column(JSON, nullable=True)
-    tags = Column(JSON, nullable=True)
+    specifications = Column(JSONType, nullable=True)
+    tags = Column(JSONType, nullable=True)
+
+    search_weights = {"name": "A", "model": "A", "manufacturer": "B"}
+    # Columns whose text is embedded for semantic search
+    semantic_fields = ("name", "model", "manufacturer", "category", "specifications")
+
+class EquipmentSpecValue(Base):
+    """
+    Numeric equipment specifications in canonical units (see spec_values), one row per
+    key, rewritten with the specifications on every write. Range filters and request
+    constraints compare these instead of parsing the JSON strings. Rows have no
+    deleted_at of their own: they belong to their equipment and go with it.
+    """
+    __tablename__ = "equipment_spec_values"
+    __table_args__ = (
+        # Range scans over one key, returning the equipment ids from the index alone
+        Index("ix_equipment_spec_values_key_unit_value", "key", "unit", "value", "equipment_id"),
+    )
 
-class Request(BaseModel):
+    equipment_id = Column(Integer, ForeignKey("equipment.id", ondelete="CASCADE"), primary_key=True)
+    # Longer keys are not normalized (specifications.MAX_KEY_LENGTH)
+    key = Column(String(100), primary_key=True)
+    value = Column(Float, nullable=False)
+    unit = Column(String(10), nullable=False)
+
+class Request(PartitionedModel):
     __tablename__ = "requests"
+    indexes = (
+        Index("ix_requests_client_id_id", "client_id", "id"),
+        Index("ix_requests_status_id", "status", "id", postgresql_where=LIVE),
+        Index("ix_requests_equipment_category_id", "equipment_category", "id", postgresql_where=LIVE),
+        Index("ix_requests_priority_id", "priority", "id", postgresql_where=LIVE),
+        Index("ix_requests_budget_min", "budget_min", postgresql_where=LIVE),
+        Index("ix_requests_budget_max", "budget_max", postgresql_where=LIVE),
+        Index("ix_requests_active_status_id", "status", "id", postgresql_where=ACTIVE),
+        Index(
+            "ix_requests_required_specifications_gin", "required_specifications",
+            postgresql_using="gin", postgresql_where=LIVE
+        ),
+        Index(
+            "ix_requests_tags_gin", "tags",
+            postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}, postgresql_where=LIVE
+        ),
+        purge_index("requests"),
+    )
     
     title = Column(String(200), nullable=False)
     description = Column(String(2000), nullable=False)
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=False)
     equipment_category = Column(String(20), nullable=False)
-    required_specifications = Column(JSON, nullable=True)
+    required_specifications = Column(JSONType, nullable=True)
     quantity = Column(Integer, nullable=False)
     priority = Column(String(20), nullable=False)
     status = Column(String(20), nullable=False)
@@ -64,14 +221,29 @@ class Request(BaseModel):
     currency = Column(String(3), nullable=False)
     desired_delivery_date = Column(DateTime, nullable=True)
     notes = Column(String(1000), nullable=True)
-    tags = Column(JSON, nullable=True)
+    tags = Column(JSONType, nullable=True)
+
+    search_weights = {"title": "A", "description": "B", "notes": "C"}
+    semantic_fields = ("title", "description", "equipment_category", "required_specifications", "notes")
     
     client = relationship("Client", backref="requests")
 
-class Offer(BaseModel):
+class Offer(PartitionedModel):
     __tablename__ = "offers"
+    indexes = (
+        Index("ix_offers_request_id_id", "request_id", "id"),
+        Index("ix_offers_equipment_id_id", "equipment_id", "id"),
+        Index("ix_offers_status_id", "status", "id", postgresql_where=LIVE),
+        Index("ix_offers_price", "price", postgresql_where=LIVE),
+        Index("ix_offers_active_status_id", "status", "id", postgresql_where=ACTIVE),
+        Index(
+            "ix_offers_additional_services_gin", "additional_services",
+            postgresql_using="gin", postgresql_ops={"additional_services": "jsonb_path_ops"}, postgresql_where=LIVE
+        ),
+        purge_index("offers"),
+    )
     
-    request_id = Column(Integer, ForeignKey("requests.id"), nullable=False)
+    request_id = Column(Integer, nullable=False, info={"references": "requests.id"})
     equipment_id = Column(Integer, ForeignKey("equipment.id"), nullable=False)
     price = Column(Numeric(12, 2), nullable=False)
     currency = Column(String(3), nullable=False)
@@ -81,10 +253,72 @@ class Offer(BaseModel):
     status = Column(String(20), nullable=False)
     terms_and_conditions = Column(String(2000), nullable=True)
     notes = Column(String(1000), nullable=True)
-    additional_services = Column(JSON, nullable=True)
+    additional_services = Column(JSONType, nullable=True)
     discount_percentage = Column(Float, nullable=True)
     payment_terms = Column(String(20), nullable=False)
     custom_payment_terms = Column(String(255), nullable=True)
     
-    request = relationship("Request", backref="offers")
-    equipment = relationship("Equipment", backref="offers") 
\ No newline at end of file
+    request = relationship("Request", primaryjoin="foreign(Offer.request_id) == Request.id", backref="offers")
+    equipment = relationship("Equipment", backref="offers") 
+
+def search_vector_expression(weights: Dict[str, str]) -> str:
+    """SQL of a weighted tsvector over the given columns."""
+    return " || ".join(
+        f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weights.items()
+    )
+
+def add_search_vector(model) -> None:
+    """
+    Give a Postgres table a generated ``search_vector`` column with a GIN index.
+    The column is not mapped, so it is never loaded with the entities, and other
+    databases (sqlite in tests) don't get it at all.
+    """
+    table = model.__table__
+    expression = search_vector_expression(model.search_weights)
+    for statement in (
+        f"ALTER TABLE %(fullname)s ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({expression}) STORED",
+        f"CREATE INDEX ix_{table.name}_search_vector ON %(fullname)s USING gin (search_vector) WHERE deleted_at IS NULL",
+    ):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+for searchable in (Client, Equipment, Request):
+    add_search_vector(searchable)
+
+for partitioned in (Request, Offer):
+    add_default_partition(partitioned)
+
+def references(table: Table) -> Iterator[Tuple[Column, Column]]:
+    """(column, referenced column) pairs of a table: foreign keys and ``references`` infos."""
+    for foreign_key in table.foreign_keys:
+        yield foreign_key.parent, foreign_key.column
+    for column in table.columns:
+        target = column.info.get("references")
+        if target:
+            name, _, referenced = target.partition(".")
+            yield column, table.metadata.tables[name].c[referenced]
+
+@lru_cache(maxsize=None)
+def referencing_columns(table: Table) -> Tuple[Column, ...]:
+    """
+    Columns of other soft-deletable tables that reference ``table``, with or without a
+    foreign key. Rows of tables without deleted_at are removed with their parent by
+    ON DELETE CASCADE instead.
+    """
+    return tuple(
+        column
+        for other in table.metadata.sorted_tables
+        if "deleted_at" in other.c
+        for column, referenced in references(other)
+        if referenced.table is table
+    )
+
+def dependency_sorted_tables(metadata: MetaData) -> List[Table]:
+    """Like ``metadata.sorted_tables`` (parents first), counting references without a foreign key."""
+    tables = list(metadata.tables.values())
+    return sort_tables(tables, extra_dependencies=[
+        (referenced.table, column.table)
+        for table in tables
+        for column, referenced in references(table)
+        if referenced.table is not table
+    ])
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Column, Table, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from src.infrastructure.database.models import PartitionedModel, dependency_sorted_tables, references
+
+logger = logging.getLogger(__name__)
+
+def partitioned_tables() -> List[Table]:
+    """Tables partitioned by month of created_at on Postgres."""
+    return [model.__table__ for model in PartitionedModel.__subclasses__()]
+
+def dependent_columns(table: Table) -> List[Tuple[Column, Column]]:
+    """(column, referenced column) pairs of other tables pointing at ``table``, with or without a foreign key."""
+    return [
+        (column, referenced)
+        for other in table.metadata.sorted_tables
+        if other is not table
+        for column, referenced in references(other)
+        if referenced.table is table
+    ]
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_{month:%Y_%m}"
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """Month of a partition named by partition_name; None for others (the DEFAULT one)."""
+    prefix = f"{table}_"
+    if not name.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(name[len(prefix):], "%Y_%m").date()
+    except ValueError:
+        return None
+
+class PartitionMaintainer:
+    """
+    Keeps the monthly partitions of the tables partitioned by created_at.
+
+    Partitions for the current month and the next ``premake`` months are created
+    ahead of time, so rows don't pile up in the DEFAULT partition; a row there would
+    stop the partition for its month from being created. With a retention,
+    partitions whose month ended more than ``retention_months`` ago are detached and
+    dropped, a catalog change instead of a bulk DELETE that leaves dead rows for
+    vacuum. Partitioned tables have no foreign keys, so a partition is kept while rows
+    of other tables still reference its rows (offers of an old request); referencing
+    tables are expired first, so their partitions of the same month go before. Both
+    take a brief lock on the parent table, so every change runs in its own
+    transaction with a short lock_timeout and is retried on the next run if the
+    table is busy.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        premake: int = 3,
+        retention_months: int = 0,
+        check_interval: float = 3600.0,
+        lock_timeout: str = "5s"
+    ):
+        self.engine = engine
+        self.premake = premake
+        self.retention_months = retention_months
+        self.check_interval = check_interval
+        self.lock_timeout = lock_timeout
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def wanted_months(self, today: date) -> List[date]:
+        current = month_start(today)
+        return [add_months(current, offset) for offset in range(self.premake + 1)]
+
+    def expired(self, table: str, partitions: List[str], today: date) -> List[str]:
+        """Partitions of ``table`` whose whole month is older than the retention."""
+        if self.retention_months <= 0:
+            return []
+        cutoff = add_months(month_start(today), -self.retention_months)
+        return sorted(
+            name for name in partitions
+            if (month := partition_month(table, name)) is not None and add_months(month, 1) <= cutoff
+        )
+
+    @staticmethod
+    def create_statement(table: str, month: date) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        )
+
+    async def partitions(self, connection: AsyncConnection, table: str) -> List[str]:
+        result = await connection.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": table}
+        )
+        return list(result.scalars())
+
+    async def _change(self, *statements: str) -> bool:
+        """Run DDL in one short transaction; False if it failed (e.g. the lock timed out)."""
+        try:
+            async with self.engine.begin() as connection:
+                await connection.execute(text(f"SET LOCAL lock_timeout = '{self.lock_timeout}'"))
+                for statement in statements:
+                    await connection.execute(text(statement))
+        except SQLAlchemyError as e:
+            logger.warning("Partition maintenance statement failed: %s: %r", statements[0], e)
+            return False
+        return True
+
+    @staticmethod
+    def referenced_statement(column: Column, referenced: Column, partition: str) -> str:
+        return (
+            f"SELECT 1 FROM {column.table.name} WHERE {column.name} IN "
+            f"(SELECT {referenced.name} FROM {partition}) LIMIT 1"
+        )
+
+    async def _drop(self, table: Table, name: str) -> bool:
+        """
+        Detach and drop a partition in one short transaction, unless rows of other tables
+        still reference it; False if it was kept or the change failed.
+        """
+        try:
+            async with self.engine.connect() as connection:
+                async with connection.begin() as transaction:
+                    await connection.execute(text(f"SET LOCAL lock_timeout = '{self.lock_timeout}'"))
+                    # Detached first: its lock waits out writers that have just seen a row in it
+                    await connection.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {name}"))
+                    for column, referenced in dependent_columns(table):
+                        result = await connection.execute(text(self.referenced_statement(column, referenced, name)))
+                        if result.first() is not None:
+                            logger.warning(
+                                "Keeping expired partition %s: %s still references it", name, column.table.name
+                            )
+                            await transaction.rollback()
+                            return False
+                    await connection.execute(text(f"DROP TABLE {name}"))
+        except SQLAlchemyError as e:
+            logger.warning("Dropping partition %s failed: %r", name, e)
+            return False
+        return True
+
+    async def maintain(self, today: Optional[date] = None) -> Dict[str, List[str]]:
+        """Create missing partitions and drop expired ones; returns the partitions changed."""
+        today = today or datetime.utcnow().date()
+        changed: Dict[str, List[str]] = {"created": [], "dropped": []}
+        partitioned = partitioned_tables()
+        # Referencing tables first, so a month of offers is dropped before the requests it points at
+        tables = [table for table in dependency_sorted_tables(PartitionedModel.metadata) if table in partitioned]
+        for table in reversed(tables):
+            async with self.engine.connect() as connection:
+                existing = set(await self.partitions(connection, table.name))
+            for month in self.wanted_months(today):
+                name = partition_name(table.name, month)
+                if name not in existing and await self._change(self.create_statement(table.name, month)):
+                    changed["created"].append(name)
+            for name in self.expired(table.name, list(existing), today):
+                if await self._drop(table, name):
+                    changed["dropped"].append(name)
+        return changed
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                changed = await self.maintain()
+                if any(changed.values()):
+                    logger.info("Partitions maintained: %s", changed)
+            except (OSError, SQLAlchemyError) as e:
+                logger.warning("Partition maintenance failed: %r", e)
+            await asyncio.sleep(self.check_interval)
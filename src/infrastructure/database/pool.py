@@ -0,0 +1,83 @@
+import threading
+from dataclasses import dataclass, asdict
+from typing import Dict, Any
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+@dataclass
+class PoolStats:
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    connections_opened: int
+    checkouts: int
+    timeouts: int
+    wait_time_avg_ms: float
+    wait_time_max_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class PoolMonitor:
+    """
+    Collects live statistics for an engine's connection pool.
+
+    Occupancy (checked out, idle, overflow) is read from the pool itself; checkout
+    counts come from pool events and wait times are reported by the units of work
+    that acquire connections.
+    """
+
+    def __init__(self, engine: AsyncEngine, max_overflow: int = 0):
+        self._engine = engine
+        self._max_overflow = max_overflow
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        # Pool listeners are carried over when the engine recreates its pool on dispose()
+        event.listen(engine.sync_engine.pool, "connect", self._on_connect)
+        event.listen(engine.sync_engine.pool, "checkout", self._on_checkout)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._connections_opened += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self._checkouts += 1
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._waits += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def stats(self) -> PoolStats:
+        pool = self._engine.sync_engine.pool
+        # Pools without a fixed size (e.g. NullPool) do not expose occupancy counters
+        size = pool.size() if hasattr(pool, "size") else 0
+        checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        idle = pool.checkedin() if hasattr(pool, "checkedin") else 0
+        overflow = max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0
+        with self._lock:
+            return PoolStats(
+                pool_size=size,
+                max_overflow=self._max_overflow,
+                checked_out=checked_out,
+                idle=idle,
+                overflow=overflow,
+                connections_opened=self._connections_opened,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_time_avg_ms=round(self._wait_total / self._waits * 1000, 3) if self._waits else 0.0,
+                wait_time_max_ms=round(self._wait_max * 1000, 3)
+            )
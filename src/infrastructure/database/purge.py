@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from datetime import datetime, time, timedelta
+from typing import Dict, Optional
+from sqlalchemy import Delete, Table, delete, exists, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import dependency_sorted_tables, referencing_columns
+
+logger = logging.getLogger(__name__)
+
+class SoftDeletePurger:
+    """
+    Hard-deletes rows that were soft deleted more than ``retention`` ago.
+
+    It runs in the background and only inside the off-peak window. Every batch
+    removes at most ``batch_size`` rows of one table in its own short transaction,
+    followed by a pause, so locks and WAL are spread out instead of arriving at once.
+    Children are purged before their parents. A row that is still referenced (e.g. a
+    deleted request with an offer deleted more recently) waits for a later run.
+    Batches claim their rows with FOR UPDATE SKIP LOCKED, so purgers in several
+    workers don't block each other.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        retention: timedelta,
+        batch_size: int = 500,
+        pause: float = 0.5,
+        window_start: time = time(1, 0),
+        window_end: time = time(5, 0),
+        check_interval: float = 60.0
+    ):
+        self.engine = engine
+        self.retention = retention
+        self.batch_size = batch_size
+        self.pause = pause
+        self.window_start = window_start
+        self.window_end = window_end
+        self.check_interval = check_interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def in_window(self, now: datetime) -> bool:
+        current = now.time()
+        if self.window_start <= self.window_end:
+            return self.window_start <= current < self.window_end
+        return current >= self.window_start or current < self.window_end
+
+    def window_closes_at(self, now: datetime) -> datetime:
+        closes = datetime.combine(now.date(), self.window_end)
+        return closes if closes > now else closes + timedelta(days=1)
+
+    def purge_statement(self, table: Table, cutoff: datetime) -> Delete:
+        """DELETE of one batch of purgeable rows, oldest deletions first."""
+        batch = select(table.c.id).where(table.c.deleted_at < cutoff)
+        for column in referencing_columns(table):
+            batch = batch.where(~exists().where(column == table.c.id))
+        batch = batch.order_by(table.c.deleted_at).limit(self.batch_size).with_for_update(skip_locked=True)
+        return delete(table).where(table.c.id.in_(batch.scalar_subquery()))
+
+    async def purge(self, until: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Purge every table until nothing old enough is left, or until ``until`` (UTC).
+        Returns the number of rows removed per table.
+        """
+        cutoff = datetime.utcnow() - self.retention
+        purged: Dict[str, int] = {}
+        # Parents come before children, so walk the list backwards
+        for table in reversed(dependency_sorted_tables(Base.metadata)):
+            if "deleted_at" not in table.c:
+                continue
+            purged[table.name] = 0
+            while until is None or datetime.utcnow() < until:
+                async with self.engine.begin() as connection:
+                    deleted = (await connection.execute(self.purge_statement(table, cutoff))).rowcount
+                purged[table.name] += deleted
+                if deleted < self.batch_size:
+                    break
+                await asyncio.sleep(self.pause)
+        return purged
+
+    async def _run(self) -> None:
+        while True:
+            now = datetime.utcnow()
+            if self.in_window(now):
+                try:
+                    purged = await self.purge(until=self.window_closes_at(now))
+                    if any(purged.values()):
+                        logger.info("Purged soft-deleted rows: %s", purged)
+                except (OSError, SQLAlchemyError) as e:
+                    logger.warning("Purging soft-deleted rows failed: %r", e)
+            await asyncio.sleep(self.check_interval)
@@ -0,0 +1,39 @@
+import itertools
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from src.infrastructure.database.pool import PoolMonitor
+
+@dataclass
+class DatabaseTarget:
+    name: str
+    engine: AsyncEngine
+    session_factory: Callable[[], AsyncSession]
+    pool_monitor: PoolMonitor
+
+class DatabaseRouter:
+    """
+    Chooses the database a unit of work runs against.
+
+    Writes always go to the primary. Read-only units are spread round-robin over the
+    replicas, unless the caller asks for the primary (e.g. to read its own writes) or
+    no replicas are configured.
+    """
+
+    def __init__(self, primary: DatabaseTarget, replicas: Sequence[DatabaseTarget] = ()):
+        self.primary = primary
+        self.replicas: List[DatabaseTarget] = list(replicas)
+        self._replica_cycle = itertools.cycle(self.replicas) if self.replicas else None
+
+    def route(self, read_only: bool, prefer_primary: bool = False) -> DatabaseTarget:
+        if not read_only or prefer_primary or self._replica_cycle is None:
+            return self.primary
+        return next(self._replica_cycle)
+
+    @property
+    def targets(self) -> List[DatabaseTarget]:
+        return [self.primary, *self.replicas]
+
+    async def dispose(self) -> None:
+        for target in self.targets:
+            await target.engine.dispose()
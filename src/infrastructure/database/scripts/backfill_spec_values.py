@@ -0,0 +1,37 @@
+"""
+Fill equipment_spec_values from the specifications of existing equipment.
+
+New and updated equipment is normalized on write; run this once after the migration
+that adds the table, and again whenever the units or parsing rules change. Rows are
+processed in id order in small transactions, so it can run against a live database:
+
+    python src/infrastructure/database/scripts/backfill_spec_values.py --batch-size 1000
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.database.config import DATABASE_URL
+from src.infrastructure.database.spec_values import backfill_spec_values
+
+async def run_backfill(url: str, batch_size: int, pause: float) -> None:
+    engine = create_async_engine(url)
+    try:
+        processed = await backfill_spec_values(engine, batch_size=batch_size, pause=pause)
+        print(f"Normalized specifications of {processed} equipment rows")
+    finally:
+        await engine.dispose()
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Normalize the specifications of existing equipment.")
+    parser.add_argument("--url", default=DATABASE_URL, help="Database URL (defaults to DATABASE_URL)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Equipment rows per transaction")
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds to wait between batches")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    asyncio.run(run_backfill(args.url, args.batch_size, args.pause))
@@ -0,0 +1,78 @@
+"""
+Concurrency benchmark for the HTTP API.
+
+Fires a fixed number of GET requests at increasing concurrency levels and reports
+throughput and latency percentiles for each level. Every request runs in its own
+unit of work, so throughput should keep growing with the number of in-flight
+requests until the connection pool (or Postgres) saturates.
+
+Usage (with the API running):
+
+    python src/infrastructure/database/scripts/benchmark_concurrency.py \\
+        --url http://localhost:8000 --levels 1 2 4 8 16 32 --requests 500
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Tuple
+
+import httpx
+
+DEFAULT_PATHS = ["/requests/", "/offers/", "/equipment/", "/clients/", "/users/"]
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+async def run_level(client: httpx.AsyncClient, paths: List[str], concurrency: int, total: int) -> Tuple[float, List[float], int]:
+    latencies: List[float] = []
+    errors = 0
+    pending = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        # Workers share one iterator, so exactly `total` requests are sent per level
+        for i in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.get(paths[i % len(paths)])
+                if response.status_code >= 500:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, errors
+
+async def run_benchmark(url: str, paths: List[str], levels: List[int], total: int, timeout: float) -> None:
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        # Warm up the connection pools on both sides
+        await run_level(client, paths, min(levels), min(total, 50))
+
+        print(f"{'in-flight':>9} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for concurrency in levels:
+            elapsed, latencies, errors = await run_level(client, paths, concurrency, total)
+            print(
+                f"{concurrency:>9} {len(latencies) / elapsed:>10.1f} "
+                f"{percentile(latencies, 50) * 1000:>9.1f} {percentile(latencies, 99) * 1000:>9.1f} "
+                f"{errors:>7}"
+            )
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure API throughput against in-flight requests.")
+    parser.add_argument("--url", default="http://localhost:8000", help="Base URL of the running API")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="Endpoints to cycle through")
+    parser.add_argument("--levels", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32, 64], help="Concurrency levels")
+    parser.add_argument("--requests", type=int, default=500, help="Requests sent per concurrency level")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run_benchmark(args.url, args.paths, args.levels, args.requests, args.timeout))
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark for the list read path.
+
+Compares hydrating ORM instances and copying them into entities (``_to_entity``)
+with the row path used by ``BaseSQLRepository.list``, which selects column tuples
+and maps them to entities in bulk. Both paths read the same rows of the requests
+table.
+
+The rows are inserted inside a transaction that is rolled back at the end, so the
+script can be pointed at a development database without leaving data behind:
+
+    python src/infrastructure/database/scripts/benchmark_row_mapping.py --rows 10000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.infrastructure.database.config import Base, DATABASE_URL
+from src.infrastructure.database.models import Client as ClientModel, Request as RequestModel
+from src.infrastructure.repositories.request import RequestRepository
+
+async def seed(session: AsyncSession, rows: int) -> int:
+    now = datetime.utcnow()
+    result = await session.execute(
+        insert(ClientModel).values(name="Benchmark", email=f"benchmark-{now.timestamp()}@example.com",
+                                   tags={}, created_at=now, updated_at=now).returning(ClientModel.id)
+    )
+    client_id = result.scalar_one()
+    await session.execute(insert(RequestModel), [
+        {
+            "title": f"Request {i}", "description": "Benchmark request", "client_id": client_id,
+            "equipment_category": "medical", "required_specifications": {"power": "500W"},
+            "quantity": 1 + i % 5, "priority": ("urgent", "normal", "low")[i % 3], "status": "in_progress",
+            "budget_min": 100.0, "budget_max": 500.0, "currency": "USD", "notes": None,
+            "tags": {"batch": "benchmark", "index": str(i)}, "created_at": now, "updated_at": now,
+            "is_active": True
+        }
+        for i in range(rows)
+    ])
+    return client_id
+
+async def time_path(run: Callable[[], Awaitable[List]], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+async def run_benchmark(url: str, rows: int, repeat: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            if connection.dialect.name == "postgresql":
+                # The trigram indexes in the models need the extension
+                await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await connection.run_sync(Base.metadata.create_all)
+            session = AsyncSession(bind=connection, expire_on_commit=False)
+            client_id = await seed(session, rows)
+            repository = RequestRepository(session)
+            filters = {"client_id": client_id}
+
+            async def orm_path() -> List:
+                query = repository._apply_filters(select(RequestModel), filters).order_by(RequestModel.id).limit(rows)
+                result = await session.execute(query)
+                entities = [repository._to_entity(db_obj) for db_obj in result.scalars().all()]
+                # Start every run with an empty identity map, as a fresh request would
+                session.expunge_all()
+                return entities
+
+            async def row_path() -> List:
+                return await repository.list(filters=filters, limit=rows)
+
+            assert await orm_path() == await row_path()
+            print(f"{rows} rows, best of {repeat} runs")
+            print(f"{'path':>6} {'best ms':>9} {'median ms':>10} {'rows/s':>10}")
+            for name, run in (("orm", orm_path), ("row", row_path)):
+                timings = await time_path(run, repeat)
+                print(
+                    f"{name:>6} {min(timings) * 1000:>9.1f} {statistics.median(timings) * 1000:>10.1f} "
+                    f"{rows / min(timings):>10.0f}"
+                )
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare ORM hydration with the row read path.")
+    parser.add_argument("--url", default=DATABASE_URL, help="Database URL (defaults to DATABASE_URL)")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows read per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run_benchmark(args.url, args.rows, args.repeat))
@@ -19,6 +19,7 @@ load_dotenv(dotenv_path, override=True)
 
 from src.infrastructure.database.models import User, Client, Equipment, Request, Offer
 from src.infrastructure.database.config import Base
+from src.infrastructure.database.spec_values import replace_spec_values
 
 # Database connection
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -153,6 +154,8 @@ async def populate_database():
             # Create equipment
             equipment = [create_fake_equipment() for _ in range(30)]
             session.add_all(equipment)
+            await session.flush()
+            await replace_spec_values(session, {item.id: item.specifications for item in equipment})
             await session.commit()
             
             # Create requests
@@ -1,19 +1,16 @@
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
-from src.infrastructure.database.config import DATABASE_URL, DEBUG
+from src.infrastructure.database.config import engine, async_session, replica_engines
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=DEBUG,
-    future=True
-)
+# Sessions are drawn from the single application engine defined in config
+async_session_factory = async_session
 
-async_session_factory = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+# Session factories for the read replicas, in the order of DATABASE_REPLICA_URLS
+replica_session_factories = [
+    sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+    for replica in replica_engines
+]
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
@@ -24,4 +21,4 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
         finally:
-            await session.close() 
\ No newline at end of file
+            await session.close()
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Union
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from src.domain.services.specifications import spec_values
+from src.infrastructure.database.models import Equipment, EquipmentSpecValue
+
+logger = logging.getLogger(__name__)
+
+async def replace_spec_values(
+    executor: Union[AsyncSession, AsyncConnection], specifications: Dict[int, Optional[Dict[str, Any]]]
+) -> int:
+    """
+    Rewrite the normalized specifications of the given equipment ids, from their
+    specifications JSON. Returns the number of values stored.
+    """
+    if not specifications:
+        return 0
+    table = EquipmentSpecValue.__table__
+    await executor.execute(delete(table).where(table.c.equipment_id.in_(list(specifications))))
+    rows = [
+        {"equipment_id": equipment_id, "key": value.key, "value": value.value, "unit": value.unit}
+        for equipment_id, specs in specifications.items()
+        for value in spec_values(specs)
+    ]
+    if rows:
+        await executor.execute(insert(table), rows)
+    return len(rows)
+
+async def backfill_spec_values(engine: AsyncEngine, batch_size: int = 1000, pause: float = 0.1) -> int:
+    """
+    Normalize the specifications of all equipment, ``batch_size`` rows at a time in id
+    order, each batch in its own short transaction with a pause after it, so the table
+    stays writable meanwhile. Safe to rerun: every batch replaces its rows' values.
+    Returns the number of equipment rows processed.
+    """
+    last_id, processed = 0, 0
+    while True:
+        async with engine.begin() as connection:
+            result = await connection.execute(
+                select(Equipment.id, Equipment.specifications)
+                .where(Equipment.id > last_id, Equipment.deleted_at.is_(None))
+                .order_by(Equipment.id)
+                .limit(batch_size)
+            )
+            batch = dict(result.all())
+            if not batch:
+                return processed
+            stored = await replace_spec_values(connection, batch)
+        last_id = max(batch)
+        processed += len(batch)
+        logger.info("Normalized specifications of %d equipment rows (%d values), up to id %d",
+                    len(batch), stored, last_id)
+        if len(batch) < batch_size:
+            return processed
+        await asyncio.sleep(pause)
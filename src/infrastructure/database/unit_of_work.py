@@ -0,0 +1,97 @@
+import time
+from typing import Callable, Optional
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.cache.entities import discard_invalidations, flush_invalidations
+from src.infrastructure.database.pool import PoolMonitor
+from src.infrastructure.repositories.factory import RepositoryFactory
+
+class UnitOfWork:
+    """
+    Transaction boundary for a single request.
+
+    Every unit of work checks out its own session from the pool and binds a fresh
+    RepositoryFactory to it. Read-write units commit when the block exits cleanly and
+    roll back otherwise; read-only units run in a read-only transaction and are
+    always rolled back.
+
+    The connection is acquired on entry so the time spent waiting for the pool can
+    be reported to the pool monitor. An isolation level such as "REPEATABLE READ"
+    gives long readers (exports) a consistent snapshot.
+
+    Read-only units use the caches, except those pinned to the primary to read their
+    client's own writes: cached data may predate them. Units on a replica don't cache
+    rows written within CACHE_REPLICA_LAG seconds.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        read_only: bool = False,
+        pool_monitor: Optional[PoolMonitor] = None,
+        isolation_level: Optional[str] = None,
+        prefer_primary: bool = False,
+        replica: bool = False
+    ):
+        self._session_factory = session_factory
+        self.read_only = read_only
+        self.prefer_primary = prefer_primary
+        self.replica = replica
+        self.isolation_level = isolation_level
+        self._pool_monitor = pool_monitor
+        self._session: Optional[AsyncSession] = None
+        self._repositories: Optional[RepositoryFactory] = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._session = self._session_factory()
+        await self._acquire_connection()
+        # Only read-only units may be served from the caches; writers read fresh rows
+        self._repositories = RepositoryFactory(
+            self._session, cache_reads=self.read_only and not self.prefer_primary, replica_reads=self.replica
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        session = self.session
+        try:
+            if exc_type is None and not self.read_only:
+                await session.commit()
+                await flush_invalidations(session)
+            else:
+                await session.rollback()
+                discard_invalidations(session)
+        finally:
+            await session.close()
+            self._session = None
+            self._repositories = None
+
+    async def _acquire_connection(self) -> None:
+        # Transaction characteristics must be set before the transaction is opened
+        execution_options = {}
+        if self.read_only:
+            execution_options["postgresql_readonly"] = True
+        if self.isolation_level:
+            execution_options["isolation_level"] = self.isolation_level
+        started = time.perf_counter()
+        try:
+            await self._session.connection(execution_options=execution_options)
+        except Exception as e:
+            if self._pool_monitor and isinstance(e, PoolTimeoutError):
+                self._pool_monitor.record_timeout()
+            await self._session.close()
+            self._session = None
+            raise
+        if self._pool_monitor:
+            self._pool_monitor.record_wait(time.perf_counter() - started)
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("Unit of work is not active. Use it as an async context manager.")
+        return self._session
+
+    @property
+    def repositories(self) -> RepositoryFactory:
+        if self._repositories is None:
+            raise RuntimeError("Unit of work is not active. Use it as an async context manager.")
+        return self._repositories
@@ -1,25 +1,117 @@
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
-from src.infrastructure.database.session import get_session
-from src.infrastructure.repositories.factory import RepositoryFactory
+from datetime import time, timedelta
+from typing import Any, Dict, Optional
+from src.infrastructure.cache.entities import apply_invalidation, clear_caches, close_entity_caches
+from src.infrastructure.cache.invalidation import InvalidationListener
+from src.infrastructure.database.config import (
+    DB_MAX_OVERFLOW, PARTITION_MAINTENANCE_ENABLED, PARTITION_PREMAKE_MONTHS, PARTITION_RETENTION_MONTHS,
+    PURGE_BATCH_PAUSE, PURGE_BATCH_SIZE, PURGE_ENABLED, PURGE_RETENTION_DAYS, PURGE_WINDOW_END,
+    PURGE_WINDOW_START, replica_engines
+)
+from src.infrastructure.database.partitions import PartitionMaintainer
+from src.infrastructure.database.pool import PoolMonitor
+from src.infrastructure.database.purge import SoftDeletePurger
+from src.infrastructure.database.routing import DatabaseRouter, DatabaseTarget
+from src.infrastructure.database.session import (
+    async_session_factory, engine, replica_session_factories
+)
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.search.semantic import close_semantic_indexes
 
 class Container:
     def __init__(self):
-        self._session: AsyncSession | None = None
-        self._repository_factory: RepositoryFactory | None = None
+        self._router: DatabaseRouter | None = None
+        self._invalidation_listener: InvalidationListener | None = None
+        self._purger: SoftDeletePurger | None = None
+        self._partition_maintainer: PartitionMaintainer | None = None
 
     async def init(self):
-        self._session = await anext(get_session())
-        self._repository_factory = RepositoryFactory(self._session)
+        if not self._router:
+            self._router = self._create_router()
+        if self._invalidation_listener is None and engine.dialect.name == "postgresql":
+            # NOTIFY is not delivered on replicas, so always listen on the primary
+            dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+            self._invalidation_listener = InvalidationListener(
+                dsn, on_message=apply_invalidation, on_reconnect=clear_caches
+            )
+            self._invalidation_listener.start()
+        if self._purger is None and PURGE_ENABLED and engine.dialect.name == "postgresql":
+            self._purger = SoftDeletePurger(
+                engine,
+                retention=timedelta(days=PURGE_RETENTION_DAYS),
+                batch_size=PURGE_BATCH_SIZE,
+                pause=PURGE_BATCH_PAUSE,
+                window_start=time.fromisoformat(PURGE_WINDOW_START),
+                window_end=time.fromisoformat(PURGE_WINDOW_END)
+            )
+            self._purger.start()
+        if self._partition_maintainer is None and PARTITION_MAINTENANCE_ENABLED and engine.dialect.name == "postgresql":
+            self._partition_maintainer = PartitionMaintainer(
+                engine, premake=PARTITION_PREMAKE_MONTHS, retention_months=PARTITION_RETENTION_MONTHS
+            )
+            self._partition_maintainer.start()
+
+    def _create_router(self) -> DatabaseRouter:
+        primary = DatabaseTarget(
+            name="primary",
+            engine=engine,
+            session_factory=async_session_factory,
+            pool_monitor=PoolMonitor(engine, max_overflow=DB_MAX_OVERFLOW)
+        )
+        replicas = [
+            DatabaseTarget(
+                name=f"replica-{index}",
+                engine=replica,
+                session_factory=session_factory,
+                pool_monitor=PoolMonitor(replica, max_overflow=DB_MAX_OVERFLOW)
+            )
+            for index, (replica, session_factory)
+            in enumerate(zip(replica_engines, replica_session_factories))
+        ]
+        return DatabaseRouter(primary, replicas)
 
     async def cleanup(self):
-        if self._session:
-            await self._session.close()
+        if self._invalidation_listener:
+            await self._invalidation_listener.stop()
+            self._invalidation_listener = None
+        if self._purger:
+            await self._purger.stop()
+            self._purger = None
+        if self._partition_maintainer:
+            await self._partition_maintainer.stop()
+            self._partition_maintainer = None
+        await close_entity_caches()
+        close_semantic_indexes()
+        # Engines stay registered; disposing only closes their pooled connections
+        if self._router:
+            await self._router.dispose()
 
     @property
-    def repository_factory(self) -> RepositoryFactory:
-        if not self._repository_factory:
+    def router(self) -> DatabaseRouter:
+        if not self._router:
             raise RuntimeError("Container not initialized. Call init() first.")
-        return self._repository_factory
+        return self._router
+
+    def unit_of_work(
+        self,
+        read_only: bool = False,
+        prefer_primary: bool = False,
+        isolation_level: Optional[str] = None
+    ) -> UnitOfWork:
+        """
+        Create a new unit of work with its own session from the pool.
+        Read-only units go to a replica unless prefer_primary is set.
+        """
+        target = self.router.route(read_only, prefer_primary=prefer_primary)
+        return UnitOfWork(
+            target.session_factory,
+            read_only=read_only,
+            pool_monitor=target.pool_monitor,
+            isolation_level=isolation_level,
+            prefer_primary=prefer_primary,
+            replica=target is not self.router.primary
+        )
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return {target.name: target.pool_monitor.stats().to_dict() for target in self.router.targets}
 
-container = Container() 
\ No newline at end of file
+container = Container()
@@ -4,12 +4,13 @@ from src.infrastructure.di.container import container
 
 T = TypeVar('T')
 
-def inject_repository(repository_type: str) -> Callable:
+def inject_repository(repository_type: str, read_only: bool = False) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            repository = getattr(container.repository_factory, f'get_{repository_type}_repository')()
-            kwargs[repository_type] = repository
-            return await func(*args, **kwargs)
+            async with container.unit_of_work(read_only=read_only) as uow:
+                repository = getattr(uow.repositories, f'get_{repository_type}_repository')()
+                kwargs[repository_type] = repository
+                return await func(*args, **kwargs)
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator
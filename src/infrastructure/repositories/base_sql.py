@@ -1,25 +1,401 @@
-from typing import Generic, TypeVar, Optional, List, Type
+import json
+import operator
+from datetime import datetime
+from functools import lru_cache, reduce
+from typing import Generic, TypeVar, Optional, List, Type, Dict, Any, AsyncIterator, Awaitable, Hashable, Tuple, Callable, Sequence
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from src.domain.repositories.base import BaseRepository
+from sqlalchemy import and_, or_, select, update, func, literal_column, type_coerce, Select, Row, Table
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, array
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from src.domain.repositories.base import BaseRepository, RowVersion, SearchHit
+from src.infrastructure.cache.entities import (
+    entity_caches, invalidate_entities, invalidate_entity, recently_written
+)
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.cache.results import list_cache
+from src.infrastructure.database.config import COUNT_CACHE_TTL, COUNT_EXACT_THRESHOLD, TRIGRAM_SIMILARITY_THRESHOLD
+from src.infrastructure.database.models import TEXT_SEARCH_CONFIG, referencing_columns
 
 ModelType = TypeVar("ModelType")
 EntityType = TypeVar("EntityType")
 
+# Snippets returned with search hits: up to two fragments, matches wrapped in <b></b>
+SEARCH_HEADLINE_OPTIONS = "StartSel=<b>, StopSel=</b>, MaxFragments=2, MaxWords=20, MinWords=8"
+
+# Row counts shared by all repository instances, keyed by table, count mode and filters
+_count_cache = LRUCache(maxsize=1024, ttl=COUNT_CACHE_TTL)
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) of a statement. Executed like the statement itself, so its
+    parameters are bound rather than rendered inline (JSONB values have no literal form).
+    """
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+@lru_cache(maxsize=None)
+def _entity_list_adapter(entity_class: Type) -> TypeAdapter:
+    return TypeAdapter(List[entity_class])
+
 class BaseSQLRepository(BaseRepository[EntityType], Generic[ModelType, EntityType]):
+    # Row read path: when set, list queries select these columns as plain tuples and
+    # build ``entity_class`` instances from them instead of hydrating ORM objects
+    entity_class: Optional[Type[EntityType]] = None
+    entity_columns: Tuple[str, ...] = ()
+
     def __init__(self, session: AsyncSession, model_class: Type[ModelType]):
         self.session = session
         self.model_class = model_class
+        # Serve get_by_id and list queries from the caches; only enabled for read-only units
+        self.cache_reads = False
+        # Reads come from a replica, which may lag behind recent writes
+        self.replica_reads = False
+
+    def _to_entity(self, db_obj: ModelType) -> EntityType:
+        return db_obj
+
+    def _column_transforms(self) -> Dict[str, Callable[[Any], Any]]:
+        """Conversions from stored column values to entity values, keyed by column."""
+        return {}
+
+    def _row_select(self) -> Select:
+        return select(*(getattr(self.model_class, name) for name in self.entity_columns))
+
+    def _rows_to_entities(self, rows: Sequence[Row]) -> List[EntityType]:
+        """
+        Map column tuples to entities in bulk. Transforms run once per column and the
+        whole batch is validated by a single pydantic call.
+        """
+        if not rows:
+            return []
+        transforms = self._column_transforms()
+        columns = []
+        for name, values in zip(self.entity_columns, zip(*rows)):
+            transform = transforms.get(name)
+            columns.append(list(map(transform, values)) if transform else values)
+        records = [dict(zip(self.entity_columns, values)) for values in zip(*columns)]
+        return _entity_list_adapter(self.entity_class).validate_python(records)
+
+    def _live(self, query: Select) -> Select:
+        """Restrict a query to rows that have not been soft deleted."""
+        return query.filter(self.model_class.deleted_at.is_(None))
+
+    def _apply_filters(self, query: Select, filters: Optional[Dict[str, Any]]) -> Select:
+        """
+        Apply filters of the form ``field`` or ``field__operator`` to a query.
+        Supported operators: gte, lte, lt, icontains, in; a bare field means equality,
+        or membership when the value is a list. JSONB columns also support contains
+        (``@>`` with a dict or list) and has_key (``?``, or ``?&`` for a list of keys).
+        Text columns support similar, a pg_trgm fuzzy match; results are then ranked
+        by similarity (see _paginate). Soft-deleted rows never match.
+        """
+        query = self._live(query)
+        if not filters:
+            return query
+        for key, value in filters.items():
+            field, _, operator = key.partition('__')
+            column = getattr(self.model_class, field)
+            if operator == 'gte':
+                query = query.filter(column >= value)
+            elif operator == 'lte':
+                query = query.filter(column <= value)
+            elif operator == 'lt':
+                query = query.filter(column < value)
+            elif operator == 'icontains':
+                query = query.filter(column.ilike(f'%{value}%'))
+            elif operator == 'similar':
+                # "%" lets the trigram index prefilter; the threshold check is exact
+                query = query.filter(
+                    column.op('%')(value),
+                    func.similarity(column, value) >= TRIGRAM_SIMILARITY_THRESHOLD
+                )
+            elif operator == 'contains':
+                query = query.filter(type_coerce(column, JSONB).contains(value))
+            elif operator == 'has_key' and isinstance(value, (list, tuple, set)):
+                query = query.filter(type_coerce(column, JSONB).has_all(array(list(value))))
+            elif operator == 'has_key':
+                query = query.filter(type_coerce(column, JSONB).has_key(value))
+            elif operator == 'in' or (not operator and isinstance(value, (list, tuple, set))):
+                query = query.filter(column.in_(list(value)))
+            elif not operator:
+                query = query.filter(column == value)
+            else:
+                raise ValueError(f"Unsupported filter operator: {key}")
+        return query
+
+    @staticmethod
+    def _filters_key(filters: Optional[Dict[str, Any]]) -> Hashable:
+        """Order-independent, hashable form of a filters dict."""
+        if not filters:
+            return ()
+        def freeze(value):
+            if isinstance(value, dict):
+                return json.dumps(value, sort_keys=True, default=str)
+            if isinstance(value, (list, tuple, set)):
+                return tuple(freeze(item) for item in value)
+            return value
+        return tuple(sorted((key, freeze(value)) for key, value in filters.items()))
+
+    def _similarity(self, filters: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """Summed similarity of all ``__similar`` filters, or None when there are none."""
+        scores = [
+            func.similarity(getattr(self.model_class, key[:-len('__similar')]), value)
+            for key, value in (filters or {}).items() if key.endswith('__similar')
+        ]
+        return reduce(operator.add, scores) if scores else None
+
+    def _paginate(
+        self, query: Select, skip: int, limit: int, after_id: Optional[int], filters: Optional[Dict] = None
+    ) -> Select:
+        """
+        Order by primary key and page either by keyset (rows after ``after_id``)
+        or, for backwards compatibility, by offset.
+        Fuzzy matches are ordered by similarity first and can only be paged by offset.
+        """
+        similarity = self._similarity(filters)
+        if similarity is not None:
+            if after_id is not None:
+                raise ValueError("Results ranked by similarity cannot be paged with a cursor")
+            query = query.order_by(similarity.desc(), self.model_class.id)
+        else:
+            query = query.order_by(self.model_class.id)
+        if after_id is not None:
+            query = query.filter(self.model_class.id > after_id)
+        elif skip:
+            query = query.offset(skip)
+        return query.limit(limit)
+
+    async def _cached(self, kind: str, filters: Optional[Dict], page: Hashable,
+                      load: Callable[[], Awaitable[List]]) -> List:
+        """Serve read-only list queries from the versioned result cache."""
+        if not self.cache_reads:
+            return await load()
+        key = (kind, self._filters_key(filters), page)
+        return list(await list_cache.get_or_load(self.model_class.__tablename__, key, load, replica=self.replica_reads))
+
+    async def list(
+        self,
+        filters: Dict = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> List[EntityType]:
+        return await self._cached(
+            "list", filters, (skip, limit, after_id), lambda: self._list(filters, skip, limit, after_id)
+        )
+
+    def list_query(
+        self,
+        filters: Dict = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> Select:
+        """The SELECT statement list() runs, e.g. to inspect its plan."""
+        columns = select(self.model_class) if self.entity_class is None else self._row_select()
+        return self._paginate(self._apply_filters(columns, filters), skip, limit, after_id, filters)
+
+    async def _list(self, filters: Optional[Dict], skip: int, limit: int, after_id: Optional[int]) -> List[EntityType]:
+        result = await self.session.execute(self.list_query(filters, skip, limit, after_id))
+        if self.entity_class is None:
+            return [self._to_entity(model) for model in result.scalars().all()]
+        return self._rows_to_entities(result.all())
+
+    async def list_versions(
+        self,
+        filters: Dict = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> List[RowVersion]:
+        """Ids and modification times of the rows list() would return, without wide columns."""
+        return await self._cached(
+            "versions", filters, (skip, limit, after_id), lambda: self._list_versions(filters, skip, limit, after_id)
+        )
+
+    async def _list_versions(
+        self, filters: Optional[Dict], skip: int, limit: int, after_id: Optional[int]
+    ) -> List[RowVersion]:
+        query = select(self.model_class.id, self.model_class.updated_at)
+        query = self._paginate(self._apply_filters(query, filters), skip, limit, after_id, filters)
+        result = await self.session.execute(query)
+        return [RowVersion(*row) for row in result.all()]
+
+    def search_query(
+        self,
+        text: str,
+        filters: Dict = None,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Select:
+        """
+        Full-text search over the model's generated ``search_vector`` column, ordered by
+        rank (descending), then id. ``after`` is the (rank, id) of the last hit seen.
+
+        Matching, ranking and the keyset condition run in a subquery that only returns
+        ids and ranks; the entity columns and ts_headline, which has to re-parse the
+        document, are only computed for the rows of the page.
+        """
+        table = self.model_class.__tablename__
+        vector = literal_column(f"{table}.search_vector", TSVECTOR)
+        tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, text)
+        rank = func.ts_rank(vector, tsquery)
+        id_column = self.model_class.id
+
+        matches = self._apply_filters(select(id_column, rank.label("rank")), filters).where(vector.bool_op("@@")(tsquery))
+        if after is not None:
+            after_rank, after_id = after
+            matches = matches.where(or_(rank < after_rank, and_(rank == after_rank, id_column > after_id)))
+        matches = matches.order_by(rank.desc(), id_column).limit(limit).subquery()
+
+        document = func.concat_ws(" ", *(getattr(self.model_class, name) for name in self.model_class.search_weights))
+        headline = func.ts_headline(TEXT_SEARCH_CONFIG, document, tsquery, SEARCH_HEADLINE_OPTIONS)
+        return (
+            self._row_select()
+            .add_columns(matches.c.rank, headline.label("headline"))
+            .join(matches, id_column == matches.c.id)
+            .order_by(matches.c.rank.desc(), id_column)
+        )
+
+    async def search(
+        self,
+        text: str,
+        filters: Dict = None,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[SearchHit[EntityType]]:
+        """Entities matching ``text`` and ``filters``, best match first, with highlighted snippets."""
+        return await self._cached(
+            "search", filters, (text, limit, after), lambda: self._search(text, filters, limit, after)
+        )
+
+    async def _search(
+        self, text: str, filters: Optional[Dict], limit: int, after: Optional[Tuple[float, int]]
+    ) -> List[SearchHit[EntityType]]:
+        rows = (await self.session.execute(self.search_query(text, filters, limit, after))).all()
+        # The entity columns come first; rank and headline are the two trailing columns
+        entities = self._rows_to_entities(rows)
+        return [
+            SearchHit[self.entity_class](item=entity, rank=row[-2], headline=row[-1])
+            for entity, row in zip(entities, rows)
+        ]
+
+    async def count(self, filters: Dict = None) -> int:
+        query = self._apply_filters(select(func.count()).select_from(self.model_class), filters)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def estimate_count(self, filters: Dict = None) -> int:
+        """Row count estimated by the Postgres planner, without scanning the table."""
+        query = self._apply_filters(select(self.model_class.id), filters)
+        result = await self.session.execute(Explain(query))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def count_rows(self, filters: Dict = None, mode: str = "auto") -> Tuple[int, bool]:
+        """
+        Count matching rows and report whether the number is an estimate.
+
+        "exact" always runs COUNT(*), "estimate" always asks the planner, and "auto"
+        counts exactly only when the planner expects at most COUNT_EXACT_THRESHOLD rows.
+        Results are reused for COUNT_CACHE_TTL seconds.
+        """
+        connection = await self.session.connection()
+        if connection.dialect.name != "postgresql":
+            mode = "exact"
+        key = (self.model_class.__tablename__, mode, self._filters_key(filters))
+        cached = _count_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if mode == "exact":
+            counted = (await self.count(filters), False)
+        else:
+            estimate = await self.estimate_count(filters)
+            if mode == "auto" and estimate <= COUNT_EXACT_THRESHOLD:
+                counted = (await self.count(filters), False)
+            else:
+                counted = (estimate, True)
+        _count_cache.set(key, counted)
+        return counted
+
+    async def iter_all(self, filters: Dict = None, batch_size: int = 1000) -> AsyncIterator[EntityType]:
+        """
+        Stream every matching row in id order through a server-side cursor,
+        fetching ``batch_size`` rows at a time so memory stays constant.
+        """
+        if self.entity_class is None:
+            query = self._apply_filters(select(self.model_class), filters).order_by(self.model_class.id)
+            result = await self.session.stream(query.execution_options(yield_per=batch_size))
+            async for partition in result.scalars().partitions():
+                for db_obj in partition:
+                    yield self._to_entity(db_obj)
+            return
+        query = self._apply_filters(self._row_select(), filters).order_by(self.model_class.id)
+        result = await self.session.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            for entity in self._rows_to_entities(partition):
+                yield entity
+
+    async def get_by_id(self, entity_id: Any) -> Optional[EntityType]:
+        """
+        Load one entity by primary key. Read-only units go through the entity cache,
+        which stores serialized entities, so every caller gets its own copy.
+        """
+        try:
+            entity_id = int(entity_id)
+        except (TypeError, ValueError):
+            return None
+        cache = None
+        if self.cache_reads and self.entity_class is not None:
+            cache = entity_caches.get(self.model_class.__tablename__)
+        if cache is not None:
+            cached = await cache.get(str(entity_id))
+            if cached is not None:
+                return self.entity_class.model_validate_json(cached)
+        db_obj = await self.get(entity_id)
+        if not db_obj:
+            return None
+        entity = self._to_entity(db_obj)
+        # A replica may have returned the row as it was before a recent write
+        if cache is not None and not (self.replica_reads and recently_written(self.model_class.__tablename__, str(entity_id))):
+            await cache.set(str(entity_id), entity.model_dump_json().encode())
+        return entity
+
+    async def get_version(self, entity_id: Any) -> Optional[RowVersion]:
+        """Id and modification time of one row, or None if it does not exist."""
+        try:
+            entity_id = int(entity_id)
+        except (TypeError, ValueError):
+            return None
+        result = await self.session.execute(
+            self._live(select(self.model_class.id, self.model_class.updated_at)).filter(self.model_class.id == entity_id)
+        )
+        row = result.one_or_none()
+        return RowVersion(*row) if row else None
+
+    async def _invalidate(self, entity_id: int) -> None:
+        await invalidate_entity(self.session, self.model_class.__tablename__, entity_id)
 
     async def get(self, id: int) -> Optional[EntityType]:
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == id)
+            self._live(select(self.model_class)).filter(self.model_class.id == id)
         )
         db_obj = result.scalar_one_or_none()
         return db_obj
 
     async def get_all(self) -> List[EntityType]:
-        result = await self.session.execute(select(self.model_class))
+        result = await self.session.execute(self._live(select(self.model_class)))
         return list(result.scalars().all())
 
     async def add(self, entity: EntityType) -> EntityType:
@@ -42,8 +418,30 @@ class BaseSQLRepository(BaseRepository[EntityType], Generic[ModelType, EntityTyp
         await self.session.flush()
         return db_obj
 
-    async def delete(self, id: int) -> bool:
+    async def delete(self, id: Any) -> bool:
+        """
+        Soft delete a row: a single UPDATE sets ``deleted_at``, and the rows referencing
+        it through foreign keys (a request's offers, a client's requests, ...) are marked
+        the same way. Nothing is removed; the purger hard-deletes old rows off-peak.
+        """
+        try:
+            entity_id = int(id)
+        except (TypeError, ValueError):
+            return False
+        table = self.model_class.__table__
+        return await self._soft_delete(table, table.c.id == entity_id, datetime.utcnow()) > 0
+
+    async def _soft_delete(self, table: Table, condition: Any, deleted_at: datetime) -> int:
+        """Mark matching live rows of ``table`` and, recursively, their children deleted."""
         result = await self.session.execute(
-            delete(self.model_class).where(self.model_class.id == id)
+            update(table)
+            .where(condition, table.c.deleted_at.is_(None))
+            .values(deleted_at=deleted_at, updated_at=deleted_at)
+            .returning(table.c.id)
         )
-        return result.rowcount > 0 
\ No newline at end of file
+        ids = result.scalars().all()
+        await invalidate_entities(self.session, table.name, ids)
+        if ids:
+            for column in referencing_columns(table):
+                await self._soft_delete(column.table, column.in_(ids), deleted_at)
+        return len(ids) 
\ No newline at end of file
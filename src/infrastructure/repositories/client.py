@@ -7,6 +7,12 @@ from src.infrastructure.database.models import Client as ClientModel
 from .base_sql import BaseSQLRepository
 
 class ClientRepository(BaseSQLRepository[ClientModel, Client]):
+    entity_class = Client
+    entity_columns = (
+        'id', 'name', 'email', 'phone_number', 'address', 'company_name', 'contact_person',
+        'notes', 'tags', 'created_at', 'updated_at', 'is_active'
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, ClientModel)
 
@@ -26,6 +32,12 @@ class ClientRepository(BaseSQLRepository[ClientModel, Client]):
         # Convert dictionary to list of strings in format "key: value"
         return [f"{k}: {v}" for k, v in tags.items()]
 
+    def _column_transforms(self) -> Dict:
+        return {
+            'phone_number': self._format_phone_number,
+            'tags': self._format_tags
+        }
+
     def _to_entity(self, db_obj: ClientModel) -> Client:
         return Client(
             id=str(db_obj.id),  # Convert integer ID to string
@@ -42,39 +54,11 @@ class ClientRepository(BaseSQLRepository[ClientModel, Client]):
             is_active=db_obj.is_active
         )
 
-    async def get_by_id(self, client_id: str) -> Optional[Client]:
-        try:
-            client_id_int = int(client_id)  # Convert string ID to integer
-        except ValueError:
-            return None
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == client_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        return self._to_entity(db_obj) if db_obj else None
-
-    async def list(self, filters: Dict = None, skip: int = 0, limit: int = 100) -> List[Client]:
-        query = select(self.model_class)
-        
-        if filters:
-            for key, value in filters.items():
-                if '__icontains' in key:
-                    field = key.replace('__icontains', '')
-                    query = query.filter(getattr(self.model_class, field).ilike(f'%{value}%'))
-                else:
-                    query = query.filter(getattr(self.model_class, key) == value)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return [self._to_entity(model) for model in db_models]
-
     async def create(self, entity: Client) -> Optional[Client]:
         try:
             # First check if client with this email already exists
             result = await self.session.execute(
-                select(self.model_class).filter(self.model_class.email == entity.email)
+                self._live(select(self.model_class)).filter(self.model_class.email == entity.email)
             )
             existing = result.scalar_one_or_none()
             if existing:
@@ -93,6 +77,7 @@ class ClientRepository(BaseSQLRepository[ClientModel, Client]):
             )
             self.session.add(db_obj)
             await self.session.flush()
+            await self._invalidate(db_obj.id)
             return self._to_entity(db_obj)
         except IntegrityError:
             await self.session.rollback()
@@ -107,7 +92,7 @@ class ClientRepository(BaseSQLRepository[ClientModel, Client]):
             return None
             
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == client_id_int)
+            self._live(select(self.model_class)).filter(self.model_class.id == client_id_int)
         )
         db_obj = result.scalar_one_or_none()
         if not db_obj:
@@ -120,20 +105,5 @@ class ClientRepository(BaseSQLRepository[ClientModel, Client]):
             setattr(db_obj, field, value)
         
         await self.session.flush()
+        await self._invalidate(client_id_int)
         return self._to_entity(db_obj)
-
-    async def delete(self, client_id: str) -> bool:
-        try:
-            client_id_int = int(client_id)  # Convert string ID to integer
-        except ValueError:
-            return False
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == client_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        if not db_obj:
-            return False
-        await self.session.delete(db_obj)
-        await self.session.flush()
-        return True 
\ No newline at end of file
@@ -1,15 +1,68 @@
-from typing import Optional, List, Dict
+from datetime import datetime, timedelta
+from typing import Any, Optional, List, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Float, Select, and_, case, cast, exists, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
 from src.domain.entities.equipment import Equipment
-from src.infrastructure.database.models import Equipment as EquipmentModel
+from src.domain.services.matching import (
+    CATEGORY_EXACT, CATEGORY_OTHER, SPEC_DIFFERENT, SPEC_EQUAL, SPEC_MISSING, STATUSES, MatchCandidates
+)
+from src.domain.services.specifications import SpecConstraint, requirement_constraints
+from src.infrastructure.database.config import MATCH_PRICE_HISTORY_DAYS
+from src.infrastructure.database.models import (
+    Equipment as EquipmentModel, EquipmentSpecValue as SpecValueModel, Offer as OfferModel
+)
+from src.infrastructure.database.spec_values import replace_spec_values
 from .base_sql import BaseSQLRepository
 
 class EquipmentRepository(BaseSQLRepository[EquipmentModel, Equipment]):
+    entity_class = Equipment
+    entity_columns = (
+        'id', 'name', 'model', 'serial_number', 'manufacturer', 'category', 'status',
+        'purchase_date', 'warranty_end_date', 'location', 'specifications', 'tags',
+        'created_at', 'updated_at', 'is_active'
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, EquipmentModel)
 
+    def _column_transforms(self) -> Dict:
+        return {
+            'specifications': lambda value: value or {},
+            'tags': lambda value: value or {}
+        }
+
+    def _apply_filters(self, query: Select, filters: Optional[Dict[str, Any]]) -> Select:
+        """
+        Also supports ``specifications__range``: SpecConstraints the normalized numeric
+        specifications must all satisfy.
+        """
+        filters = dict(filters or {})
+        constraints = filters.pop('specifications__range', ())
+        query = super()._apply_filters(query, filters)
+        for constraint in constraints:
+            query = query.filter(self.spec_satisfies(constraint))
+        return query
+
+    def spec_satisfies(self, constraint: SpecConstraint):
+        """EXISTS condition: the equipment has a normalized value within ``constraint``."""
+        values = SpecValueModel
+        conditions = [
+            values.equipment_id == self.model_class.id,
+            values.key == constraint.key,
+            values.unit == constraint.unit,
+        ]
+        if constraint.minimum is not None:
+            conditions.append(
+                values.value >= constraint.minimum if constraint.min_inclusive else values.value > constraint.minimum
+            )
+        if constraint.maximum is not None:
+            conditions.append(
+                values.value <= constraint.maximum if constraint.max_inclusive else values.value < constraint.maximum
+            )
+        return exists().where(*conditions)
+
     def _to_entity(self, db_obj: EquipmentModel) -> Equipment:
         return Equipment(
             id=str(db_obj.id),  # Convert integer ID to string
@@ -23,42 +76,17 @@ class EquipmentRepository(BaseSQLRepository[EquipmentModel, Equipment]):
             warranty_end_date=db_obj.warranty_end_date,
             location=db_obj.location,
             specifications=db_obj.specifications or {},
-            tags=db_obj.tags or {}
-        )
-
-    async def get_by_id(self, equipment_id: str) -> Optional[Equipment]:
-        try:
-            equipment_id_int = int(equipment_id)  # Convert string ID to integer
-        except ValueError:
-            return None
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == equipment_id_int)
+            tags=db_obj.tags or {},
+            created_at=db_obj.created_at,
+            updated_at=db_obj.updated_at,
+            is_active=db_obj.is_active
         )
-        db_obj = result.scalar_one_or_none()
-        return self._to_entity(db_obj) if db_obj else None
-
-    async def list(self, filters: Dict = None, skip: int = 0, limit: int = 100) -> List[Equipment]:
-        query = select(self.model_class)
-        
-        if filters:
-            for key, value in filters.items():
-                if '__icontains' in key:
-                    field = key.replace('__icontains', '')
-                    query = query.filter(getattr(self.model_class, field).ilike(f'%{value}%'))
-                else:
-                    query = query.filter(getattr(self.model_class, key) == value)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return [self._to_entity(model) for model in db_models]
 
     async def create(self, entity: Equipment) -> Optional[Equipment]:
         try:
             # First check if equipment with this serial number already exists
             result = await self.session.execute(
-                select(self.model_class).filter(self.model_class.serial_number == entity.serial_number)
+                self._live(select(self.model_class)).filter(self.model_class.serial_number == entity.serial_number)
             )
             existing = result.scalar_one_or_none()
             if existing:
@@ -80,6 +108,8 @@ class EquipmentRepository(BaseSQLRepository[EquipmentModel, Equipment]):
             )
             self.session.add(db_obj)
             await self.session.flush()
+            await replace_spec_values(self.session, {db_obj.id: db_obj.specifications})
+            await self._invalidate(db_obj.id)
             return self._to_entity(db_obj)
         except IntegrityError:
             await self.session.rollback()
@@ -94,7 +124,7 @@ class EquipmentRepository(BaseSQLRepository[EquipmentModel, Equipment]):
             return None
             
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == equipment_id_int)
+            self._live(select(self.model_class)).filter(self.model_class.id == equipment_id_int)
         )
         db_obj = result.scalar_one_or_none()
         if not db_obj:
@@ -105,20 +135,72 @@ class EquipmentRepository(BaseSQLRepository[EquipmentModel, Equipment]):
             setattr(db_obj, field, value)
         
         await self.session.flush()
+        if 'specifications' in update_data:
+            await replace_spec_values(self.session, {equipment_id_int: db_obj.specifications})
+        await self._invalidate(equipment_id_int)
         return self._to_entity(db_obj)
 
-    async def delete(self, equipment_id: str) -> bool:
-        try:
-            equipment_id_int = int(equipment_id)  # Convert string ID to integer
-        except ValueError:
-            return False
-            
+    def match_candidates_query(
+        self, category: str, specifications: Dict[str, Any], currency: str, prices_since: datetime
+    ) -> Select:
+        """
+        Prefilter equipment for a request and compute its matching features as numbers:
+        (id, category code, status code, unit price or -1, one code per specification).
+        Retired and inactive equipment is skipped, and so is equipment of another
+        category unless either side is "other".
+
+        Numeric specifications ("500W", "max 40kg") are met when the normalized values
+        satisfy their constraints, in any unit; others when the value is equal.
+        """
+        model = self.model_class
+        specs = type_coerce(model.specifications, JSONB)
+        constraints = requirement_constraints(specifications)
+
+        def met(key: str, value: Any):
+            if key in constraints:
+                return and_(*(self.spec_satisfies(constraint) for constraint in constraints[key]))
+            return specs.contains({key: value})
+
+        # Average unit price of recent offers in the request's currency; the window
+        # also keeps the scan to the latest offers partitions
+        prices = (
+            select(
+                OfferModel.equipment_id,
+                cast(func.avg(OfferModel.price / OfferModel.quantity), Float).label("unit_price")
+            )
+            .where(
+                OfferModel.currency == currency,
+                OfferModel.created_at >= prices_since,
+                OfferModel.deleted_at.is_(None)
+            )
+            .group_by(OfferModel.equipment_id)
+            .subquery()
+        )
+        query = (
+            select(
+                model.id,
+                case((model.category == category, CATEGORY_EXACT), else_=CATEGORY_OTHER),
+                case({status: code for code, status in enumerate(STATUSES)}, value=model.status,
+                     else_=STATUSES.index("retired")),
+                func.coalesce(prices.c.unit_price, -1.0),
+                *(
+                    case((met(key, value), SPEC_EQUAL), (specs.has_key(key), SPEC_DIFFERENT),
+                         else_=SPEC_MISSING)
+                    for key, value in specifications.items()
+                )
+            )
+            .outerjoin(prices, prices.c.equipment_id == model.id)
+            .where(model.is_active.is_(True), model.status != "retired")
+        )
+        if category != "other":
+            query = query.where(model.category.in_([category, "other"]))
+        return self._live(query)
+
+    async def match_candidates(
+        self, category: str, specifications: Dict[str, Any], currency: str
+    ) -> MatchCandidates:
+        prices_since = datetime.utcnow() - timedelta(days=MATCH_PRICE_HISTORY_DAYS)
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == equipment_id_int)
+            self.match_candidates_query(category, specifications, currency, prices_since)
         )
-        db_obj = result.scalar_one_or_none()
-        if not db_obj:
-            return False
-        await self.session.delete(db_obj)
-        await self.session.flush()
-        return True 
\ No newline at end of file
+        return MatchCandidates.from_rows(result.all(), len(specifications))
@@ -8,31 +8,31 @@ from .offer import OfferRepository
 from .equipment import EquipmentRepository
 
 class RepositoryFactory:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache_reads: bool = False, replica_reads: bool = False):
         self.session = session
+        self.cache_reads = cache_reads
+        self.replica_reads = replica_reads
         self._repositories: Dict[Type[BaseRepository], BaseRepository] = {}
 
+    def _get_repository(self, repository_class: Type[BaseRepository]) -> BaseRepository:
+        if repository_class not in self._repositories:
+            repository = repository_class(self.session)
+            repository.cache_reads = self.cache_reads
+            repository.replica_reads = self.replica_reads
+            self._repositories[repository_class] = repository
+        return self._repositories[repository_class]
+
     def get_user_repository(self) -> UserRepository:
-        if UserRepository not in self._repositories:
-            self._repositories[UserRepository] = UserRepository(self.session)
-        return self._repositories[UserRepository]
+        return self._get_repository(UserRepository)
 
     def get_client_repository(self) -> ClientRepository:
-        if ClientRepository not in self._repositories:
-            self._repositories[ClientRepository] = ClientRepository(self.session)
-        return self._repositories[ClientRepository]
+        return self._get_repository(ClientRepository)
 
     def get_request_repository(self) -> RequestRepository:
-        if RequestRepository not in self._repositories:
-            self._repositories[RequestRepository] = RequestRepository(self.session)
-        return self._repositories[RequestRepository]
+        return self._get_repository(RequestRepository)
 
     def get_offer_repository(self) -> OfferRepository:
-        if OfferRepository not in self._repositories:
-            self._repositories[OfferRepository] = OfferRepository(self.session)
-        return self._repositories[OfferRepository]
+        return self._get_repository(OfferRepository)
 
     def get_equipment_repository(self) -> EquipmentRepository:
-        if EquipmentRepository not in self._repositories:
-            self._repositories[EquipmentRepository] = EquipmentRepository(self.session)
-        return self._repositories[EquipmentRepository] 
\ No newline at end of file
+        return self._get_repository(EquipmentRepository)
\ No newline at end of file
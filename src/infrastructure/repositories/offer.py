@@ -2,10 +2,18 @@ from typing import Optional, List, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from src.domain.entities.offer import Offer
-from src.infrastructure.database.models import Offer as OfferModel
+from src.infrastructure.database.models import Offer as OfferModel, Request as RequestModel
 from .base_sql import BaseSQLRepository
 
 class OfferRepository(BaseSQLRepository[OfferModel, Offer]):
+    entity_class = Offer
+    entity_columns = (
+        'id', 'request_id', 'equipment_id', 'price', 'currency', 'quantity', 'delivery_date',
+        'warranty_period_months', 'status', 'terms_and_conditions', 'notes', 'additional_services',
+        'discount_percentage', 'payment_terms', 'custom_payment_terms', 'created_at', 'updated_at',
+        'is_active'
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, OfferModel)
 
@@ -15,6 +23,11 @@ class OfferRepository(BaseSQLRepository[OfferModel, Offer]):
         # Convert dictionary to list of enabled services
         return [service for service, enabled in services.items() if enabled]
 
+    def _column_transforms(self) -> Dict:
+        return {
+            'additional_services': self._format_additional_services
+        }
+
     def _to_entity(self, db_obj: OfferModel) -> Offer:
         return Offer(
             id=str(db_obj.id),  # Convert integer ID to string
@@ -37,38 +50,16 @@ class OfferRepository(BaseSQLRepository[OfferModel, Offer]):
             is_active=db_obj.is_active
         )
 
-    async def get_by_id(self, offer_id: str) -> Optional[Offer]:
-        try:
-            offer_id_int = int(offer_id)  # Convert string ID to integer
-        except ValueError:
-            return None
-            
+    async def _request_exists(self, request_id: int) -> bool:
+        # requests is partitioned, so offers.request_id has no foreign key to check it
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == offer_id_int)
+            select(RequestModel.id).filter(RequestModel.id == request_id, RequestModel.deleted_at.is_(None))
         )
-        db_obj = result.scalar_one_or_none()
-        return self._to_entity(db_obj) if db_obj else None
+        return result.first() is not None
 
-    async def list(self, filters: Dict = None, skip: int = 0, limit: int = 100) -> List[Offer]:
-        query = select(self.model_class)
-        
-        if filters:
-            for key, value in filters.items():
-                if '__gte' in key:
-                    field = key.replace('__gte', '')
-                    query = query.filter(getattr(self.model_class, field) >= value)
-                elif '__lte' in key:
-                    field = key.replace('__lte', '')
-                    query = query.filter(getattr(self.model_class, field) <= value)
-                else:
-                    query = query.filter(getattr(self.model_class, key) == value)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return [self._to_entity(model) for model in db_models]
-
-    async def create(self, entity: Offer) -> Offer:
+    async def create(self, entity: Offer) -> Optional[Offer]:
+        if not await self._request_exists(entity.request_id):
+            return None
         db_obj = self.model_class(
             request_id=entity.request_id,
             equipment_id=entity.equipment_id,
@@ -88,6 +79,7 @@ class OfferRepository(BaseSQLRepository[OfferModel, Offer]):
         )
         self.session.add(db_obj)
         await self.session.flush()
+        await self._invalidate(db_obj.id)
         return self._to_entity(db_obj)
 
     async def update(self, entity: Offer) -> Optional[Offer]:
@@ -99,33 +91,21 @@ class OfferRepository(BaseSQLRepository[OfferModel, Offer]):
             return None
             
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == offer_id_int)
+            self._live(select(self.model_class)).filter(self.model_class.id == offer_id_int)
         )
         db_obj = result.scalar_one_or_none()
         if not db_obj:
             return None
         
         update_data = entity.model_dump(exclude_unset=True)
+        request_id = update_data.get('request_id')
+        if request_id is not None and request_id != db_obj.request_id and not await self._request_exists(request_id):
+            return None
         for field, value in update_data.items():
             if field == 'additional_services':
                 value = {service: True for service in value}
             setattr(db_obj, field, value)
         
         await self.session.flush()
+        await self._invalidate(offer_id_int)
         return self._to_entity(db_obj)
-
-    async def delete(self, offer_id: str) -> bool:
-        try:
-            offer_id_int = int(offer_id)  # Convert string ID to integer
-        except ValueError:
-            return False
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == offer_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        if not db_obj:
-            return False
-        await self.session.delete(db_obj)
-        await self.session.flush()
-        return True 
\ No newline at end of file
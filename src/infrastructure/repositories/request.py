@@ -1,11 +1,23 @@
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from src.domain.entities.request import Request
-from src.infrastructure.database.models import Request as RequestModel
+from sqlalchemy import Float, Select, and_, case, cast, func, select
+from src.domain.entities.request import Request, RequestSummary
+from src.infrastructure.database.models import Offer as OfferModel, Request as RequestModel
 from .base_sql import BaseSQLRepository
 
+# Offer figures of a RequestSummary, selected after the request columns
+SUMMARY_COLUMNS = (
+    'offer_count', 'min_price', 'max_price', 'avg_price', 'best_offer_id', 'latest_offer_id', 'latest_offer_status'
+)
+
 class RequestRepository(BaseSQLRepository[RequestModel, Request]):
+    entity_class = Request
+    entity_columns = (
+        'id', 'title', 'description', 'client_id', 'equipment_category', 'required_specifications',
+        'quantity', 'priority', 'status', 'budget_min', 'budget_max', 'currency',
+        'desired_delivery_date', 'notes', 'tags', 'created_at', 'updated_at'
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, RequestModel)
 
@@ -20,6 +32,86 @@ class RequestRepository(BaseSQLRepository[RequestModel, Request]):
         }
         return category_mapping.get(category.lower(), 'other')
 
+    async def get_stored_category(self, request_id: Any) -> Optional[str]:
+        """The equipment category as stored; entities collapse most of them to "other"."""
+        try:
+            request_id = int(request_id)
+        except (TypeError, ValueError):
+            return None
+        result = await self.session.execute(
+            self._live(select(self.model_class.equipment_category)).filter(self.model_class.id == request_id)
+        )
+        return result.scalar_one_or_none()
+
+    def summary_query(
+        self,
+        filters: Dict = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> Select:
+        """
+        One page of requests, as list() pages them, each with figures over its live
+        offers (see RequestSummary) in trailing columns.
+
+        The page is a CTE, so its rows are filtered and paged once. Offers of the page's
+        requests are read once through the request_id index; window functions over each
+        request's offers compute the aggregates, the cheapest and the newest offer on
+        every row, and the first row per request is kept.
+        """
+        page = self._paginate(self._apply_filters(self._row_select(), filters), skip, limit, after_id, filters).cte("page")
+        offer = OfferModel
+        # Prices in another currency than the request's are not comparable and count as missing
+        price = case((offer.currency == page.c.currency, offer.price))
+        per_request = {"partition_by": offer.request_id}
+        cheapest = {**per_request, "order_by": (price.is_(None), price, offer.id)}
+        newest = {**per_request, "order_by": (offer.created_at.desc(), offer.id.desc())}
+        stats = (
+            select(
+                offer.request_id,
+                func.row_number().over(**per_request, order_by=offer.id).label("position"),
+                func.count().over(**per_request).label("offer_count"),
+                func.min(price).over(**per_request).label("min_price"),
+                func.max(price).over(**per_request).label("max_price"),
+                cast(func.avg(price).over(**per_request), Float).label("avg_price"),
+                func.first_value(case((offer.currency == page.c.currency, offer.id))).over(**cheapest).label("best_offer_id"),
+                func.first_value(offer.id).over(**newest).label("latest_offer_id"),
+                func.first_value(offer.status).over(**newest).label("latest_offer_status"),
+            )
+            .join(page, page.c.id == offer.request_id)
+            .where(offer.deleted_at.is_(None))
+            .subquery("offer_stats")
+        )
+        return (
+            select(
+                *(page.c[name] for name in self.entity_columns),
+                func.coalesce(stats.c.offer_count, 0).label("offer_count"),
+                *(stats.c[name] for name in SUMMARY_COLUMNS[1:])
+            )
+            .outerjoin(stats, and_(stats.c.request_id == page.c.id, stats.c.position == 1))
+            .order_by(page.c.id)
+        )
+
+    async def list_summaries(
+        self,
+        filters: Dict = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> List[RequestSummary]:
+        """
+        Requests with their offer figures, in one query. Not served from the result
+        cache, which is only invalidated by writes to requests, not to offers.
+        """
+        rows = (await self.session.execute(self.summary_query(filters, skip, limit, after_id))).all()
+        # The entity columns come first, the offer figures trail them
+        requests = self._rows_to_entities(rows)
+        figures = len(self.entity_columns)
+        return [
+            RequestSummary(request=request, **dict(zip(SUMMARY_COLUMNS, row[figures:])))
+            for request, row in zip(requests, rows)
+        ]
+
     def _format_priority(self, priority: str) -> str:
         """Format priority to match the required pattern."""
         priority_mapping = {
@@ -41,6 +133,14 @@ class RequestRepository(BaseSQLRepository[RequestModel, Request]):
             return []
         return [f"{key}: {value}" for key, value in tags.items()]
 
+    def _column_transforms(self) -> Dict:
+        return {
+            'equipment_category': self._format_equipment_category,
+            'priority': self._format_priority,
+            'status': self._format_status,
+            'tags': self._format_tags
+        }
+
     def _to_entity(self, db_obj: RequestModel) -> Request:
         return Request(
             id=str(db_obj.id),  # Convert integer ID to string
@@ -62,37 +162,6 @@ class RequestRepository(BaseSQLRepository[RequestModel, Request]):
             updated_at=db_obj.updated_at
         )
 
-    async def get_by_id(self, request_id: str) -> Optional[Request]:
-        try:
-            request_id_int = int(request_id)  # Convert string ID to integer
-        except ValueError:
-            return None
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == request_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        return self._to_entity(db_obj) if db_obj else None
-
-    async def list(self, filters: Dict = None, skip: int = 0, limit: int = 100) -> List[Request]:
-        query = select(self.model_class)
-        
-        if filters:
-            for key, value in filters.items():
-                if '__gte' in key:
-                    field = key.replace('__gte', '')
-                    query = query.filter(getattr(self.model_class, field) >= value)
-                elif '__lte' in key:
-                    field = key.replace('__lte', '')
-                    query = query.filter(getattr(self.model_class, field) <= value)
-                else:
-                    query = query.filter(getattr(self.model_class, key) == value)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return [self._to_entity(model) for model in db_models]
-
     async def create(self, entity: Request) -> Request:
         db_obj = self.model_class(
             title=entity.title,
@@ -112,6 +181,7 @@ class RequestRepository(BaseSQLRepository[RequestModel, Request]):
         )
         self.session.add(db_obj)
         await self.session.flush()
+        await self._invalidate(db_obj.id)
         return self._to_entity(db_obj)
 
     async def update(self, entity: Request) -> Optional[Request]:
@@ -123,7 +193,7 @@ class RequestRepository(BaseSQLRepository[RequestModel, Request]):
             return None
             
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == request_id_int)
+            self._live(select(self.model_class)).filter(self.model_class.id == request_id_int)
         )
         db_obj = result.scalar_one_or_none()
         if not db_obj:
@@ -136,20 +206,5 @@ class RequestRepository(BaseSQLRepository[RequestModel, Request]):
             setattr(db_obj, field, value)
         
         await self.session.flush()
+        await self._invalidate(request_id_int)
         return self._to_entity(db_obj)
-
-    async def delete(self, request_id: str) -> bool:
-        try:
-            request_id_int = int(request_id)  # Convert string ID to integer
-        except ValueError:
-            return False
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == request_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        if not db_obj:
-            return False
-        await self.session.delete(db_obj)
-        await self.session.flush()
-        return True 
\ No newline at end of file
@@ -6,6 +6,12 @@ from src.infrastructure.database.models import User as UserModel
 from .base_sql import BaseSQLRepository
 
 class UserRepository(BaseSQLRepository[UserModel, User]):
+    entity_class = User
+    entity_columns = (
+        'id', 'username', 'email', 'full_name', 'hashed_password', 'role', 'phone_number',
+        'created_at', 'updated_at', 'is_active'
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, UserModel)
 
@@ -22,6 +28,11 @@ class UserRepository(BaseSQLRepository[UserModel, User]):
             cleaned = '+' + cleaned[2:].lstrip('0')
         return cleaned
 
+    def _column_transforms(self) -> Dict:
+        return {
+            'phone_number': self._format_phone_number
+        }
+
     def _to_entity(self, db_obj: UserModel) -> User:
         return User(
             id=str(db_obj.id),  # Convert integer ID to string
@@ -36,41 +47,13 @@ class UserRepository(BaseSQLRepository[UserModel, User]):
             is_active=db_obj.is_active
         )
 
-    async def get_by_id(self, user_id: str) -> Optional[User]:
-        try:
-            user_id_int = int(user_id)  # Convert string ID to integer
-        except ValueError:
-            return None
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == user_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        return self._to_entity(db_obj) if db_obj else None
-
     async def get_by_username(self, username: str) -> Optional[User]:
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.username == username)
+            self._live(select(self.model_class)).filter(self.model_class.username == username)
         )
         db_obj = result.scalar_one_or_none()
         return self._to_entity(db_obj) if db_obj else None
 
-    async def list(self, filters: Dict = None, skip: int = 0, limit: int = 100) -> List[User]:
-        query = select(self.model_class)
-        
-        if filters:
-            for key, value in filters.items():
-                if '__icontains' in key:
-                    field = key.replace('__icontains', '')
-                    query = query.filter(getattr(self.model_class, field).ilike(f'%{value}%'))
-                else:
-                    query = query.filter(getattr(self.model_class, key) == value)
-        
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return [self._to_entity(model) for model in db_models]
-
     async def create(self, entity: User) -> User:
         db_obj = self.model_class(
             username=entity.username,
@@ -83,6 +66,7 @@ class UserRepository(BaseSQLRepository[UserModel, User]):
         )
         self.session.add(db_obj)
         await self.session.flush()
+        await self._invalidate(db_obj.id)
         return self._to_entity(db_obj)
 
     async def update(self, entity: User) -> Optional[User]:
@@ -94,7 +78,7 @@ class UserRepository(BaseSQLRepository[UserModel, User]):
             return None
             
         result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == user_id_int)
+            self._live(select(self.model_class)).filter(self.model_class.id == user_id_int)
         )
         db_obj = result.scalar_one_or_none()
         if not db_obj:
@@ -107,20 +91,5 @@ class UserRepository(BaseSQLRepository[UserModel, User]):
             setattr(db_obj, field, value)
         
         await self.session.flush()
+        await self._invalidate(user_id_int)
         return self._to_entity(db_obj)
-
-    async def delete(self, user_id: str) -> bool:
-        try:
-            user_id_int = int(user_id)  # Convert string ID to integer
-        except ValueError:
-            return False
-            
-        result = await self.session.execute(
-            select(self.model_class).filter(self.model_class.id == user_id_int)
-        )
-        db_obj = result.scalar_one_or_none()
-        if not db_obj:
-            return False
-        await self.session.delete(db_obj)
-        await self.session.flush()
-        return True 
\ No newline at end of file
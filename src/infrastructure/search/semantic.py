@@ -0,0 +1,371 @@
+import asyncio
+import copy
+import logging
+import math
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.services.embeddings import TextEncoder, create_encoder, document_text
+from src.infrastructure.database.config import (
+    SEMANTIC_BUILD_BATCH_SIZE, SEMANTIC_DIMENSIONS, SEMANTIC_ENCODER, SEMANTIC_INDEX_RECHECK,
+    SEMANTIC_LOG_COMPACT_RECORDS, SEMANTIC_SNAPSHOT_DIR, SEMANTIC_SNAPSHOT_MAX_AGE
+)
+from src.infrastructure.database.models import Equipment, Request
+from .snapshots import DELETE, UPSERT, IndexSnapshot, SnapshotStore, record_dtype
+from .vector_index import LayeredVectorIndex, VectorIndex
+
+logger = logging.getLogger(__name__)
+
+# Updates re-encoding at least this many rows encode in a thread, off the event loop
+ENCODE_IN_THREAD_ROWS = 256
+
+def row_version(updated_at: Optional[datetime]) -> float:
+    """A row's updated_at (naive UTC) as a Unix timestamp, for comparing versions."""
+    if updated_at is None:
+        return 0.0
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return updated_at.timestamp()
+
+def _fit_encode(encoder: TextEncoder, texts: List[str]) -> np.ndarray:
+    encoder.fit(texts)
+    return encoder.encode(texts)
+
+class SemanticIndex:
+    """
+    Vectors of the text of every live row of a table (the model's ``semantic_fields``),
+    built on first use and then kept current incrementally.
+
+    Every write already goes through the entity cache invalidation (locally, and from
+    other workers through NOTIFY), which marks the row here. The next search re-reads
+    marked rows and re-encodes, or drops, just those. A row stays marked for
+    ``recheck`` seconds after its last write, since a lagging replica may still return
+    the old version. When invalidations may have been missed, the index is reloaded.
+
+    With a SnapshotStore, workers don't build their own index: the first one to need
+    it writes a snapshot that every worker memory-maps read-only, then each applies
+    the delta log and whatever changed in the database since on top (see ``_load``).
+    One worker appends the changes it applies to the log, and folds the log into a
+    new snapshot once it holds ``compact_records`` records.
+    """
+
+    def __init__(
+        self,
+        model_class: Type[Any],
+        encoder: TextEncoder,
+        batch_size: int = 1000,
+        recheck: float = 30.0,
+        store: Optional[SnapshotStore] = None,
+        max_age: Optional[float] = None,
+        compact_records: int = 50_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.model_class = model_class
+        self.table = model_class.__tablename__
+        self.encoder = encoder
+        self.batch_size = batch_size
+        self.recheck = recheck
+        self.store = store
+        self.max_age = max_age
+        self.compact_records = compact_records
+        self._clock = clock
+        self.index: Optional[Union[VectorIndex, LayeredVectorIndex]] = None
+        # The snapshot the index is layered on, if it was loaded from one
+        self.snapshot: Optional[IndexSnapshot] = None
+        # Versions of the rows changed since the snapshot
+        self._versions: Dict[int, float] = {}
+        # Row id -> when it was last written
+        self._written: Dict[int, float] = {}
+        self._stale = True
+        self._lock = asyncio.Lock()
+        self.builds = 0
+        self.loads = 0
+        self.build_seconds = 0.0
+        self.rows_refreshed = 0
+
+    def mark_written(self, row_id: int) -> None:
+        self._written[row_id] = self._clock()
+
+    def mark_stale(self) -> None:
+        self._stale = True
+
+    async def refresh(self, session: AsyncSession) -> Union[VectorIndex, LayeredVectorIndex]:
+        """Bring the index up to date with the database and return it."""
+        if not self._stale and not self._written and self.index is not None:
+            return self.index
+        async with self._lock:
+            if self._stale or self.index is None:
+                await self._open(session)
+            elif self.snapshot is not None and await asyncio.to_thread(self._republished):
+                # Another worker compacted: move to its snapshot rather than pile up changes
+                if not await self._load(session):
+                    await self._update(session)
+            elif self._written:
+                await self._update(session)
+            if self.snapshot is not None and self.store.log_size() >= self.compact_records and self.store.is_writer():
+                await self._compact(session)
+        return self.index
+
+    def _republished(self) -> bool:
+        return self.store.log_generation() > self.snapshot.generation
+
+    def _select(self, live: bool = True):
+        columns = [getattr(self.model_class, name) for name in self.model_class.semantic_fields]
+        query = select(self.model_class.id, self.model_class.updated_at, self.model_class.deleted_at, *columns)
+        return query.where(self.model_class.deleted_at.is_(None)) if live else query
+
+    async def _open(self, session: AsyncSession) -> None:
+        # Writes from here on are applied on top of what is opened
+        self._stale = False
+        if self.store is None:
+            await self._build(session)
+            return
+        if await self._load(session):
+            return
+        async with self.store.build_lock():
+            # Another worker may have published a snapshot while this one waited
+            if not await self._load(session):
+                await self._build(session)
+
+    async def _build(self, session: AsyncSession) -> None:
+        self._written.clear()
+        started = time.perf_counter()
+        ids: List[int] = []
+        versions: List[float] = []
+        texts: List[str] = []
+        after_id = 0
+        try:
+            as_of = time.time()
+            while True:
+                result = await session.execute(
+                    self._select().where(self.model_class.id > after_id)
+                    .order_by(self.model_class.id).limit(self.batch_size)
+                )
+                rows = result.all()
+                for row in rows:
+                    ids.append(row[0])
+                    versions.append(row_version(row[1]))
+                    texts.append(document_text(row[3:]))
+                if len(rows) < self.batch_size:
+                    break
+                after_id = rows[-1][0]
+            # Fitting and encoding are CPU-bound, so they run in a thread, on a copy of the
+            # encoder: searches meanwhile keep encoding queries like the current index
+            encoder = copy.copy(self.encoder)
+            vectors = await asyncio.to_thread(_fit_encode, encoder, texts)
+        except BaseException:
+            self._stale = True
+            raise
+        self.encoder.set_state(encoder.get_state())
+        self.builds += 1
+        self.build_seconds = time.perf_counter() - started
+        logger.info("Built the %s semantic index: %d rows in %.1fs", self.table, len(ids), self.build_seconds)
+
+        self.index, self.snapshot, self._versions = VectorIndex.from_arrays(ids, vectors), None, {}
+        if self.store is not None:
+            snapshot = IndexSnapshot(
+                generation=await asyncio.to_thread(self.store.current_generation) + 1,
+                as_of=as_of,
+                encoder=self.encoder.name,
+                ids=np.array(ids, dtype=np.int64),
+                versions=np.array(versions, dtype=np.float64),
+                vectors=vectors,
+                state=self.encoder.get_state(),
+            )
+            await asyncio.to_thread(self.store.save, snapshot)
+            # Share the published pages rather than keep a private copy
+            await self._load(session)
+
+    def _known_version(self, row_id: int) -> Optional[float]:
+        version = self._versions.get(row_id)
+        if version is None and self.snapshot is not None:
+            row = self.index.base_row(row_id)
+            if row is not None:
+                version = float(self.snapshot.versions[row])
+        return version
+
+    async def _load(self, session: AsyncSession) -> bool:
+        """
+        Open the published snapshot and bring it up to date: replay the delta log, where
+        a record only wins over an older version of its row, then re-read the rows the
+        database changed since the snapshot that the log does not already reflect.
+        Returns False if there is no usable snapshot.
+        """
+        loaded = await asyncio.to_thread(self.store.load)
+        if loaded is None:
+            return False
+        snapshot, records = loaded
+        if snapshot.encoder != self.encoder.name or (self.max_age and time.time() - snapshot.as_of > self.max_age):
+            return False
+        try:
+            self.index, self.snapshot, self._versions = LayeredVectorIndex(snapshot.ids, snapshot.vectors), snapshot, {}
+            self.encoder.set_state(snapshot.state)
+            for op, row_id, version, vector in zip(
+                records["op"].tolist(), records["id"].tolist(), records["version"].tolist(), records["vector"]
+            ):
+                known = self._known_version(row_id)
+                if known is not None and version < known:
+                    continue
+                if op == UPSERT:
+                    self.index.upsert(row_id, vector)
+                else:
+                    self.index.remove(row_id)
+                self._versions[row_id] = version
+
+            since = datetime.utcfromtimestamp(max(0.0, snapshot.as_of - self.recheck))
+            result = await session.execute(
+                select(self.model_class.id, self.model_class.updated_at).where(self.model_class.updated_at >= since)
+            )
+            for row_id, updated_at in result.all():
+                known = self._known_version(row_id)
+                if known is None or known < row_version(updated_at):
+                    self.mark_written(row_id)
+        except BaseException:
+            self.index, self.snapshot, self._stale = None, None, True
+            raise
+        self.loads += 1
+        logger.info(
+            "Loaded the %s semantic index: %d rows from snapshot %d, %d log records, %d rows to re-read",
+            self.table, len(snapshot.ids), snapshot.generation, len(records), len(self._written)
+        )
+        if self._written:
+            await self._update(session)
+        return True
+
+    async def _update(self, session: AsyncSession) -> None:
+        written = dict(self._written)
+        result = await session.execute(self._select(live=False).where(self.model_class.id.in_(written)))
+        rows = {row[0]: row for row in result.all()}
+        dtype = record_dtype(self.encoder.dimensions)
+        records = np.zeros(len(written), dtype=dtype)
+        count = 0
+        upserts = [row for row in rows.values() if row[2] is None]
+        texts = [document_text(row[3:]) for row in upserts]
+        if len(texts) >= ENCODE_IN_THREAD_ROWS:
+            vectors = await asyncio.to_thread(self.encoder.encode, texts)
+        else:
+            vectors = self.encoder.encode(texts) if texts else None
+        for position, row in enumerate(upserts):
+            version = row_version(row[1])
+            known = self._known_version(row[0])
+            # A lagging replica may return a version older than the one indexed
+            if known is not None and version < known:
+                continue
+            self.index.upsert(row[0], vectors[position])
+            records[count] = (UPSERT, b"", row[0], version, vectors[position])
+            count += 1
+            self._versions[row[0]] = version
+        for row_id in written:
+            row = rows.get(row_id)
+            if row is not None and row[2] is None:
+                continue
+            # Soft-deleted rows keep their version; rows gone entirely cannot come back
+            version = row_version(row[1]) if row is not None else math.inf
+            known = self._known_version(row_id)
+            if known is not None and version < known:
+                continue
+            self.index.remove(row_id)
+            records[count] = (DELETE, b"", row_id, version, 0)
+            count += 1
+            self._versions[row_id] = version
+        if count and self.snapshot is not None and self.store.is_writer():
+            await asyncio.to_thread(self.store.append, records[:count], self.snapshot.generation)
+        self.rows_refreshed += len(written)
+        # Forget rows whose last write is old enough for every replica to have it
+        expired = self._clock() - self.recheck
+        for row_id, written_at in written.items():
+            if written_at <= expired and self._written.get(row_id) == written_at:
+                del self._written[row_id]
+
+    async def _compact(self, session: AsyncSession) -> None:
+        """Publish the current index as a new snapshot with an empty log."""
+        index, snapshot = self.index, self.snapshot
+        # Every write before this time is in the index, except possibly those still marked
+        as_of = time.time() - self.recheck
+        if self._written:
+            as_of -= self._clock() - min(self._written.values())
+        visible = index.visible
+        changed = index.changes.ids
+        compacted = IndexSnapshot(
+            generation=snapshot.generation + 1,
+            as_of=as_of,
+            encoder=self.encoder.name,
+            ids=np.concatenate([snapshot.ids[visible], changed]),
+            versions=np.concatenate([snapshot.versions[visible], [self._versions[int(row_id)] for row_id in changed]]),
+            vectors=np.concatenate([snapshot.vectors[visible], index.changes.vectors]),
+            state=self.encoder.get_state(),
+        )
+        async with self.store.build_lock():
+            compacted.generation = max(compacted.generation, await asyncio.to_thread(self.store.current_generation) + 1)
+            await asyncio.to_thread(self.store.save, compacted)
+        await self._load(session)
+
+    async def similar_to_row(self, session: AsyncSession, row_id: int, k: int) -> Optional[List[Tuple[int, float]]]:
+        """The ``k`` rows most similar to a row, or None if the row is not indexed."""
+        index = await self.refresh(session)
+        vector = index.vector(row_id)
+        if vector is None:
+            return None
+        return index.search(vector, k, exclude=(row_id,))
+
+    async def similar_to_text(self, session: AsyncSession, text: str, k: int) -> List[Tuple[int, float]]:
+        index = await self.refresh(session)
+        return index.search(self.encoder.encode([text])[0], k)
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "encoder": self.encoder.name,
+            "dimensions": self.encoder.dimensions,
+            "rows": len(self.index) if self.index is not None else 0,
+            "built": self.index is not None and not self._stale,
+            "builds": self.builds,
+            "build_seconds": round(self.build_seconds, 3),
+            "rows_refreshed": self.rows_refreshed,
+            "pending_rows": len(self._written),
+            "snapshot_generation": self.snapshot.generation if self.snapshot is not None else None,
+            "snapshot_loads": self.loads,
+            "log_records": self.store.log_size() if self.snapshot is not None else None,
+        }
+
+def create_semantic_indexes(models: Sequence[Type[Any]] = (Request, Equipment)) -> Dict[str, SemanticIndex]:
+    return {
+        model.__tablename__: SemanticIndex(
+            model,
+            create_encoder(SEMANTIC_ENCODER, SEMANTIC_DIMENSIONS),
+            batch_size=SEMANTIC_BUILD_BATCH_SIZE,
+            recheck=SEMANTIC_INDEX_RECHECK,
+            store=SnapshotStore(SEMANTIC_SNAPSHOT_DIR, model.__tablename__, SEMANTIC_DIMENSIONS)
+            if SEMANTIC_SNAPSHOT_DIR else None,
+            max_age=SEMANTIC_SNAPSHOT_MAX_AGE,
+            compact_records=SEMANTIC_LOG_COMPACT_RECORDS,
+        )
+        for model in models
+    }
+
+semantic_indexes: Dict[str, SemanticIndex] = create_semantic_indexes()
+
+def mark_written(table: str, row_id: Any) -> None:
+    index = semantic_indexes.get(table)
+    if index is not None:
+        try:
+            index.mark_written(int(row_id))
+        except ValueError:
+            pass
+
+def mark_all_stale() -> None:
+    for index in semantic_indexes.values():
+        index.mark_stale()
+
+def close_semantic_indexes() -> None:
+    for index in semantic_indexes.values():
+        index.close()
+
+def semantic_index_stats() -> Dict[str, Dict[str, Any]]:
+    return {table: index.stats() for table, index in semantic_indexes.items()}
@@ -0,0 +1,261 @@
+import asyncio
+import fcntl
+import logging
+import mmap
+import os
+import struct
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, BinaryIO, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Snapshot file: a 64-byte header, then ids (int64), row versions (float64), vectors
+# (float32, row-major) and the encoder state (float32), each starting on a 64-byte
+# boundary so the arrays can be used in place from a memory map. Ids are sorted.
+SNAPSHOT_MAGIC = b"VECSNAP1"
+_SNAPSHOT_HEADER = struct.Struct("<8sIIQQd16s")  # magic, dimensions, state length, rows, generation, as of, encoder
+ALIGNMENT = 64
+
+# Delta log: a 32-byte header naming the snapshot generation it applies to, then
+# fixed-size records appended in the order the changes were applied
+LOG_MAGIC = b"VECLOG01"
+_LOG_HEADER = struct.Struct("<8sQI12x")  # magic, generation, dimensions
+UPSERT, DELETE = 1, 2
+
+def record_dtype(dimensions: int) -> np.dtype:
+    """
+    One change: the operation, the row id, the row's version (updated_at as a Unix
+    timestamp, +inf for rows gone for good) and, for upserts, the row's vector.
+    """
+    return np.dtype([("op", "u1"), ("pad", "V7"), ("id", "<i8"), ("version", "<f8"), ("vector", "<f4", (dimensions,))])
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+@dataclass
+class IndexSnapshot:
+    """The arrays of a snapshot file; memory-mapped read-only when opened from disk."""
+    generation: int
+    # Unix time before which every write is reflected in the snapshot and its log
+    as_of: float
+    encoder: str
+    ids: np.ndarray
+    versions: np.ndarray
+    vectors: np.ndarray
+    state: Optional[np.ndarray]
+
+def _write_array(file: BinaryIO, array: np.ndarray) -> None:
+    file.write(b"\0" * (_aligned(file.tell()) - file.tell()))
+    array.tofile(file)
+
+def _fsync_directory(path: str) -> None:
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _replace(path: str, write) -> None:
+    """Write a file next to ``path`` and move it over ``path``, so readers see the old or new file whole."""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+    _fsync_directory(path)
+
+def write_snapshot(path: str, snapshot: IndexSnapshot) -> None:
+    order = np.argsort(snapshot.ids, kind="stable")
+    ids = np.ascontiguousarray(snapshot.ids[order], dtype=np.int64)
+    versions = np.ascontiguousarray(snapshot.versions[order], dtype=np.float64)
+    vectors = np.ascontiguousarray(snapshot.vectors[order], dtype=np.float32)
+    state = np.ascontiguousarray(snapshot.state, dtype=np.float32) if snapshot.state is not None else None
+
+    def write(file: BinaryIO) -> None:
+        file.write(_SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, vectors.shape[1], 0 if state is None else len(state), len(ids),
+            snapshot.generation, snapshot.as_of, snapshot.encoder.encode()[:16]
+        ))
+        for array in (ids, versions, vectors) + ((state,) if state is not None else ()):
+            _write_array(file, array)
+
+    _replace(path, write)
+
+def open_snapshot(path: str) -> Optional[IndexSnapshot]:
+    """Map a snapshot file read-only; None if there is none or it is unreadable."""
+    try:
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    try:
+        magic, dimensions, state_length, rows, generation, as_of, encoder = _SNAPSHOT_HEADER.unpack_from(mapped)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not a snapshot file")
+        offset = _aligned(_SNAPSHOT_HEADER.size)
+        arrays = []
+        for dtype, count in ((np.int64, rows), (np.float64, rows), (np.float32, rows * dimensions),
+                             (np.float32, state_length)):
+            offset = _aligned(offset)
+            # An empty array may start past the end of the file
+            arrays.append(np.frombuffer(mapped, dtype=dtype, count=count, offset=offset) if count else np.zeros(0, dtype))
+            offset += count * np.dtype(dtype).itemsize
+    except (struct.error, ValueError) as e:
+        logger.warning("Ignoring unreadable index snapshot %s: %r", path, e)
+        return None
+    ids, versions, vectors, state = arrays
+    return IndexSnapshot(
+        generation=generation,
+        as_of=as_of,
+        encoder=encoder.rstrip(b"\0").decode(),
+        ids=ids,
+        versions=versions,
+        vectors=vectors.reshape(rows, dimensions),
+        state=state if state_length else None,
+    )
+
+def create_log(path: str, generation: int, dimensions: int) -> None:
+    _replace(path, lambda file: file.write(_LOG_HEADER.pack(LOG_MAGIC, generation, dimensions)))
+
+def read_log(path: str, generation: int, dimensions: int) -> np.ndarray:
+    """
+    The records of the log of a snapshot generation, oldest first. A log of another
+    generation is ignored; a record cut short by a crash is dropped.
+    """
+    dtype = record_dtype(dimensions)
+    try:
+        with open(path, "rb") as file:
+            header = file.read(_LOG_HEADER.size)
+            if len(header) < _LOG_HEADER.size or _LOG_HEADER.unpack(header) != (LOG_MAGIC, generation, dimensions):
+                return np.zeros(0, dtype=dtype)
+            count = (os.fstat(file.fileno()).st_size - _LOG_HEADER.size) // dtype.itemsize
+            return np.fromfile(file, dtype=dtype, count=count)
+    except FileNotFoundError:
+        return np.zeros(0, dtype=dtype)
+
+class SnapshotStore:
+    """
+    The snapshot and delta log of one index in a directory shared by the workers of a
+    host, and the file locks coordinating them:
+
+    - ``<table>.build.lock`` is held while a snapshot is written, so workers starting
+      together wait for one build instead of each doing their own.
+    - ``<table>.writer.lock`` is held by the one worker appending to the log; another
+      takes over if it exits. Locks are released by the OS when a process dies.
+    """
+
+    def __init__(self, directory: str, table: str, dimensions: int):
+        self.directory = directory
+        self.dimensions = dimensions
+        base = os.path.join(directory, table)
+        self.snapshot_path = f"{base}.snapshot"
+        self.log_path = f"{base}.log"
+        self._build_lock_path = f"{base}.build.lock"
+        self._writer_lock_path = f"{base}.writer.lock"
+        self._writer_lock: Optional[int] = None
+        self._log: Optional[BinaryIO] = None
+        self._log_generation: Optional[int] = None
+
+    @asynccontextmanager
+    async def build_lock(self) -> AsyncIterator[None]:
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(self._build_lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Blocks for as long as another worker builds, so wait in a thread
+            await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def is_writer(self) -> bool:
+        """Whether this worker appends to the log, taking the role if it is free."""
+        if self._writer_lock is not None:
+            return True
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(self._writer_lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._writer_lock = fd
+        return True
+
+    def load(self) -> Optional[Tuple[IndexSnapshot, np.ndarray]]:
+        snapshot = open_snapshot(self.snapshot_path)
+        if snapshot is None or snapshot.vectors.shape[1] != self.dimensions:
+            return None
+        return snapshot, read_log(self.log_path, snapshot.generation, self.dimensions)
+
+    def current_generation(self) -> int:
+        snapshot = open_snapshot(self.snapshot_path)
+        return snapshot.generation if snapshot is not None else 0
+
+    def log_generation(self) -> int:
+        """The generation of the published log, which is replaced along with the snapshot; 0 if none."""
+        try:
+            with open(self.log_path, "rb") as file:
+                header = file.read(_LOG_HEADER.size)
+        except FileNotFoundError:
+            return 0
+        if len(header) < _LOG_HEADER.size:
+            return 0
+        magic, generation, _ = _LOG_HEADER.unpack(header)
+        return generation if magic == LOG_MAGIC else 0
+
+    def save(self, snapshot: IndexSnapshot) -> None:
+        """Publish a snapshot with an empty log. Call with the build lock held."""
+        write_snapshot(self.snapshot_path, snapshot)
+        create_log(self.log_path, snapshot.generation, self.dimensions)
+
+    def append(self, records: np.ndarray, generation: int) -> None:
+        """
+        Append records to the log of ``generation``. Nothing is written once another
+        snapshot has been published: the records may predate it, and loads catch up
+        from the database anyway.
+        """
+        if self._log is None or self._log_generation != generation or self._log_replaced():
+            self._close_log()
+            if not self._log_matches(generation):
+                return
+            self._log, self._log_generation = open(self.log_path, "ab"), generation
+        self._log.write(records.tobytes())
+        self._log.flush()
+
+    def log_size(self) -> int:
+        try:
+            return max(0, (os.path.getsize(self.log_path) - _LOG_HEADER.size) // record_dtype(self.dimensions).itemsize)
+        except FileNotFoundError:
+            return 0
+
+    def _log_matches(self, generation: int) -> bool:
+        try:
+            with open(self.log_path, "rb") as file:
+                header = file.read(_LOG_HEADER.size)
+        except FileNotFoundError:
+            return False
+        return len(header) == _LOG_HEADER.size and _LOG_HEADER.unpack(header) == (LOG_MAGIC, generation, self.dimensions)
+
+    def _log_replaced(self) -> bool:
+        try:
+            return os.stat(self.log_path).st_ino != os.fstat(self._log.fileno()).st_ino
+        except FileNotFoundError:
+            return True
+
+    def _close_log(self) -> None:
+        if self._log is not None:
+            self._log.close()
+        self._log, self._log_generation = None, None
+
+    def close(self) -> None:
+        self._close_log()
+        if self._writer_lock is not None:
+            os.close(self._writer_lock)
+            self._writer_lock = None
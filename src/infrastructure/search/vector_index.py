@@ -0,0 +1,190 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+def top_k(scores: np.ndarray, ids: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    """The ``k`` best (id, score) pairs with a positive score, best first, ties by id."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+    top = top[np.lexsort((ids[top], -scores[top]))]
+    return [(int(ids[row]), float(scores[row])) for row in top if scores[row] > 0]
+
+class VectorIndex:
+    """
+    Unit vectors keyed by row id, held in one contiguous float32 matrix so a search is
+    a single matrix-vector product over every row followed by a partial sort.
+
+    Rows are added and removed in place: the matrix grows by doubling, and a removed
+    row is replaced by the last one, so the matrix never has holes. Exact (brute force)
+    search stays in the low milliseconds up to a few hundred thousand rows.
+    """
+
+    def __init__(self, dimensions: int, capacity: int = 1024):
+        self.dimensions = dimensions
+        self._vectors = np.zeros((max(capacity, 1), dimensions), dtype=np.float32)
+        self._ids = np.zeros(max(capacity, 1), dtype=np.int64)
+        self._size = 0
+        self._rows: Dict[int, int] = {}
+
+    @classmethod
+    def from_arrays(cls, ids: np.ndarray, vectors: np.ndarray) -> "VectorIndex":
+        index = cls(vectors.shape[1], capacity=len(ids))
+        index.upsert_many(ids, vectors)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, row_id: int) -> bool:
+        return row_id in self._rows
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[:self._size]
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        self._vectors, self._ids = vectors, ids
+
+    def upsert(self, row_id: int, vector: np.ndarray) -> None:
+        self.upsert_many([row_id], vector.reshape(1, -1))
+
+    def upsert_many(self, row_ids: Iterable[int], vectors: np.ndarray) -> None:
+        row_ids = [int(row_id) for row_id in row_ids]
+        self._reserve(self._size + len(row_ids))
+        for row_id, vector in zip(row_ids, vectors):
+            row = self._rows.get(row_id)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self._rows[row_id] = row
+                self._ids[row] = row_id
+            self._vectors[row] = vector
+
+    def remove(self, row_id: int) -> bool:
+        row = self._rows.pop(row_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            self._vectors[row] = self._vectors[last]
+            self._ids[row] = self._ids[last]
+            self._rows[int(self._ids[row])] = row
+        self._size = last
+        return True
+
+    def vector(self, row_id: int) -> Optional[np.ndarray]:
+        row = self._rows.get(row_id)
+        return None if row is None else self._vectors[row].copy()
+
+    def search(self, query: np.ndarray, k: int, exclude: Iterable[int] = ()) -> List[Tuple[int, float]]:
+        """
+        The ``k`` rows most similar to ``query`` as (id, cosine similarity), best first.
+        Rows sharing nothing with the query (similarity <= 0) are not returned.
+        """
+        if self._size == 0 or k <= 0:
+            return []
+        scores = self.vectors @ query.astype(np.float32, copy=False)
+        for row_id in exclude:
+            row = self._rows.get(row_id)
+            if row is not None:
+                scores[row] = -np.inf
+        return top_k(scores, self.ids, k)
+
+class LayeredVectorIndex:
+    """
+    A VectorIndex over a read-only base, typically the memory-mapped arrays of a
+    snapshot shared by every worker. Rows changed since are hidden in the base and
+    kept in a small in-memory VectorIndex; each worker only pays for a bit per base
+    row and its changes. Base ids must be sorted.
+    """
+
+    def __init__(self, base_ids: np.ndarray, base_vectors: np.ndarray):
+        self.dimensions = base_vectors.shape[1]
+        self.base_ids = base_ids
+        self.base_vectors = base_vectors
+        self._hidden = np.zeros(len(base_ids), dtype=bool)
+        self._hidden_count = 0
+        self.changes = VectorIndex(self.dimensions, capacity=64)
+
+    def base_row(self, row_id: int) -> Optional[int]:
+        """Position of a visible row in the base, or None."""
+        row = int(np.searchsorted(self.base_ids, row_id))
+        if row < len(self.base_ids) and self.base_ids[row] == row_id and not self._hidden[row]:
+            return row
+        return None
+
+    def _hide(self, row_id: int) -> bool:
+        row = self.base_row(row_id)
+        if row is None:
+            return False
+        self._hidden[row] = True
+        self._hidden_count += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self.base_ids) - self._hidden_count + len(self.changes)
+
+    def __contains__(self, row_id: int) -> bool:
+        return row_id in self.changes or self.base_row(row_id) is not None
+
+    @property
+    def visible(self) -> np.ndarray:
+        """Mask of the base rows not hidden by a change."""
+        return ~self._hidden
+
+    @property
+    def ids(self) -> np.ndarray:
+        return np.concatenate([self.base_ids[self.visible], self.changes.ids])
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return np.concatenate([self.base_vectors[self.visible], self.changes.vectors])
+
+    def upsert(self, row_id: int, vector: np.ndarray) -> None:
+        self.upsert_many([row_id], vector.reshape(1, -1))
+
+    def upsert_many(self, row_ids: Iterable[int], vectors: np.ndarray) -> None:
+        row_ids = [int(row_id) for row_id in row_ids]
+        for row_id in row_ids:
+            self._hide(row_id)
+        self.changes.upsert_many(row_ids, vectors)
+
+    def remove(self, row_id: int) -> bool:
+        hidden = self._hide(row_id)
+        return self.changes.remove(row_id) or hidden
+
+    def vector(self, row_id: int) -> Optional[np.ndarray]:
+        vector = self.changes.vector(row_id)
+        if vector is None:
+            row = self.base_row(row_id)
+            vector = None if row is None else np.array(self.base_vectors[row])
+        return vector
+
+    def search(self, query: np.ndarray, k: int, exclude: Iterable[int] = ()) -> List[Tuple[int, float]]:
+        exclude = list(exclude)
+        hits = self.changes.search(query, k, exclude)
+        if len(self.base_ids) and k > 0:
+            scores = self.base_vectors @ query.astype(np.float32, copy=False)
+            if self._hidden_count:
+                scores[self._hidden] = -np.inf
+            for row_id in exclude:
+                row = self.base_row(row_id)
+                if row is not None:
+                    scores[row] = -np.inf
+            hits += top_k(scores, self.base_ids, k)
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        return hits[:k]
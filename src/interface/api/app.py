@@ -1,12 +1,21 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from src.infrastructure.di.container import container
+from src.infrastructure.cache.entities import entity_cache_stats
+from src.infrastructure.cache.results import list_cache
+from src.infrastructure.search.semantic import semantic_index_stats
+from src.application.search.cache import nl_translator
+from src.application.dto.pagination import InvalidCursorError
+from .conditional import ETAG_HEADER
+from .pagination import PAGINATION_HEADERS
 from .routes.client import router as client_router
 from .routes.user import router as user_router
 from .routes.offer import router as offer_router
 from .routes.request import router as request_router
 from .routes.equipment import router as equipment_router
+from .routes.search import router as search_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,19 +40,41 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[*PAGINATION_HEADERS, ETAG_HEADER],
     )
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+        return JSONResponse(status_code=400, content={"detail": str(exc)})
+
     # Include routers
     app.include_router(client_router)
     app.include_router(user_router)
     app.include_router(offer_router)
     app.include_router(request_router)
     app.include_router(equipment_router)
+    app.include_router(search_router)
 
     @app.get("/health")
     async def health_check():
         return {"status": "healthy"}
 
+    @app.get("/health/pool")
+    async def pool_stats():
+        return container.pool_stats()
+
+    @app.get("/health/cache")
+    async def cache_stats():
+        return {"entities": entity_cache_stats(), "lists": list_cache.stats()}
+
+    @app.get("/health/semantic")
+    async def semantic_stats():
+        return semantic_index_stats()
+
+    @app.get("/health/translator")
+    async def translator_stats():
+        return nl_translator.stats().to_dict()
+
     return app
 
 # app = create_app() 
\ No newline at end of file
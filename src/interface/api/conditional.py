@@ -0,0 +1,59 @@
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from fastapi import Request, Response
+from src.application.dto.pagination import Page
+
+ETAG_HEADER = "ETag"
+
+def make_etag(*parts: Any) -> str:
+    """Strong entity tag for a representation identified by ``parts``."""
+    payload = json.dumps(parts, default=str, separators=(",", ":")).encode()
+    return '"' + hashlib.blake2b(payload, digest_size=16).hexdigest() + '"'
+
+def entity_etag(item: Any) -> str:
+    """
+    Tag of a single entity, derived from its id and updated_at. Works the same for
+    entities and for RowVersion tuples read by the lightweight version queries.
+    """
+    return make_etag(item.id, item.updated_at)
+
+def page_etag(page: Page) -> str:
+    """
+    Tag of a list page: the id and updated_at of every row on it plus the page
+    headers, so edits, inserts and deletes that affect the page all change it.
+    """
+    rows = [(item.id, item.updated_at) for item in page.items]
+    return make_etag(rows, page.next_cursor, page.total, page.total_estimated)
+
+def _parse_etags(header: str) -> Iterable[str]:
+    for tag in header.split(","):
+        tag = tag.strip()
+        # If-None-Match uses weak comparison
+        yield tag[2:] if tag.startswith("W/") else tag
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in _parse_etags(header)
+
+async def not_modified_response(
+    request: Request,
+    load_version: Callable[[], Awaitable[Any]],
+    tag: Callable[[Any], str]
+) -> Optional[Response]:
+    """
+    Answer a request carrying If-None-Match from the lightweight version query.
+    Returns a 304 response when the client's copy is current, otherwise None so the
+    caller builds the full response (and its tag) as usual.
+    """
+    if "if-none-match" not in request.headers:
+        return None
+    version = await load_version()
+    if version is None:
+        return None
+    etag = tag(version)
+    if not etag_matches(request, etag):
+        return None
+    return Response(status_code=304, headers={ETAG_HEADER: etag})
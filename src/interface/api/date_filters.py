@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from fastapi import HTTPException
+
+def utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps are stored as naive UTC; convert aware query values to match."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def created_window(
+    created_from: Optional[datetime], created_to: Optional[datetime]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Validate a half-open ``[created_from, created_to)`` window on created_at.
+    On partitioned tables the window lets Postgres skip the months outside it.
+    """
+    created_from, created_to = utc_naive(created_from), utc_naive(created_to)
+    if created_from is not None and created_to is not None and created_from >= created_to:
+        raise HTTPException(status_code=422, detail="created_from must be earlier than created_to")
+    return created_from, created_to
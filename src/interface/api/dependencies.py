@@ -1,19 +1,21 @@
-from typing import Type, TypeVar, Callable, Any, Dict, cast
-from inspect import isclass
-from functools import partial
+import inspect
+import time
+from contextlib import asynccontextmanager
+from typing import Type, TypeVar, Callable, Any, AsyncGenerator, AsyncIterator, Optional
 
+from fastapi import Request, Response
+
+from src.infrastructure.database.config import DB_PRIMARY_STICKY_SECONDS
 from src.infrastructure.di.container import container
 from src.application.use_cases.base import QueryHandler, CommandHandler
-from src.infrastructure.di.dependencies import inject_repository
+from src.infrastructure.repositories.factory import RepositoryFactory
 
 # Type variables for generic handler factory functions
 T = TypeVar('T')
 H = TypeVar('H')
 
 # Get repository for a handler based on class name
-def get_repository_for_handler(handler_class_name: str):
-    repo_factory = container.repository_factory
-    
+def get_repository_for_handler(handler_class_name: str, repo_factory: RepositoryFactory):
     if "Client" in handler_class_name:
         return repo_factory.get_client_repository()
     elif "User" in handler_class_name:
@@ -27,146 +29,214 @@ def get_repository_for_handler(handler_class_name: str):
     else:
         raise ValueError(f"Unknown handler type: {handler_class_name}")
 
-# Create a factory function for a specific handler class
-def create_handler_factory(handler_cls: Type[H]) -> Callable[[], H]:
+# Cookie holding the time until which a client's reads are served by the primary
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+def reads_from_primary(request: Optional[Request]) -> bool:
+    """Whether the client wrote recently enough that it must read from the primary."""
+    if request is None:
+        return False
+    try:
+        return float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+def mark_primary_sticky(response: Optional[Response]) -> None:
+    """Keep the client's reads on the primary until replicas have caught up with its write."""
+    if response is None or DB_PRIMARY_STICKY_SECONDS <= 0:
+        return
+    response.set_cookie(
+        PRIMARY_STICKY_COOKIE,
+        f"{time.time() + DB_PRIMARY_STICKY_SECONDS:.3f}",
+        max_age=max(1, int(DB_PRIMARY_STICKY_SECONDS)),
+        httponly=True,
+        samesite="lax"
+    )
+
+@asynccontextmanager
+async def handler_scope(
+    handler_class: Type[T],
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    snapshot: bool = False
+) -> AsyncIterator[T]:
     """
-    Creates a factory function that will instantiate the handler with its repository.
-    This is what FastAPI's Depends() expects.
+    Instantiates a handler inside its own unit of work.
+    Query handlers run in a read-only transaction on a replica (or on the primary while
+    the client is inside its sticky window); command handlers run on the primary and
+    commit on success. A snapshot scope runs at REPEATABLE READ so every statement
+    sees the same data.
     """
-    def factory() -> H:
+    read_only = issubclass(handler_class, QueryHandler)
+    if not read_only:
+        mark_primary_sticky(response)
+    uow = container.unit_of_work(
+        read_only=read_only,
+        prefer_primary=reads_from_primary(request),
+        isolation_level="REPEATABLE READ" if snapshot else None
+    )
+    async with uow:
         try:
-            # Get the appropriate repository
-            repo = get_repository_for_handler(handler_cls.__name__)
-            
-            # Create and return the handler
-            return handler_cls(repository=repo)
+            # Get the appropriate repository bound to this request's session
+            parameters = inspect.signature(handler_class).parameters
+            arguments = {}
+            if "repository" in parameters:
+                arguments["repository"] = get_repository_for_handler(handler_class.__name__, uow.repositories)
+            if "repositories" in parameters:
+                # Handlers reading other entities get them from the same unit of work
+                arguments["repositories"] = uow.repositories
+            handler = handler_class(**arguments)
         except Exception as e:
-            # Provide a more helpful error message
-            class_name = handler_cls.__name__ if isclass(handler_cls) else str(handler_cls)
-            raise RuntimeError(f"Failed to resolve handler {class_name}: {str(e)}") from e
-    
-    return factory
+            raise RuntimeError(f"Failed to resolve handler {handler_class.__name__}: {str(e)}") from e
+        yield handler
+
+# Create a factory function for a specific handler class
+def create_handler_factory(handler_cls: Type[H]) -> Callable[[], AsyncGenerator[H, None]]:
+    """
+    Creates a dependency that yields the handler bound to a request-scoped unit of work.
+    This is what FastAPI's Depends() expects.
+    """
+    return resolve_handler(handler_cls)
 
 # Main resolver function that FastAPI will use
-def resolve_handler(handler_class: Type[T]) -> Callable[[], T]:
+def resolve_handler(handler_class: Type[T]) -> Callable[[], AsyncGenerator[T, None]]:
     """
-    Creates a factory function that will instantiate a handler with its required repository.
+    Creates a dependency that yields a handler with its required repository.
+    The unit of work is committed or rolled back once the endpoint returns.
     """
-    def factory() -> T:
-        try:
-            # Get the appropriate repository based on handler class name
-            repo = get_repository_for_handler(handler_class.__name__)
-            
-            # Create and return the handler with the repository
-            return handler_class(repository=repo)
-            
-        except Exception as e:
-            class_name = handler_class.__name__
-            raise RuntimeError(f"Failed to resolve handler {class_name}: {str(e)}") from e
-    
+    async def factory(request: Request, response: Response) -> AsyncGenerator[T, None]:
+        async with handler_scope(handler_class, request, response) as handler:
+            yield handler
+
     return factory
 
 # Handler provider functions
-def get_list_clients_handler():
+async def get_list_clients_handler(request: Request, response: Response):
     from src.application.use_cases.client.queries.list_clients import ListClientsHandler
-    return resolve_handler(ListClientsHandler)()
+    async with handler_scope(ListClientsHandler, request, response) as handler:
+        yield handler
 
-def get_get_client_handler():
+async def get_get_client_handler(request: Request, response: Response):
     from src.application.use_cases.client.queries.get_client import GetClientHandler
-    return resolve_handler(GetClientHandler)()
+    async with handler_scope(GetClientHandler, request, response) as handler:
+        yield handler
 
-def get_create_client_handler():
+async def get_create_client_handler(request: Request, response: Response):
     from src.application.use_cases.client.commands.create_client import CreateClientHandler
-    return resolve_handler(CreateClientHandler)()
+    async with handler_scope(CreateClientHandler, request, response) as handler:
+        yield handler
 
-def get_update_client_handler():
+async def get_update_client_handler(request: Request, response: Response):
     from src.application.use_cases.client.commands.update_client import UpdateClientHandler
-    return resolve_handler(UpdateClientHandler)()
+    async with handler_scope(UpdateClientHandler, request, response) as handler:
+        yield handler
 
-def get_delete_client_handler():
+async def get_delete_client_handler(request: Request, response: Response):
     from src.application.use_cases.client.commands.delete_client import DeleteClientHandler
-    return resolve_handler(DeleteClientHandler)()
+    async with handler_scope(DeleteClientHandler, request, response) as handler:
+        yield handler
 
-def get_list_users_handler():
+async def get_list_users_handler(request: Request, response: Response):
     from src.application.use_cases.user.queries.list_users import ListUsersHandler
-    return resolve_handler(ListUsersHandler)()
+    async with handler_scope(ListUsersHandler, request, response) as handler:
+        yield handler
 
-def get_get_user_handler():
+async def get_get_user_handler(request: Request, response: Response):
     from src.application.use_cases.user.queries.get_user import GetUserHandler
-    return resolve_handler(GetUserHandler)()
+    async with handler_scope(GetUserHandler, request, response) as handler:
+        yield handler
 
-def get_get_user_by_username_handler():
+async def get_get_user_by_username_handler(request: Request, response: Response):
     from src.application.use_cases.user.queries.get_user_by_username import GetUserByUsernameHandler
-    return resolve_handler(GetUserByUsernameHandler)()
+    async with handler_scope(GetUserByUsernameHandler, request, response) as handler:
+        yield handler
 
-def get_create_user_handler():
+async def get_create_user_handler(request: Request, response: Response):
     from src.application.use_cases.user.commands.create_user import CreateUserHandler
-    return resolve_handler(CreateUserHandler)()
+    async with handler_scope(CreateUserHandler, request, response) as handler:
+        yield handler
 
-def get_update_user_handler():
+async def get_update_user_handler(request: Request, response: Response):
     from src.application.use_cases.user.commands.update_user import UpdateUserHandler
-    return resolve_handler(UpdateUserHandler)()
+    async with handler_scope(UpdateUserHandler, request, response) as handler:
+        yield handler
 
-def get_delete_user_handler():
+async def get_delete_user_handler(request: Request, response: Response):
     from src.application.use_cases.user.commands.delete_user import DeleteUserHandler
-    return resolve_handler(DeleteUserHandler)()
+    async with handler_scope(DeleteUserHandler, request, response) as handler:
+        yield handler
 
-def get_list_offers_handler():
+async def get_list_offers_handler(request: Request, response: Response):
     from src.application.use_cases.offer.queries.list_offers import ListOffersHandler
-    return resolve_handler(ListOffersHandler)()
+    async with handler_scope(ListOffersHandler, request, response) as handler:
+        yield handler
 
-def get_get_offer_handler():
+async def get_get_offer_handler(request: Request, response: Response):
     from src.application.use_cases.offer.queries.get_offer import GetOfferHandler
-    return resolve_handler(GetOfferHandler)()
+    async with handler_scope(GetOfferHandler, request, response) as handler:
+        yield handler
 
-def get_create_offer_handler():
+async def get_create_offer_handler(request: Request, response: Response):
     from src.application.use_cases.offer.commands.create_offer import CreateOfferHandler
-    return resolve_handler(CreateOfferHandler)()
+    async with handler_scope(CreateOfferHandler, request, response) as handler:
+        yield handler
 
-def get_update_offer_handler():
+async def get_update_offer_handler(request: Request, response: Response):
     from src.application.use_cases.offer.commands.update_offer import UpdateOfferHandler
-    return resolve_handler(UpdateOfferHandler)()
+    async with handler_scope(UpdateOfferHandler, request, response) as handler:
+        yield handler
 
-def get_delete_offer_handler():
+async def get_delete_offer_handler(request: Request, response: Response):
     from src.application.use_cases.offer.commands.delete_offer import DeleteOfferHandler
-    return resolve_handler(DeleteOfferHandler)()
+    async with handler_scope(DeleteOfferHandler, request, response) as handler:
+        yield handler
 
-def get_list_requests_handler():
+async def get_list_requests_handler(request: Request, response: Response):
     from src.application.use_cases.request.queries.list_requests import ListRequestsHandler
-    return resolve_handler(ListRequestsHandler)()
+    async with handler_scope(ListRequestsHandler, request, response) as handler:
+        yield handler
 
-def get_get_request_handler():
+async def get_get_request_handler(request: Request, response: Response):
     from src.application.use_cases.request.queries.get_request import GetRequestHandler
-    return resolve_handler(GetRequestHandler)()
+    async with handler_scope(GetRequestHandler, request, response) as handler:
+        yield handler
 
-def get_create_request_handler():
+async def get_create_request_handler(request: Request, response: Response):
     from src.application.use_cases.request.commands.create_request import CreateRequestHandler
-    return resolve_handler(CreateRequestHandler)()
+    async with handler_scope(CreateRequestHandler, request, response) as handler:
+        yield handler
 
-def get_update_request_handler():
+async def get_update_request_handler(request: Request, response: Response):
     from src.application.use_cases.request.commands.update_request import UpdateRequestHandler
-    return resolve_handler(UpdateRequestHandler)()
+    async with handler_scope(UpdateRequestHandler, request, response) as handler:
+        yield handler
 
-def get_delete_request_handler():
+async def get_delete_request_handler(request: Request, response: Response):
     from src.application.use_cases.request.commands.delete_request import DeleteRequestHandler
-    return resolve_handler(DeleteRequestHandler)()
+    async with handler_scope(DeleteRequestHandler, request, response) as handler:
+        yield handler
 
-def get_list_equipment_handler():
+async def get_list_equipment_handler(request: Request, response: Response):
     from src.application.use_cases.equipment.queries.list_equipment import ListEquipmentHandler
-    return resolve_handler(ListEquipmentHandler)()
+    async with handler_scope(ListEquipmentHandler, request, response) as handler:
+        yield handler
 
-def get_get_equipment_handler():
+async def get_get_equipment_handler(request: Request, response: Response):
     from src.application.use_cases.equipment.queries.get_equipment import GetEquipmentHandler
-    return resolve_handler(GetEquipmentHandler)()
+    async with handler_scope(GetEquipmentHandler, request, response) as handler:
+        yield handler
 
-def get_create_equipment_handler():
+async def get_create_equipment_handler(request: Request, response: Response):
     from src.application.use_cases.equipment.commands.create_equipment import CreateEquipmentHandler
-    return resolve_handler(CreateEquipmentHandler)()
+    async with handler_scope(CreateEquipmentHandler, request, response) as handler:
+        yield handler
 
-def get_update_equipment_handler():
+async def get_update_equipment_handler(request: Request, response: Response):
     from src.application.use_cases.equipment.commands.update_equipment import UpdateEquipmentHandler
-    return resolve_handler(UpdateEquipmentHandler)()
+    async with handler_scope(UpdateEquipmentHandler, request, response) as handler:
+        yield handler
 
-def get_delete_equipment_handler():
+async def get_delete_equipment_handler(request: Request, response: Response):
     from src.application.use_cases.equipment.commands.delete_equipment import DeleteEquipmentHandler
-    return resolve_handler(DeleteEquipmentHandler)() 
\ No newline at end of file
+    async with handler_scope(DeleteEquipmentHandler, request, response) as handler:
+        yield handler 
\ No newline at end of file
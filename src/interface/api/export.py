@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Literal, List, Optional, Type
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from src.interface.api.dependencies import handler_scope
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Rows are buffered into chunks of roughly this size before being sent
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+async def stream_query(handler_class: Type, query: Any, request: Optional[Request] = None) -> AsyncIterator[Any]:
+    """
+    Run a streaming query handler in its own snapshot unit of work.
+    The unit of work stays open until the response body has been sent, unlike the
+    request-scoped one provided by resolve_handler.
+    """
+    async with handler_scope(handler_class, request, snapshot=True) as handler:
+        async for item in handler.handle(query):
+            yield item
+
+async def _ndjson_chunks(entities: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for entity in entities:
+        buffer += entity.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+async def _csv_chunks(entities: AsyncIterator[BaseModel], fields: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for entity in entities:
+        row = entity.model_dump(mode="json")
+        writer.writerow([_csv_value(row.get(field)) for field in fields])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+def export_response(
+    entities: AsyncIterator[BaseModel],
+    entity_class: Type[BaseModel],
+    export_format: ExportFormat,
+    filename: str
+) -> StreamingResponse:
+    """Stream entities as NDJSON or CSV without materializing them in memory."""
+    if export_format == "csv":
+        body = _csv_chunks(entities, list(entity_class.model_fields))
+    else:
+        body = _ndjson_chunks(entities)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
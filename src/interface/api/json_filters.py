@@ -0,0 +1,41 @@
+import json
+from typing import Any, Dict, List, Optional
+from fastapi import HTTPException
+from src.domain.services.specifications import SpecConstraint, SpecificationError, parse_range_filter
+
+def parse_tags(values: Optional[List[str]], name: str = "tag") -> Optional[Dict[str, str]]:
+    """
+    Turn repeated ``key:value`` query parameters into the mapping stored in the
+    ``tags`` columns, for a JSONB containment filter.
+    """
+    if not values:
+        return None
+    tags = {}
+    for value in values:
+        key, separator, tag_value = value.partition(":")
+        key, tag_value = key.strip(), tag_value.strip()
+        if not separator or not key:
+            raise HTTPException(status_code=422, detail=f"{name} must look like key:value, got {value!r}")
+        tags[key] = tag_value
+    return tags
+
+def parse_json_object(value: Optional[str], name: str) -> Optional[Dict[str, Any]]:
+    """Parse a query parameter holding a JSON object, e.g. ``{"ports": 48}``."""
+    if value is None:
+        return None
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"{name} must be a JSON object")
+    if not isinstance(parsed, dict) or not parsed:
+        raise HTTPException(status_code=422, detail=f"{name} must be a non-empty JSON object")
+    return parsed
+
+def parse_spec_ranges(values: Optional[List[str]], name: str = "spec_range") -> Optional[List[SpecConstraint]]:
+    """Turn repeated ``power>=400W`` style query parameters into specification constraints."""
+    if not values:
+        return None
+    try:
+        return [constraint for value in values for constraint in parse_range_filter(value)]
+    except SpecificationError as e:
+        raise HTTPException(status_code=422, detail=f"{name}: {e}")
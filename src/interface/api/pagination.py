@@ -0,0 +1,27 @@
+from typing import Literal, Optional
+from fastapi import HTTPException, Response
+from src.application.dto.pagination import Page
+
+# Response header carrying the opaque cursor of the next page, if there is one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Total number of matching rows, and whether that number is a planner estimate
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_ESTIMATED_HEADER = "X-Total-Count-Estimated"
+
+PAGINATION_HEADERS = [NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_ESTIMATED_HEADER]
+
+CountMode = Literal["exact", "estimate", "auto"]
+# How text filters match: "substring" (ILIKE) or "fuzzy" (trigram similarity, ranked)
+TextMatch = Literal["substring", "fuzzy"]
+
+def check_cursor_allowed(match: str, cursor: Optional[str]) -> None:
+    """Fuzzy results are ranked by similarity, not id, so they are paged with skip."""
+    if match == "fuzzy" and cursor:
+        raise HTTPException(status_code=422, detail="cursor cannot be used with match=fuzzy; use skip")
+
+def set_page_headers(response: Response, page: Page) -> None:
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total)
+        response.headers[TOTAL_COUNT_ESTIMATED_HEADER] = "true" if page.total_estimated else "false"
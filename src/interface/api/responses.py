@@ -0,0 +1,22 @@
+from functools import lru_cache
+from typing import List, Sequence, Type
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+@lru_cache(maxsize=None)
+def _list_adapter(entity_class: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[entity_class])
+
+def entity_list_response(items: Sequence[BaseModel], entity_class: Type[BaseModel], response: Response) -> Response:
+    """
+    Serialize entities that repositories already validated straight to JSON bytes.
+
+    Returning a Response bypasses FastAPI's second validation pass against the route's
+    response_model (which still documents the schema in OpenAPI), and pydantic-core
+    encodes the list in one call instead of going through jsonable_encoder and json.dumps.
+    Headers set on the injected ``response`` (pagination, cookies) are carried over.
+    """
+    body = _list_adapter(entity_class).dump_json(list(items), by_alias=True)
+    fast_response = Response(content=body, media_type="application/json")
+    fast_response.raw_headers.extend(response.headers.raw)
+    return fast_response
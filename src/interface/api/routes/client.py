@@ -1,33 +1,101 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from dataclasses import replace
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Request as HTTPRequest
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from src.application.use_cases.client.queries.get_client import GetClientQuery, GetClientHandler
 from src.application.use_cases.client.queries.list_clients import ListClientsQuery, ListClientsHandler
+from src.application.use_cases.client.queries.search_clients import SearchClientsQuery, SearchClientsHandler
+from src.application.use_cases.client.queries.export_clients import ExportClientsHandler
 from src.application.use_cases.client.commands.create_client import CreateClientCommand, CreateClientHandler
 from src.application.use_cases.client.commands.update_client import UpdateClientCommand, UpdateClientHandler
 from src.application.use_cases.client.commands.delete_client import DeleteClientCommand, DeleteClientHandler
 from src.domain.entities.client import Client
+from src.domain.repositories.base import SearchHit
 from src.application.dto.client import ClientCreateDTO, ClientUpdateDTO
+from src.interface.api.conditional import ETAG_HEADER, entity_etag, not_modified_response, page_etag
 from src.interface.api.dependencies import resolve_handler
+from src.interface.api.export import ExportFormat, export_response, stream_query
+from src.interface.api.json_filters import parse_tags
+from src.interface.api.pagination import CountMode, TextMatch, check_cursor_allowed, set_page_headers
+from src.interface.api.responses import entity_list_response
 
 router = APIRouter(prefix="/clients", tags=["clients"])
 
+def client_filters(
+    name: Optional[str] = Query(None, min_length=1, max_length=100, description="Case-insensitive substring"),
+    email: Optional[str] = Query(None, min_length=1, max_length=100, description="Case-insensitive substring"),
+    company_name: Optional[str] = Query(None, min_length=1, max_length=100, description="Case-insensitive substring"),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) rows"),
+    tag: Optional[List[str]] = Query(None, description="key:value tag; repeat to require several"),
+    match: TextMatch = Query("substring", description="substring, or fuzzy for typo-tolerant matches ranked by similarity")
+) -> ListClientsQuery:
+    return ListClientsQuery(
+        name=name,
+        email=email,
+        company_name=company_name,
+        is_active=is_active,
+        tags=parse_tags(tag),
+        match=match
+    )
+
 @router.get("/", response_model=List[Client])
 async def list_clients(
+    http_request: HTTPRequest,
+    response: Response,
+    filters: ListClientsQuery = Depends(client_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    count: Optional[CountMode] = Query(None, description="Return the total in X-Total-Count: exact, estimate or auto"),
     handler: ListClientsHandler = Depends(resolve_handler(ListClientsHandler))
 ):
-    query = ListClientsQuery()
-    clients = await handler.handle(query)
-    return clients
+    check_cursor_allowed(filters.match, cursor)
+    query = replace(filters, skip=skip, limit=limit, cursor=cursor, count=count)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), page_etag)
+    if not_modified is not None:
+        return not_modified
+    page = await handler.handle(query)
+    set_page_headers(response, page)
+    response.headers[ETAG_HEADER] = page_etag(page)
+    return entity_list_response(page.items, Client, response)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_clients(
+    http_request: HTTPRequest,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    filters: ListClientsQuery = Depends(client_filters)
+):
+    rows = stream_query(ExportClientsHandler, filters, http_request)
+    return export_response(rows, Client, export_format, filename="clients")
+
+@router.get("/search", response_model=List[SearchHit[Client]])
+async def search_clients(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description='Search text; supports "quoted phrases", OR and -exclusions'),
+    filters: ListClientsQuery = Depends(client_filters),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    handler: SearchClientsHandler = Depends(resolve_handler(SearchClientsHandler))
+):
+    page = await handler.handle(SearchClientsQuery(text=q, filters=filters, limit=limit, cursor=cursor))
+    set_page_headers(response, page)
+    return entity_list_response(page.items, SearchHit[Client], response)
 
 @router.get("/{client_id}", response_model=Client)
 async def get_client(
+    http_request: HTTPRequest,
+    response: Response,
     client_id: str,
     handler: GetClientHandler = Depends(resolve_handler(GetClientHandler))
 ):
     query = GetClientQuery(client_id=client_id)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), entity_etag)
+    if not_modified is not None:
+        return not_modified
     client = await handler.handle(query)
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
+    response.headers[ETAG_HEADER] = entity_etag(client)
     return client
 
 @router.post("/", response_model=Client, status_code=201)
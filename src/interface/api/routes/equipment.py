@@ -1,33 +1,129 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
-from typing import List, Optional
+from dataclasses import replace
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, Request as HTTPRequest
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
 from src.application.use_cases.equipment.queries.get_equipment import GetEquipmentQuery, GetEquipmentHandler
 from src.application.use_cases.equipment.queries.list_equipment import ListEquipmentQuery, ListEquipmentHandler
+from src.application.use_cases.equipment.queries.search_equipment import SearchEquipmentQuery, SearchEquipmentHandler
+from src.application.use_cases.equipment.queries.semantic_search_equipment import (
+    SemanticSearchEquipmentQuery, SemanticSearchEquipmentHandler
+)
+from src.application.use_cases.equipment.queries.export_equipment import ExportEquipmentHandler
 from src.application.use_cases.equipment.commands.create_equipment import CreateEquipmentCommand, CreateEquipmentHandler
 from src.application.use_cases.equipment.commands.update_equipment import UpdateEquipmentCommand, UpdateEquipmentHandler
 from src.application.use_cases.equipment.commands.delete_equipment import DeleteEquipmentCommand, DeleteEquipmentHandler
 from src.domain.entities.equipment import Equipment
+from src.domain.repositories.base import SearchHit, SimilarityHit
 from src.application.dto.equipment import EquipmentCreateDTO, EquipmentUpdateDTO
+from src.interface.api.conditional import ETAG_HEADER, entity_etag, not_modified_response, page_etag
 from src.interface.api.dependencies import resolve_handler
+from src.interface.api.export import ExportFormat, export_response, stream_query
+from src.interface.api.json_filters import parse_json_object, parse_spec_ranges, parse_tags
+from src.interface.api.pagination import CountMode, TextMatch, check_cursor_allowed, set_page_headers
+from src.interface.api.responses import entity_list_response
 
 router = APIRouter(prefix="/equipment", tags=["equipment"])
 
+EquipmentCategory = Literal["medical", "industrial", "laboratory", "office", "safety", "server", "network", "storage", "other"]
+EquipmentStatus = Literal["available", "in_use", "maintenance", "retired", "reserved"]
+
+def equipment_filters(
+    category: Optional[List[EquipmentCategory]] = Query(None, description="Repeat to match any of several categories"),
+    status: Optional[List[EquipmentStatus]] = Query(None, description="Repeat to match any of several statuses"),
+    manufacturer: Optional[str] = Query(None, min_length=1, max_length=100),
+    name: Optional[str] = Query(None, min_length=1, max_length=100, description="Case-insensitive substring"),
+    model: Optional[str] = Query(None, min_length=1, max_length=100, description="Case-insensitive substring"),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) rows"),
+    tag: Optional[List[str]] = Query(None, description="key:value tag; repeat to require several"),
+    spec: Optional[str] = Query(None, description='JSON object the specifications must contain, e.g. {"ports": 48}'),
+    spec_key: Optional[List[str]] = Query(None, description="Specification key that must be present; repeat to require several"),
+    spec_range: Optional[List[str]] = Query(
+        None, description="Numeric specification bound, e.g. power>=400W or weight<=50kg; units are converted, repeat to require several"
+    ),
+    match: TextMatch = Query("substring", description="substring, or fuzzy for typo-tolerant matches ranked by similarity")
+) -> ListEquipmentQuery:
+    return ListEquipmentQuery(
+        category=category,
+        status=status,
+        manufacturer=manufacturer,
+        name=name,
+        model=model,
+        is_active=is_active,
+        tags=parse_tags(tag),
+        specifications=parse_json_object(spec, "spec"),
+        spec_keys=spec_key,
+        spec_ranges=parse_spec_ranges(spec_range),
+        match=match
+    )
+
 @router.get("/", response_model=List[Equipment])
 async def list_equipment(
+    http_request: HTTPRequest,
+    response: Response,
+    filters: ListEquipmentQuery = Depends(equipment_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    count: Optional[CountMode] = Query(None, description="Return the total in X-Total-Count: exact, estimate or auto"),
     handler: ListEquipmentHandler = Depends(resolve_handler(ListEquipmentHandler))
 ):
-    query = ListEquipmentQuery()
-    equipment = await handler.handle(query)
-    return equipment
+    check_cursor_allowed(filters.match, cursor)
+    query = replace(filters, skip=skip, limit=limit, cursor=cursor, count=count)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), page_etag)
+    if not_modified is not None:
+        return not_modified
+    page = await handler.handle(query)
+    set_page_headers(response, page)
+    response.headers[ETAG_HEADER] = page_etag(page)
+    return entity_list_response(page.items, Equipment, response)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_equipment(
+    http_request: HTTPRequest,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    filters: ListEquipmentQuery = Depends(equipment_filters)
+):
+    rows = stream_query(ExportEquipmentHandler, filters, http_request)
+    return export_response(rows, Equipment, export_format, filename="equipment")
+
+@router.get("/search", response_model=List[SearchHit[Equipment]])
+async def search_equipment(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description='Search text; supports "quoted phrases", OR and -exclusions'),
+    filters: ListEquipmentQuery = Depends(equipment_filters),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    handler: SearchEquipmentHandler = Depends(resolve_handler(SearchEquipmentHandler))
+):
+    page = await handler.handle(SearchEquipmentQuery(text=q, filters=filters, limit=limit, cursor=cursor))
+    set_page_headers(response, page)
+    return entity_list_response(page.items, SearchHit[Equipment], response)
+
+@router.get("/search/semantic", response_model=List[SimilarityHit[Equipment]])
+async def semantic_search_equipment(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=1000, description="Description of the equipment sought"),
+    limit: int = Query(10, ge=1, le=100),
+    handler: SemanticSearchEquipmentHandler = Depends(resolve_handler(SemanticSearchEquipmentHandler))
+):
+    hits = await handler.handle(SemanticSearchEquipmentQuery(text=q, limit=limit))
+    return entity_list_response(hits, SimilarityHit[Equipment], response)
 
 @router.get("/{equipment_id}", response_model=Equipment)
 async def get_equipment(
+    http_request: HTTPRequest,
+    response: Response,
     equipment_id: int = Path(..., gt=0),
     handler: GetEquipmentHandler = Depends(resolve_handler(GetEquipmentHandler))
 ):
     query = GetEquipmentQuery(equipment_id=equipment_id)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), entity_etag)
+    if not_modified is not None:
+        return not_modified
     equipment = await handler.handle(query)
     if not equipment:
         raise HTTPException(status_code=404, detail="Equipment not found")
+    response.headers[ETAG_HEADER] = entity_etag(equipment)
     return equipment
 
 @router.post("/", response_model=Equipment, status_code=201)
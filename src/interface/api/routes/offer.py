@@ -1,33 +1,100 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Request as HTTPRequest
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
 from src.application.use_cases.offer.queries.get_offer import GetOfferQuery, GetOfferHandler
 from src.application.use_cases.offer.queries.list_offers import ListOffersQuery, ListOffersHandler
+from src.application.use_cases.offer.queries.export_offers import ExportOffersHandler
 from src.application.use_cases.offer.commands.create_offer import CreateOfferCommand, CreateOfferHandler
 from src.application.use_cases.offer.commands.update_offer import UpdateOfferCommand, UpdateOfferHandler
 from src.application.use_cases.offer.commands.delete_offer import DeleteOfferCommand, DeleteOfferHandler
 from src.domain.entities.offer import Offer
 from src.application.dto.offer import OfferCreateDTO, OfferUpdateDTO
+from src.interface.api.conditional import ETAG_HEADER, entity_etag, not_modified_response, page_etag
+from src.interface.api.date_filters import created_window
 from src.interface.api.dependencies import resolve_handler
+from src.interface.api.export import ExportFormat, export_response, stream_query
+from src.interface.api.pagination import CountMode, set_page_headers
+from src.interface.api.responses import entity_list_response
 
 router = APIRouter(prefix="/offers", tags=["offers"])
 
+OfferStatus = Literal["draft", "pending", "accepted", "rejected", "cancelled", "expired"]
+Currency = Literal["USD", "EUR", "GBP"]
+
+def offer_filters(
+    request_id: Optional[int] = Query(None, gt=0),
+    equipment_id: Optional[int] = Query(None, gt=0),
+    status: Optional[List[OfferStatus]] = Query(None, description="Repeat to match any of several statuses"),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    currency: Optional[Currency] = Query(None),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) rows"),
+    service: Optional[List[str]] = Query(None, description="Additional service the offer must include; repeat to require several"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after this time (UTC)"),
+    created_to: Optional[datetime] = Query(None, description="Created before this time (UTC)")
+) -> ListOffersQuery:
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(status_code=422, detail="min_price must not be greater than max_price")
+    created_from, created_to = created_window(created_from, created_to)
+    return ListOffersQuery(
+        request_id=request_id,
+        equipment_id=equipment_id,
+        status=status,
+        min_price=min_price,
+        max_price=max_price,
+        currency=currency,
+        is_active=is_active,
+        services=service,
+        created_from=created_from,
+        created_to=created_to
+    )
+
 @router.get("/", response_model=List[Offer])
 async def list_offers(
+    http_request: HTTPRequest,
+    response: Response,
+    filters: ListOffersQuery = Depends(offer_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    count: Optional[CountMode] = Query(None, description="Return the total in X-Total-Count: exact, estimate or auto"),
     handler: ListOffersHandler = Depends(resolve_handler(ListOffersHandler))
 ):
-    query = ListOffersQuery()
-    offers = await handler.handle(query)
-    return offers
+    query = replace(filters, skip=skip, limit=limit, cursor=cursor, count=count)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), page_etag)
+    if not_modified is not None:
+        return not_modified
+    page = await handler.handle(query)
+    set_page_headers(response, page)
+    response.headers[ETAG_HEADER] = page_etag(page)
+    return entity_list_response(page.items, Offer, response)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_offers(
+    http_request: HTTPRequest,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    filters: ListOffersQuery = Depends(offer_filters)
+):
+    rows = stream_query(ExportOffersHandler, filters, http_request)
+    return export_response(rows, Offer, export_format, filename="offers")
 
 @router.get("/{offer_id}", response_model=Offer)
 async def get_offer(
+    http_request: HTTPRequest,
+    response: Response,
     offer_id: str,
     handler: GetOfferHandler = Depends(resolve_handler(GetOfferHandler))
 ):
     query = GetOfferQuery(offer_id=offer_id)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), entity_etag)
+    if not_modified is not None:
+        return not_modified
     offer = await handler.handle(query)
     if not offer:
         raise HTTPException(status_code=404, detail="Offer not found")
+    response.headers[ETAG_HEADER] = entity_etag(offer)
     return offer
 
 @router.post("/", response_model=Offer, status_code=201)
@@ -37,6 +104,8 @@ async def create_offer(
 ):
     command = CreateOfferCommand(dto=offer_data)
     offer = await handler.handle(command)
+    if offer is None:
+        raise HTTPException(status_code=422, detail="Request not found")
     return offer
 
 @router.put("/{offer_id}", response_model=Offer)
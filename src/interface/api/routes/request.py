@@ -1,35 +1,170 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Request as HTTPRequest
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
 from src.application.use_cases.request.queries.get_request import GetRequestQuery, GetRequestHandler
 from src.application.use_cases.request.queries.list_requests import ListRequestsQuery, ListRequestsHandler
+from src.application.use_cases.request.queries.list_request_summaries import ListRequestSummariesHandler
+from src.application.use_cases.request.queries.search_requests import SearchRequestsQuery, SearchRequestsHandler
+from src.application.use_cases.request.queries.match_equipment import (
+    MatchRequestEquipmentQuery, MatchRequestEquipmentHandler
+)
+from src.application.use_cases.request.queries.similar_requests import SimilarRequestsQuery, SimilarRequestsHandler
+from src.application.use_cases.request.queries.export_requests import ExportRequestsHandler
 from src.application.use_cases.request.commands.create_request import CreateRequestCommand, CreateRequestHandler
 from src.application.use_cases.request.commands.update_request import UpdateRequestCommand, UpdateRequestHandler
 from src.application.use_cases.request.commands.delete_request import DeleteRequestCommand, DeleteRequestHandler
-from src.domain.entities.request import Request
+from src.domain.entities.request import Request, RequestSummary
+from src.domain.repositories.base import SearchHit, SimilarityHit
+from src.domain.services.matching import EquipmentMatch
 from src.application.dto.request import RequestCreateDTO, RequestUpdateDTO
+from src.interface.api.conditional import ETAG_HEADER, entity_etag, not_modified_response, page_etag
+from src.interface.api.date_filters import created_window
 from src.interface.api.dependencies import resolve_handler
+from src.interface.api.export import ExportFormat, export_response, stream_query
+from src.interface.api.json_filters import parse_json_object, parse_tags
+from src.interface.api.pagination import CountMode, set_page_headers
+from src.interface.api.responses import entity_list_response
 
 router = APIRouter(prefix="/requests", tags=["requests"])
 
+EquipmentCategory = Literal["server", "network", "storage", "other"]
+RequestStatus = Literal["draft", "pending", "approved", "rejected", "completed", "cancelled"]
+RequestPriority = Literal["low", "medium", "high"]
+Currency = Literal["USD", "EUR", "GBP"]
+
+def request_filters(
+    client_id: Optional[int] = Query(None, gt=0),
+    equipment_category: Optional[List[EquipmentCategory]] = Query(None, description="Repeat to match any of several categories"),
+    status: Optional[List[RequestStatus]] = Query(None, description="Repeat to match any of several statuses"),
+    priority: Optional[RequestPriority] = Query(None),
+    min_budget: Optional[float] = Query(None, ge=0),
+    max_budget: Optional[float] = Query(None, ge=0),
+    currency: Optional[Currency] = Query(None),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) rows"),
+    tag: Optional[List[str]] = Query(None, description="key:value tag; repeat to require several"),
+    spec: Optional[str] = Query(None, description='JSON object the required specifications must contain, e.g. {"ports": 48}'),
+    spec_key: Optional[List[str]] = Query(None, description="Required specification key that must be present; repeat to require several"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after this time (UTC)"),
+    created_to: Optional[datetime] = Query(None, description="Created before this time (UTC)")
+) -> ListRequestsQuery:
+    if min_budget is not None and max_budget is not None and min_budget > max_budget:
+        raise HTTPException(status_code=422, detail="min_budget must not be greater than max_budget")
+    created_from, created_to = created_window(created_from, created_to)
+    return ListRequestsQuery(
+        client_id=client_id,
+        equipment_category=equipment_category,
+        status=status,
+        priority=priority,
+        min_budget=min_budget,
+        max_budget=max_budget,
+        currency=currency,
+        is_active=is_active,
+        tags=parse_tags(tag),
+        specifications=parse_json_object(spec, "spec"),
+        spec_keys=spec_key,
+        created_from=created_from,
+        created_to=created_to
+    )
+
 @router.get("/", response_model=List[Request])
 async def list_requests(
+    http_request: HTTPRequest,
+    response: Response,
+    filters: ListRequestsQuery = Depends(request_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    count: Optional[CountMode] = Query(None, description="Return the total in X-Total-Count: exact, estimate or auto"),
     handler: ListRequestsHandler = Depends(resolve_handler(ListRequestsHandler))
 ):
-    query = ListRequestsQuery()
-    requests = await handler.handle(query)
-    return requests
+    query = replace(filters, skip=skip, limit=limit, cursor=cursor, count=count)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), page_etag)
+    if not_modified is not None:
+        return not_modified
+    page = await handler.handle(query)
+    set_page_headers(response, page)
+    response.headers[ETAG_HEADER] = page_etag(page)
+    return entity_list_response(page.items, Request, response)
+
+@router.get("/summary", response_model=List[RequestSummary])
+async def list_request_summaries(
+    response: Response,
+    filters: ListRequestsQuery = Depends(request_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    count: Optional[CountMode] = Query(None, description="Return the total in X-Total-Count: exact, estimate or auto"),
+    handler: ListRequestSummariesHandler = Depends(resolve_handler(ListRequestSummariesHandler))
+):
+    page = await handler.handle(replace(filters, skip=skip, limit=limit, cursor=cursor, count=count))
+    set_page_headers(response, page)
+    return entity_list_response(page.items, RequestSummary, response)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_requests(
+    http_request: HTTPRequest,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    filters: ListRequestsQuery = Depends(request_filters)
+):
+    rows = stream_query(ExportRequestsHandler, filters, http_request)
+    return export_response(rows, Request, export_format, filename="requests")
+
+@router.get("/search", response_model=List[SearchHit[Request]])
+async def search_requests(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description='Search text; supports "quoted phrases", OR and -exclusions'),
+    filters: ListRequestsQuery = Depends(request_filters),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    handler: SearchRequestsHandler = Depends(resolve_handler(SearchRequestsHandler))
+):
+    page = await handler.handle(SearchRequestsQuery(text=q, filters=filters, limit=limit, cursor=cursor))
+    set_page_headers(response, page)
+    return entity_list_response(page.items, SearchHit[Request], response)
 
 @router.get("/{request_id}", response_model=Request)
 async def get_request(
+    http_request: HTTPRequest,
+    response: Response,
     request_id: str,
     handler: GetRequestHandler = Depends(resolve_handler(GetRequestHandler))
 ):
     query = GetRequestQuery(request_id=request_id)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), entity_etag)
+    if not_modified is not None:
+        return not_modified
     request = await handler.handle(query)
     if not request:
         raise HTTPException(status_code=404, detail="Request not found")
+    response.headers[ETAG_HEADER] = entity_etag(request)
     return request
 
+@router.get("/{request_id}/matches", response_model=List[EquipmentMatch])
+async def match_request_equipment(
+    response: Response,
+    request_id: str,
+    limit: int = Query(10, ge=1, le=100),
+    handler: MatchRequestEquipmentHandler = Depends(resolve_handler(MatchRequestEquipmentHandler))
+):
+    matches = await handler.handle(MatchRequestEquipmentQuery(request_id=request_id, limit=limit))
+    if matches is None:
+        raise HTTPException(status_code=404, detail="Request not found")
+    return entity_list_response(matches, EquipmentMatch, response)
+
+@router.get("/{request_id}/similar", response_model=List[SimilarityHit[Request]])
+async def similar_requests(
+    response: Response,
+    request_id: str,
+    limit: int = Query(10, ge=1, le=100),
+    handler: SimilarRequestsHandler = Depends(resolve_handler(SimilarRequestsHandler))
+):
+    hits = await handler.handle(SimilarRequestsQuery(request_id=request_id, limit=limit))
+    if hits is None:
+        raise HTTPException(status_code=404, detail="Request not found")
+    return entity_list_response(hits, SimilarityHit[Request], response)
+
 @router.post("/", response_model=Request, status_code=201)
 async def create_request(
     request_data: RequestCreateDTO,
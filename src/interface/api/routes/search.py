@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import Optional
+from src.application.search.translation import TranslationError
+from src.application.use_cases.search.queries.natural_language_search import (
+    NaturalLanguageSearchQuery, NaturalLanguageSearchHandler, NaturalLanguageSearchResult
+)
+from src.interface.api.dependencies import resolve_handler
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+@router.get("/nl", response_model=NaturalLanguageSearchResult)
+async def natural_language_search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=500, description='Search phrase, e.g. "urgent server requests over 10k EUR from last month"'),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    handler: NaturalLanguageSearchHandler = Depends(resolve_handler(NaturalLanguageSearchHandler))
+):
+    try:
+        result = await handler.handle(NaturalLanguageSearchQuery(text=q, limit=limit, cursor=cursor))
+    except TranslationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    response.headers["Server-Timing"] = (
+        f'translate;dur={result.translation_ms};desc="{"cached" if result.cached else result.translator}"'
+    )
+    return result
@@ -1,34 +1,86 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Optional
+from dataclasses import replace
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Request as HTTPRequest
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
 from src.application.use_cases.user.queries.get_user import GetUserQuery, GetUserHandler
 from src.application.use_cases.user.queries.get_user_by_username import GetUserByUsernameQuery, GetUserByUsernameHandler
 from src.application.use_cases.user.queries.list_users import ListUsersQuery, ListUsersHandler
+from src.application.use_cases.user.queries.export_users import ExportUsersHandler
 from src.application.use_cases.user.commands.create_user import CreateUserCommand, CreateUserHandler
 from src.application.use_cases.user.commands.update_user import UpdateUserCommand, UpdateUserHandler
 from src.application.use_cases.user.commands.delete_user import DeleteUserCommand, DeleteUserHandler
 from src.domain.entities.user import User
 from src.application.dto.user import UserCreateDTO, UserUpdateDTO
+from src.interface.api.conditional import ETAG_HEADER, entity_etag, not_modified_response, page_etag
 from src.interface.api.dependencies import resolve_handler
+from src.interface.api.export import ExportFormat, export_response, stream_query
+from src.interface.api.pagination import CountMode, TextMatch, check_cursor_allowed, set_page_headers
+from src.interface.api.responses import entity_list_response
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+UserRole = Literal["admin", "manager", "user"]
+
+def user_filters(
+    username: Optional[str] = Query(None, min_length=1, max_length=50, description="Case-insensitive substring"),
+    email: Optional[str] = Query(None, min_length=1, max_length=100, description="Case-insensitive substring"),
+    role: Optional[UserRole] = Query(None),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) rows"),
+    match: TextMatch = Query("substring", description="substring, or fuzzy for typo-tolerant matches ranked by similarity")
+) -> ListUsersQuery:
+    return ListUsersQuery(
+        username=username,
+        email=email,
+        role=role,
+        is_active=is_active,
+        match=match
+    )
+
 @router.get("/", response_model=List[User])
 async def list_users(
+    http_request: HTTPRequest,
+    response: Response,
+    filters: ListUsersQuery = Depends(user_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    count: Optional[CountMode] = Query(None, description="Return the total in X-Total-Count: exact, estimate or auto"),
     handler: ListUsersHandler = Depends(resolve_handler(ListUsersHandler))
 ):
-    query = ListUsersQuery()
-    users = await handler.handle(query)
-    return users
+    check_cursor_allowed(filters.match, cursor)
+    query = replace(filters, skip=skip, limit=limit, cursor=cursor, count=count)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), page_etag)
+    if not_modified is not None:
+        return not_modified
+    page = await handler.handle(query)
+    set_page_headers(response, page)
+    response.headers[ETAG_HEADER] = page_etag(page)
+    return entity_list_response(page.items, User, response)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    http_request: HTTPRequest,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    filters: ListUsersQuery = Depends(user_filters)
+):
+    rows = stream_query(ExportUsersHandler, filters, http_request)
+    return export_response(rows, User, export_format, filename="users")
 
 @router.get("/{user_id}", response_model=User)
 async def get_user(
+    http_request: HTTPRequest,
+    response: Response,
     user_id: str,
     handler: GetUserHandler = Depends(resolve_handler(GetUserHandler))
 ):
     query = GetUserQuery(user_id=user_id)
+    not_modified = await not_modified_response(http_request, lambda: handler.version(query), entity_etag)
+    if not_modified is not None:
+        return not_modified
     user = await handler.handle(query)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    response.headers[ETAG_HEADER] = entity_etag(user)
     return user
 
 @router.get("/username/{username}", response_model=User)
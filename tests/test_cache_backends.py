@@ -0,0 +1,120 @@
+import asyncio
+import fnmatch
+import time
+import pytest
+import pytest_asyncio
+from src.infrastructure.cache.backends import MemoryCacheBackend, RedisCacheBackend
+from src.infrastructure.cache.resp import RespClient, read_reply
+
+class StandInServer:
+    """Tiny Redis-protocol server supporting GET, SET (with PX), DEL and SCAN."""
+
+    def __init__(self):
+        self.data = {}
+        self.server = None
+        self.connections = 0
+        self.scanned = []
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                command, *args = await read_reply(reader)
+                writer.write(self._execute(command.upper(), args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    def _execute(self, command, args):
+        if command == b"GET":
+            value, expires_at = self.data.get(args[0], (None, None))
+            if value is None or (expires_at is not None and expires_at <= time.monotonic()):
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            expires_at = time.monotonic() + int(args[3]) / 1000 if len(args) > 3 else None
+            self.data[args[0]] = (args[1], expires_at)
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % sum(self.data.pop(key, None) is not None for key in args)
+        if command == b"SCAN":
+            # The cursor is an offset into the keys there were when the scan started, so keys
+            # deleted meanwhile do not shift it; MATCH is applied after COUNT, as Redis does
+            cursor, pattern, count = int(args[0]), args[2].decode(), int(args[4])
+            if cursor == 0:
+                self.scanned = sorted(self.data)
+            keys = self.scanned[cursor:cursor + count]
+            following = cursor + count if cursor + count < len(self.scanned) else 0
+            matched = [key for key in keys if fnmatch.fnmatchcase(key.decode(), pattern)]
+            reply = [b"*2\r\n$%d\r\n%d\r\n" % (len(str(following)), following), b"*%d\r\n" % len(matched)]
+            reply += [b"$%d\r\n%s\r\n" % (len(key), key) for key in matched]
+            return b"".join(reply)
+        return b"-ERR unknown command\r\n"
+
+@pytest_asyncio.fixture
+async def server():
+    server = StandInServer()
+    server.port = await server.start()
+    yield server
+    if server.server.is_serving():
+        await server.stop()
+
+@pytest.mark.asyncio
+async def test_redis_backend_round_trip(server):
+    client = RespClient(f"redis://127.0.0.1:{server.port}/0")
+    cache = RedisCacheBackend(client, prefix="entity:equipment:", ttl=60)
+    assert await cache.get("1") is None
+    await cache.set("1", b'{"id":1}')
+    assert server.data[b"entity:equipment:1"][0] == b'{"id":1}'
+    assert await cache.get("1") == b'{"id":1}'
+    await cache.delete("1")
+    assert await cache.get("1") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "errors": 0}
+    await cache.close()
+
+@pytest.mark.asyncio
+async def test_redis_commands_share_a_pool_of_connections(server):
+    client = RespClient(f"redis://127.0.0.1:{server.port}/0", pool_size=2)
+    cache = RedisCacheBackend(client, prefix="entity:equipment:")
+    await asyncio.gather(*(cache.set(str(n), b"x") for n in range(8)))
+    assert await asyncio.gather(*(cache.get(str(n)) for n in range(8))) == [b"x"] * 8
+    assert server.connections == 2
+    await cache.delete_many(["0", "1"])
+    assert sorted(server.data)[:2] == [b"entity:equipment:2", b"entity:equipment:3"]
+    await cache.close()
+
+@pytest.mark.asyncio
+async def test_redis_backend_clears_only_its_prefix(server):
+    client = RespClient(f"redis://127.0.0.1:{server.port}/0")
+    equipment = RedisCacheBackend(client, prefix="entity:equipment:")
+    equipment.SCAN_COUNT = 3
+    for n in range(10):
+        await equipment.set(str(n), b"x")
+    await RedisCacheBackend(client, prefix="entity:offers:").set("1", b"y")
+    await equipment.clear()
+    assert list(server.data) == [b"entity:offers:1"] and equipment.stats()["errors"] == 0
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_redis_backend_treats_outage_as_miss(server):
+    await server.stop()
+    cache = RedisCacheBackend(RespClient(f"redis://127.0.0.1:{server.port}/0"), ttl=60)
+    await cache.set("1", b"x")
+    assert await cache.get("1") is None
+    assert cache.stats() == {"hits": 0, "misses": 1, "errors": 2}
+
+@pytest.mark.asyncio
+async def test_memory_backend_expires_entries():
+    cache = MemoryCacheBackend(maxsize=2, ttl=0.01)
+    await cache.set("1", b"x")
+    assert await cache.get("1") == b"x"
+    await asyncio.sleep(0.02)
+    assert await cache.get("1") is None
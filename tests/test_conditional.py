@@ -0,0 +1,47 @@
+from datetime import datetime
+import pytest
+from starlette.requests import Request
+from src.application.dto.pagination import Page
+from src.domain.entities.equipment import Equipment
+from src.domain.repositories.base import RowVersion
+from src.interface.api.conditional import entity_etag, not_modified_response, page_etag
+
+UPDATED = datetime(2024, 5, 1, 12, 0, 0, 123456)
+
+def make_equipment(i):
+    return Equipment(
+        id=i, name=f"pump-{i}", model="MOD-1", serial_number=f"SN-{i}", manufacturer="Siemens",
+        category="medical", status="available", updated_at=UPDATED
+    )
+
+def make_request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+def test_version_queries_and_entities_produce_the_same_tags():
+    entities = [make_equipment(i) for i in range(1, 4)]
+    versions = [RowVersion(i, UPDATED) for i in range(1, 4)]
+    assert entity_etag(entities[0]) == entity_etag(versions[0])
+    assert page_etag(Page.from_items(entities, 2)) == page_etag(Page.from_items(versions, 2))
+    assert page_etag(Page.from_items(versions, 2)) != page_etag(Page.from_items(versions, 3))
+    assert entity_etag(versions[0]) != entity_etag(RowVersion(1, datetime(2024, 5, 1, 12, 0, 1)))
+
+@pytest.mark.asyncio
+async def test_matching_tag_returns_304_without_loading_the_entity():
+    version = RowVersion(1, UPDATED)
+    etag = entity_etag(version)
+
+    async def load_version():
+        return version
+
+    response = await not_modified_response(make_request(f'"other", W/{etag}'), load_version, entity_etag)
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert await not_modified_response(make_request('"stale"'), load_version, entity_etag) is None
+
+@pytest.mark.asyncio
+async def test_unconditional_requests_skip_the_version_query():
+    async def load_version():
+        raise AssertionError("version query should not run")
+
+    assert await not_modified_response(make_request(), load_version, entity_etag) is None
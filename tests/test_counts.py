@@ -0,0 +1,92 @@
+import json
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+from src.infrastructure.repositories import base_sql
+from src.infrastructure.repositories.offer import OfferRepository
+from src.infrastructure.repositories.request import RequestRepository
+
+class FakeDialect:
+    def __init__(self, name):
+        self.name = name
+
+class FakeConnection:
+    def __init__(self, dialect_name):
+        self.dialect = FakeDialect(dialect_name)
+
+class FakeSession:
+    def __init__(self, dialect_name="postgresql"):
+        self._connection = FakeConnection(dialect_name)
+
+    async def connection(self):
+        return self._connection
+
+class CountingRepository(OfferRepository):
+    def __init__(self, estimate, exact, dialect_name="postgresql"):
+        super().__init__(FakeSession(dialect_name))
+        self.estimate = estimate
+        self.exact = exact
+        self.exact_calls = 0
+
+    async def count(self, filters=None):
+        self.exact_calls += 1
+        return self.exact
+
+    async def estimate_count(self, filters=None):
+        return self.estimate
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    base_sql._count_cache.clear()
+
+@pytest.mark.asyncio
+async def test_auto_counts_exactly_for_selective_filters():
+    repository = CountingRepository(estimate=120, exact=97)
+    assert await repository.count_rows({"status": "pending"}, mode="auto") == (97, False)
+
+@pytest.mark.asyncio
+async def test_auto_uses_estimate_for_large_results():
+    repository = CountingRepository(estimate=base_sql.COUNT_EXACT_THRESHOLD + 1, exact=0)
+    assert await repository.count_rows(mode="auto") == (base_sql.COUNT_EXACT_THRESHOLD + 1, True)
+    assert repository.exact_calls == 0
+
+@pytest.mark.asyncio
+async def test_counts_are_cached_per_filters():
+    repository = CountingRepository(estimate=10, exact=7)
+    await repository.count_rows({"status": ["a", "b"], "request_id": 1}, mode="exact")
+    await repository.count_rows({"request_id": 1, "status": ["a", "b"]}, mode="exact")
+    await repository.count_rows({"request_id": 2}, mode="exact")
+    assert repository.exact_calls == 2
+
+@pytest.mark.asyncio
+async def test_other_databases_always_count_exactly():
+    repository = CountingRepository(estimate=10 ** 9, exact=5, dialect_name="sqlite")
+    assert await repository.count_rows(mode="estimate") == (5, False)
+
+class ExplainingSession(FakeSession):
+    """Compiles executed statements for Postgres, as asyncpg would receive them."""
+
+    def __init__(self):
+        super().__init__()
+        self.statements = []
+
+    async def execute(self, statement):
+        compiled = statement.compile(dialect=asyncpg.dialect())
+        self.statements.append((str(compiled), compiled.params))
+        return FakeResult(json.dumps([{"Plan": {"Plan Rows": 4200}}]))
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+@pytest.mark.asyncio
+async def test_estimates_bind_jsonb_filters():
+    session = ExplainingSession()
+    repository = RequestRepository(session)
+    filters = {"tags__contains": {"team": "ml"}, "required_specifications__contains": {"gpu": "A100"}}
+    assert await repository.count_rows(filters, mode="estimate") == (4200, True)
+    sql, params = session.statements[0]
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT") and "@>" in sql
+    assert {"team": "ml"} in params.values() and {"gpu": "A100"} in params.values()
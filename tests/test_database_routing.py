@@ -0,0 +1,37 @@
+import time
+from fastapi import Request, Response
+from src.infrastructure.database.routing import DatabaseRouter, DatabaseTarget
+from src.interface.api.dependencies import (
+    PRIMARY_STICKY_COOKIE, mark_primary_sticky, reads_from_primary
+)
+
+def make_target(name):
+    return DatabaseTarget(name=name, engine=None, session_factory=None, pool_monitor=None)
+
+def make_request(cookie=None):
+    headers = [(b"cookie", f"{PRIMARY_STICKY_COOKIE}={cookie}".encode())] if cookie else []
+    return Request({"type": "http", "headers": headers})
+
+def test_writes_go_to_primary():
+    router = DatabaseRouter(make_target("primary"), [make_target("replica-0")])
+    assert router.route(read_only=False).name == "primary"
+
+def test_reads_are_spread_over_replicas():
+    router = DatabaseRouter(make_target("primary"), [make_target("replica-0"), make_target("replica-1")])
+    names = [router.route(read_only=True).name for _ in range(4)]
+    assert names == ["replica-0", "replica-1", "replica-0", "replica-1"]
+
+def test_reads_use_primary_when_requested_or_without_replicas():
+    router = DatabaseRouter(make_target("primary"), [make_target("replica-0")])
+    assert router.route(read_only=True, prefer_primary=True).name == "primary"
+    assert DatabaseRouter(make_target("primary")).route(read_only=True).name == "primary"
+
+def test_sticky_window_after_write():
+    response = Response()
+    mark_primary_sticky(response)
+    cookie = response.headers["set-cookie"]
+    until = cookie.split(";")[0].split("=", 1)[1]
+    assert reads_from_primary(make_request(until))
+    assert not reads_from_primary(make_request(f"{time.time() - 1:.3f}"))
+    assert not reads_from_primary(make_request("garbage"))
+    assert not reads_from_primary(make_request())
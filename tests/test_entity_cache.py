@@ -0,0 +1,105 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.infrastructure.cache import entities
+from src.infrastructure.cache.backends import MemoryCacheBackend
+from src.infrastructure.cache.entities import apply_invalidation, create_entity_caches
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import Equipment as EquipmentModel
+from src.infrastructure.database.unit_of_work import UnitOfWork
+
+pytest.importorskip("aiosqlite")
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    for table, cache in create_entity_caches("memory").items():
+        monkeypatch.setitem(entities.entity_caches, table, cache)
+    monkeypatch.setattr(entities, "_recent_writes", LRUCache(maxsize=100, ttl=30))
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(EquipmentModel(id=1, name="Pump", model="P1", serial_number="SN-1", manufacturer="Siemens",
+                                   category="medical", status="available", specifications={"power": "500W"}))
+        await session.commit()
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+async def read_equipment(session_factory, entity_id=1, **options):
+    async with UnitOfWork(session_factory, read_only=True, **options) as uow:
+        return await uow.repositories.get_equipment_repository().get_by_id(entity_id)
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_cache_as_copies(session_factory):
+    first = await read_equipment(session_factory)
+    first.specifications["power"] = "changed"
+    second = await read_equipment(session_factory)
+    assert second.specifications == {"power": "500W"}
+    stats = entities.entity_cache_stats()["equipment"]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+@pytest.mark.asyncio
+async def test_committed_update_invalidates_cache(session_factory):
+    await read_equipment(session_factory)
+    async with UnitOfWork(session_factory) as uow:
+        repository = uow.repositories.get_equipment_repository()
+        entity = await repository.get_by_id(1)
+        entity.status = "maintenance"
+        await repository.update(entity)
+        # A reader racing the commit re-caches the old row...
+        assert (await read_equipment(session_factory)).status == "available"
+    # ...which the invalidation applied after commit drops again
+    assert (await read_equipment(session_factory)).status == "maintenance"
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_cache(session_factory):
+    await read_equipment(session_factory)
+    async with UnitOfWork(session_factory) as uow:
+        assert await uow.repositories.get_equipment_repository().delete(1)
+    assert await read_equipment(session_factory) is None
+    assert entities.entity_cache_stats()["equipment"]["size"] == 0
+
+@pytest.mark.asyncio
+async def test_notifications_from_other_workers_evict_entries(session_factory):
+    await read_equipment(session_factory)
+    await apply_invalidation("equipment:1")
+    assert entities.entity_cache_stats()["equipment"]["size"] == 0
+
+@pytest.mark.asyncio
+async def test_reads_pinned_to_the_primary_bypass_the_cache(session_factory):
+    await read_equipment(session_factory, prefer_primary=True)
+    assert entities.entity_cache_stats()["equipment"]["size"] == 0
+    await read_equipment(session_factory)
+    await read_equipment(session_factory, prefer_primary=True)
+    assert entities.entity_cache_stats()["equipment"]["hits"] == 0
+
+@pytest.mark.asyncio
+async def test_replica_reads_of_recent_writes_are_not_cached(session_factory):
+    await read_equipment(session_factory, replica=True)
+    assert entities.entity_cache_stats()["equipment"]["size"] == 1
+    # Written by another worker: the replica may still return the old row
+    await apply_invalidation("equipment:1")
+    await read_equipment(session_factory, replica=True)
+    assert entities.entity_cache_stats()["equipment"]["size"] == 0
+    # The primary has every write
+    await read_equipment(session_factory)
+    assert entities.entity_cache_stats()["equipment"]["size"] == 1
+
+@pytest.mark.asyncio
+async def test_invalidations_are_batched_per_table(session_factory, monkeypatch):
+    deleted = []
+
+    class Recording(MemoryCacheBackend):
+        async def delete_many(self, keys):
+            deleted.append(keys)
+
+    monkeypatch.setitem(entities.entity_caches, "equipment", Recording(maxsize=10))
+    await apply_invalidation("equipment:1,2,3")
+    assert deleted == [["1", "2", "3"]] and entities.recently_written("equipment", "3")
+
+    # 2000 ids of 7 digits do not fit one NOTIFY
+    payloads = entities.notification_payloads("equipment", [str(10 ** 6 + n) for n in range(2000)])
+    assert len(payloads) == 3 and all(len(payload) <= entities.NOTIFY_PAYLOAD_LIMIT for payload in payloads)
+    assert sum(len(payload.partition(":")[2].split(",")) for payload in payloads) == 2000
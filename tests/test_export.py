@@ -0,0 +1,35 @@
+import csv
+import io
+import json
+import pytest
+from src.domain.entities.equipment import Equipment
+from src.interface.api.export import export_response
+
+def make_equipment(i):
+    return Equipment(
+        id=i, name=f"pump-{i}", model="MOD-1", serial_number=f"SN-{i}", manufacturer="Siemens",
+        category="medical", status="available", specifications={"power": "500W"}
+    )
+
+async def entities(count):
+    for i in range(1, count + 1):
+        yield make_equipment(i)
+
+async def read_body(response):
+    return b"".join([chunk async for chunk in response.body_iterator]).decode()
+
+@pytest.mark.asyncio
+async def test_ndjson_export_writes_one_object_per_line():
+    response = export_response(entities(3), Equipment, "ndjson", filename="equipment")
+    lines = (await read_body(response)).splitlines()
+    assert response.media_type == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_csv_export_has_header_and_json_encoded_nested_values():
+    response = export_response(entities(2), Equipment, "csv", filename="equipment")
+    rows = list(csv.DictReader(io.StringIO(await read_body(response))))
+    assert response.headers["content-disposition"] == 'attachment; filename="equipment.csv"'
+    assert [row["serial_number"] for row in rows] == ["SN-1", "SN-2"]
+    assert json.loads(rows[0]["specifications"]) == {"power": "500W"}
+    assert rows[0]["purchase_date"] == ""
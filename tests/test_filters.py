@@ -0,0 +1,84 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from src.application.use_cases.client.queries.list_clients import ListClientsHandler, ListClientsQuery
+from src.application.use_cases.request.queries.list_requests import ListRequestsHandler, ListRequestsQuery
+from src.infrastructure.repositories.client import ClientRepository
+from src.infrastructure.repositories.request import RequestRepository
+from src.interface.api.json_filters import parse_json_object, parse_tags
+
+def compile_sql(query):
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+def test_list_value_becomes_in_filter():
+    repository = RequestRepository(session=None)
+    query = repository._apply_filters(
+        select(repository.model_class),
+        {"status": ["pending", "approved"], "priority": "high", "budget_min__gte": 100}
+    )
+    sql = compile_sql(query)
+    assert "requests.status IN ('pending', 'approved')" in sql
+    assert "requests.priority = 'high'" in sql
+    assert "requests.budget_min >= 100" in sql
+
+def test_unknown_operator_is_rejected():
+    repository = RequestRepository(session=None)
+    with pytest.raises(ValueError):
+        repository._apply_filters(select(repository.model_class), {"status__regex": "x"})
+
+@pytest.mark.asyncio
+async def test_request_filters_are_passed_to_repository():
+    class FakeRepository:
+        async def list(self, filters=None, skip=0, limit=100, after_id=None):
+            self.filters = filters
+            return []
+
+    repository = FakeRepository()
+    await ListRequestsHandler(repository).handle(
+        ListRequestsQuery(client_id=3, status=["pending", "approved"], min_budget=10, max_budget=500)
+    )
+    assert repository.filters == {
+        "client_id": 3,
+        "status": ["pending", "approved"],
+        "budget_min__gte": 10,
+        "budget_max__lte": 500,
+    }
+
+def test_jsonb_operators():
+    repository = RequestRepository(session=None)
+    query = repository._apply_filters(
+        select(repository.model_class),
+        {"tags__contains": {"team": "ops"}, "required_specifications__has_key": ["voltage", "ports"]}
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "requests.tags @> %(param_1)s::JSONB" in sql
+    assert "requests.required_specifications ?& ARRAY[" in sql
+
+def test_tag_and_spec_parameters_become_jsonb_filters():
+    query = ListRequestsQuery(
+        tags=parse_tags(["team: ops", "site:berlin"]),
+        specifications=parse_json_object('{"ports": 48}', "spec"),
+        spec_keys=["voltage"]
+    )
+    assert ListRequestsHandler.build_filters(query) == {
+        "tags__contains": {"team": "ops", "site": "berlin"},
+        "required_specifications__contains": {"ports": 48},
+        "required_specifications__has_key": ["voltage"],
+    }
+    with pytest.raises(HTTPException):
+        parse_tags(["no-separator"])
+    with pytest.raises(HTTPException):
+        parse_json_object("[1, 2]", "spec")
+
+def test_fuzzy_match_ranks_by_similarity_and_pages_by_offset():
+    filters = ListClientsHandler.build_filters(ListClientsQuery(name="acme", match="fuzzy"))
+    assert filters == {"name__similar": "acme"}
+    repository = ClientRepository(session=None)
+    sql = compile_sql(repository.list_query(filters, skip=20, limit=10))
+    assert "clients.name %% 'acme'" in sql
+    assert "similarity(clients.name, 'acme') >= " in sql
+    assert "ORDER BY similarity(clients.name, 'acme') DESC, clients.id" in sql
+    assert "OFFSET 20" in sql
+    with pytest.raises(ValueError):
+        repository.list_query(filters, limit=10, after_id=5)
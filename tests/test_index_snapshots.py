@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.domain.services.embeddings import HashingEncoder
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import Client as ClientModel, Request as RequestModel
+from src.infrastructure.search.semantic import SemanticIndex
+from src.infrastructure.search.snapshots import (
+    DELETE, UPSERT, IndexSnapshot, SnapshotStore, open_snapshot, record_dtype
+)
+from src.infrastructure.search.vector_index import LayeredVectorIndex
+
+def unit_vectors(rows, dimensions, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(rows, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def test_snapshot_is_mapped_read_only_and_log_is_replayable(tmp_path):
+    vectors = unit_vectors(3, 8)
+    store = SnapshotStore(str(tmp_path), "requests", 8)
+    store.save(IndexSnapshot(
+        generation=1, as_of=100.0, encoder="hashing", ids=np.array([30, 10, 20]),
+        versions=np.array([3.0, 1.0, 2.0]), vectors=vectors, state=np.ones(8, dtype=np.float32)
+    ))
+    snapshot, records = store.load()
+    assert snapshot.ids.tolist() == [10, 20, 30] and snapshot.versions.tolist() == [1.0, 2.0, 3.0]
+    assert np.array_equal(snapshot.vectors[2], vectors[0]) and snapshot.state.tolist() == [1.0] * 8
+    assert not snapshot.vectors.flags.writeable and len(records) == 0
+
+    changes = np.zeros(2, dtype=record_dtype(8))
+    changes[0] = (UPSERT, b"", 40, 4.0, vectors[1])
+    changes[1] = (DELETE, b"", 10, 5.0, 0)
+    assert store.is_writer()
+    store.append(changes, generation=1)
+    # A record cut short by a crash is dropped
+    with open(store.log_path, "ab") as log:
+        log.write(changes[:1].tobytes()[:20])
+    records = store.load()[1]
+    assert records["id"].tolist() == [40, 10] and records["version"].tolist() == [4.0, 5.0] and store.log_size() == 2
+    assert records["op"].tolist() == [UPSERT, DELETE] and np.array_equal(records["vector"][0], vectors[1])
+
+    # Another worker's store cannot write, and nothing lands in a log that was replaced
+    other = SnapshotStore(str(tmp_path), "requests", 8)
+    assert not other.is_writer()
+    store.save(IndexSnapshot(2, 200.0, "hashing", snapshot.ids, snapshot.versions, snapshot.vectors, None))
+    store.append(changes, generation=1)
+    assert store.log_size() == 0 and other.log_generation() == 2 and open_snapshot(store.snapshot_path).state is None
+    store.close()
+    assert other.is_writer()
+    other.close()
+
+def test_layered_index_hides_changed_base_rows():
+    vectors = unit_vectors(4, 8)
+    index = LayeredVectorIndex(np.array([1, 2, 3]), vectors[:3])
+    index.upsert(2, vectors[3])
+    index.upsert(5, vectors[1])
+    assert index.remove(1) and not index.remove(9)
+    assert len(index) == 3 and sorted(index.ids.tolist()) == [2, 3, 5]
+    assert index.search(vectors[3], 1) == [(2, pytest.approx(1.0))]
+    assert index.search(vectors[0], 3, exclude=[5])[0][0] != 1 and 1 not in index
+    assert np.array_equal(index.vector(3), vectors[2]) and index.visible.tolist() == [False, False, True]
+
+@pytest.mark.asyncio
+async def test_workers_start_from_the_snapshot(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'snapshots.db'}")
+    directory = str(tmp_path / "indexes")
+    written = datetime.utcnow() - timedelta(hours=1)
+    indexes = []
+
+    def worker(**kwargs):
+        index = SemanticIndex(
+            RequestModel, HashingEncoder(dimensions=64), recheck=0, store=SnapshotStore(directory, "requests", 64),
+            max_age=3600, **kwargs
+        )
+        indexes.append(index)
+        return index
+
+    async def set_description(session, request_id, description):
+        await session.execute(
+            update(RequestModel).where(RequestModel.id == request_id)
+            .values(description=description, updated_at=datetime.utcnow())
+        )
+        await session.commit()
+
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(ClientModel(id=1, name="Acme", email="ops@acme.test"))
+            for request_id, description in (
+                (1, "Rack servers with GPUs for model training"),
+                (2, "Access switches with 48 PoE ports"),
+                (3, "All-flash storage with 200TB"),
+            ):
+                session.add(RequestModel(id=request_id, title=f"Request {request_id}", description=description,
+                                         client_id=1, equipment_category="server", required_specifications={},
+                                         quantity=1, priority="medium", status="pending", currency="USD",
+                                         updated_at=written))
+            await session.commit()
+
+            first = worker()
+            assert await first.similar_to_row(session, 1, 2) is not None
+            assert first.builds == 1 and first.loads == 1 and first.stats()["snapshot_generation"] == 1
+
+            # The first worker logs the change it applies
+            await set_description(session, 2, "GPU servers for model training")
+            first.mark_written(2)
+            assert (await first.similar_to_text(session, "gpu servers for model training", 1))[0][0] == 2
+            assert first.store.log_size() == 1
+
+            # A change no worker saw is caught up from the database
+            await set_description(session, 3, "Rack servers with GPUs")
+            second = worker()
+            hits = await second.similar_to_text(session, "gpu servers for model training", 3)
+            assert second.builds == 0 and second.loads == 1 and second.stats()["rows"] == 3
+            assert [hit[0] for hit in hits][0] == 2 and second.stats()["pending_rows"] == 0
+            assert np.array_equal(second.index.vector(2), first.index.vector(2))
+            assert np.allclose(second.index.vector(3), second.encoder.encode(["Request 3 Rack servers with GPUs server"])[0])
+
+            # Once the log is long enough the writer folds it into a new snapshot, and
+            # the other worker moves to it on its next update
+            first.compact_records = 1
+            await set_description(session, 1, "Storage shelves")
+            first.mark_written(1)
+            await first.similar_to_text(session, "storage", 1)
+            assert first.snapshot.generation == 2 and first.store.log_size() == 0 and first.builds == 1
+            second.mark_written(1)
+            assert (await second.similar_to_text(session, "storage shelves", 1))[0][0] == 1
+            assert second.snapshot.generation == 2 and second.builds == 0
+            assert len(second.index) == 3 and np.array_equal(second.index.vector(1), first.index.vector(1))
+    finally:
+        for index in indexes:
+            index.close()
+        await engine.dispose()
@@ -0,0 +1,144 @@
+"""
+Checks that every list query pattern can be answered from an index.
+
+Needs a Postgres database (TEST_DATABASE_URL, e.g. postgresql+asyncpg://...). The
+schema is created in a temporary schema inside a transaction that is rolled back.
+Sequential scans are disabled for the planner, so a Seq Scan in a plan means no
+index can serve that query.
+"""
+import json
+import os
+from datetime import datetime
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.application.use_cases.client.queries.list_clients import ListClientsHandler, ListClientsQuery
+from src.application.use_cases.equipment.queries.list_equipment import ListEquipmentHandler, ListEquipmentQuery
+from src.application.use_cases.offer.queries.list_offers import ListOffersHandler, ListOffersQuery
+from src.application.use_cases.request.queries.list_requests import ListRequestsHandler, ListRequestsQuery
+from src.application.use_cases.user.queries.list_users import ListUsersHandler, ListUsersQuery
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel,
+    Request as RequestModel, User as UserModel
+)
+from src.infrastructure.repositories.client import ClientRepository
+from src.infrastructure.repositories.equipment import EquipmentRepository
+from src.infrastructure.repositories.offer import OfferRepository
+from src.infrastructure.repositories.request import RequestRepository
+from src.infrastructure.repositories.user import UserRepository
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+ROWS = 2000
+
+# (repository, handler, query, keyset position)
+CASES = [
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(), 500),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(client_id=3), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(status=["pending", "approved"]), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(status="pending", is_active=True), 500),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(equipment_category="server"), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(priority="high"), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(min_budget=950), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(max_budget=20), None),
+    (OfferRepository, ListOffersHandler, ListOffersQuery(request_id=7), None),
+    (OfferRepository, ListOffersHandler, ListOffersQuery(equipment_id=7), None),
+    (OfferRepository, ListOffersHandler, ListOffersQuery(status="accepted"), 500),
+    (OfferRepository, ListOffersHandler, ListOffersQuery(status="pending", is_active=True), None),
+    (OfferRepository, ListOffersHandler, ListOffersQuery(min_price=990), None),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(category=["server", "storage"]), None),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(category="server", is_active=True), None),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(status="available"), 500),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(manufacturer="Maker 3"), None),
+    (UserRepository, ListUsersHandler, ListUsersQuery(role="admin"), None),
+    # Substring and fuzzy text filters (trigram)
+    (ClientRepository, ListClientsHandler, ListClientsQuery(name="ient 4"), None),
+    (ClientRepository, ListClientsHandler, ListClientsQuery(email="client7@", match="fuzzy"), None),
+    (UserRepository, ListUsersHandler, ListUsersQuery(username="user12"), 500),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(model="MX-12"), None),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(manufacturer="Makr 3", match="fuzzy"), None),
+    # JSONB containment and key existence (GIN)
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(specifications={"ports": 24}), None),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(spec_keys=["rack_units"]), None),
+    (EquipmentRepository, ListEquipmentHandler, ListEquipmentQuery(tags={"env": "lab"}), None),
+    (RequestRepository, ListRequestsHandler, ListRequestsQuery(tags={"team": "ops"}), None),
+    (OfferRepository, ListOffersHandler, ListOffersQuery(services=["installation"]), None),
+]
+
+def seed_rows(now):
+    statuses = ["draft", "pending", "approved", "rejected", "completed", "cancelled"]
+    yield ClientModel, [
+        {"id": i, "name": f"Client {i}", "email": f"client{i}@example.com", "created_at": now, "updated_at": now,
+         "is_active": True}
+        for i in range(1, 51)
+    ]
+    yield UserModel, [
+        {"id": i, "username": f"user{i}", "email": f"user{i}@example.com", "full_name": f"User {i}",
+         "hashed_password": "x", "role": ["admin", "manager", "user"][i % 3], "created_at": now, "updated_at": now,
+         "is_active": True}
+        for i in range(1, ROWS + 1)
+    ]
+    yield EquipmentModel, [
+        {"id": i, "name": f"Item {i}", "model": f"MX-{i % 200}", "serial_number": f"SN-{i}", "manufacturer": f"Maker {i % 40}",
+         "category": ["server", "network", "storage", "other"][i % 4],
+         "status": ["available", "in_use", "maintenance", "retired", "reserved"][i % 5],
+         "specifications": {"ports": i % 48, **({"rack_units": 2} if i % 50 == 0 else {})},
+         "tags": {"env": "lab" if i % 100 == 0 else "prod"},
+         "created_at": now, "updated_at": now, "is_active": i % 10 != 0}
+        for i in range(1, ROWS + 1)
+    ]
+    yield RequestModel, [
+        {"id": i, "title": f"Request {i}", "description": "d", "client_id": 1 + i % 50,
+         "equipment_category": ["server", "network", "storage", "other"][i % 4], "quantity": 1,
+         "priority": ["low", "medium", "high"][i % 3], "status": statuses[i % 6], "budget_min": i % 1000,
+         "budget_max": i % 1000 + 10, "currency": "USD", "tags": {"team": "ops" if i % 100 == 0 else "it"}, "created_at": now, "updated_at": now,
+         "is_active": i % 10 != 0}
+        for i in range(1, ROWS + 1)
+    ]
+    yield OfferModel, [
+        {"id": i, "request_id": 1 + i % ROWS, "equipment_id": 1 + (i * 7) % ROWS, "price": i % 1000, "currency": "USD",
+         "quantity": 1, "warranty_period_months": 12, "status": ["draft", "pending", "accepted", "rejected"][i % 4],
+         "payment_terms": "30_days", "additional_services": {"installation": i % 100 == 0},
+         "created_at": now, "updated_at": now, "is_active": i % 10 != 0}
+        for i in range(1, ROWS + 1)
+    ]
+
+def node_types(plan):
+    yield plan["Node Type"]
+    for child in plan.get("Plans", []):
+        yield from node_types(child)
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_list_queries_do_not_scan_tables():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                await connection.execute(text("CREATE SCHEMA index_check"))
+                await connection.execute(text("SET LOCAL search_path TO index_check, public"))
+                await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+                await connection.run_sync(Base.metadata.create_all)
+                for model, rows in seed_rows(datetime.utcnow()):
+                    await connection.execute(insert(model), rows)
+                    await connection.execute(text(f"ANALYZE {model.__tablename__}"))
+                await connection.execute(text("SET LOCAL enable_seqscan = off"))
+
+                scans = []
+                for repository_class, handler_class, query, after_id in CASES:
+                    statement = repository_class(session=None).list_query(
+                        handler_class.build_filters(query), limit=query.limit + 1, after_id=after_id
+                    )
+                    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+                    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+                    plan = result.scalar_one()
+                    plan = json.loads(plan) if isinstance(plan, str) else plan
+                    if "Seq Scan" in node_types(plan[0]["Plan"]):
+                        scans.append(f"{handler_class.__name__} {query}")
+                assert not scans, "Sequential scans:\n" + "\n".join(scans)
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
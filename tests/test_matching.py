@@ -0,0 +1,122 @@
+import time
+from datetime import datetime
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.application.use_cases.request.queries.match_equipment import (
+    MatchRequestEquipmentHandler, MatchRequestEquipmentQuery
+)
+from src.domain.services.matching import (
+    CATEGORY_EXACT, CATEGORY_OTHER, SPEC_DIFFERENT, SPEC_EQUAL, SPEC_MISSING, STATUSES, MatchCandidates, MatchScorer
+)
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel, Request as RequestModel
+)
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.repositories.equipment import EquipmentRepository
+
+AVAILABLE, IN_USE = STATUSES.index("available"), STATUSES.index("in_use")
+
+def candidates(*rows, spec_count=1):
+    return MatchCandidates.from_rows(rows, spec_count)
+
+def test_scores_every_criterion():
+    scorer = MatchScorer()
+    pool = candidates(
+        (1, CATEGORY_EXACT, AVAILABLE, 100.0, SPEC_EQUAL),
+        (2, CATEGORY_OTHER, AVAILABLE, -1, SPEC_EQUAL),
+        (3, CATEGORY_EXACT, IN_USE, 150.0, SPEC_DIFFERENT),
+        (4, CATEGORY_EXACT, AVAILABLE, 400.0, SPEC_MISSING),
+    )
+    top = scorer.top(pool, quantity=2, budget_max=300.0, limit=10)
+    assert [match.equipment_id for match in top] == [1, 2, 3, 4]
+    assert top[0].breakdown == {"category": 1.0, "specifications": 1.0, "availability": 1.0, "price": 1.0}
+    assert top[0].score == 1.0
+    # No price history is neutral; 800 for a budget of 300 is far over it
+    assert top[1].breakdown["price"] == 0.5 and top[1].breakdown["category"] == 0.5
+    assert top[2].breakdown["price"] == 1.0 and top[2].breakdown["specifications"] == 0.25
+    assert top[2].breakdown["availability"] == 0.3
+    assert top[3].breakdown["price"] == 0.0 and top[3].breakdown["specifications"] == 0.0
+
+def test_without_specifications_or_budget():
+    pool = candidates((5, CATEGORY_EXACT, AVAILABLE, 10.0), (6, CATEGORY_EXACT, AVAILABLE, -1), spec_count=0)
+    top = MatchScorer().top(pool, quantity=1, budget_max=None, limit=5)
+    assert [match.breakdown["specifications"] for match in top] == [1.0, 1.0]
+    assert [match.breakdown["price"] for match in top] == [0.5, 0.5]
+    assert MatchScorer().top(candidates(spec_count=0), quantity=1, budget_max=None, limit=5) == []
+
+def test_ties_at_the_cut_go_to_the_lowest_id():
+    pool = candidates(*((i, CATEGORY_EXACT, AVAILABLE, -1) for i in (9, 3, 7, 1, 5)), spec_count=0)
+    assert [match.equipment_id for match in MatchScorer().top(pool, 1, None, limit=3)] == [1, 3, 5]
+
+def test_weights_are_normalized():
+    scorer = MatchScorer({"specifications": 3, "price": 1})
+    pool = candidates((1, CATEGORY_OTHER, IN_USE, -1, SPEC_EQUAL))
+    assert scorer.top(pool, 1, 100.0, limit=1)[0].score == 0.875
+
+def test_scores_100k_candidates_quickly():
+    rng = np.random.default_rng(7)
+    rows = 100_000
+    pool = MatchCandidates(
+        ids=np.arange(1, rows + 1),
+        category=rng.integers(1, 3, rows),
+        status=rng.integers(0, 4, rows),
+        specifications=rng.integers(0, 3, (rows, 4)),
+        unit_price=np.where(rng.random(rows) < 0.3, np.nan, rng.uniform(10, 1000, rows))
+    )
+    scorer = MatchScorer()
+    scorer.top(pool, 3, 1500.0, limit=20)
+    started = time.perf_counter()
+    top = scorer.top(pool, 3, 1500.0, limit=20)
+    assert time.perf_counter() - started < 0.1
+    assert len(top) == 20 and all(a.score >= b.score for a, b in zip(top, top[1:]))
+
+def test_candidate_query_prefilters_in_sql():
+    query = EquipmentRepository(session=None).match_candidates_query(
+        "server", {"ports": 48, "os": "linux"}, "USD", datetime(2025, 1, 1)
+    )
+    compiled = query.compile(dialect=postgresql.dialect())
+    sql, params = str(compiled), compiled.params
+    assert "equipment.category IN" in sql and params["category_2"] == ["server", "other"]
+    assert "equipment.status != %(status_1)s" in sql and params["status_1"] == "retired"
+    # Numeric specifications are compared as normalized values, others as JSON
+    assert "equipment_spec_values.value >= %(value_1)s" in sql and params["value_1"] == 48.0
+    assert "equipment.specifications @> %(param_18)s::JSONB" in sql and params["param_18"] == {"os": "linux"}
+    assert "offers.created_at >= %(created_at_1)s" in sql
+
+@pytest.mark.asyncio
+async def test_handler_returns_best_equipment(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'matching.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    now = datetime.utcnow()
+    async with AsyncSession(engine) as session:
+        session.add(ClientModel(id=1, name="Acme", email="ops@acme.test"))
+        for equipment_id, category, status in ((1, "server", "in_use"), (2, "server", "available"),
+                                               (3, "network", "available"), (4, "other", "retired")):
+            session.add(EquipmentModel(id=equipment_id, name=f"Item {equipment_id}", model="M",
+                                       serial_number=f"SN-{equipment_id}", manufacturer="Maker",
+                                       category=category, status=status, is_active=True))
+        session.add(RequestModel(id=1, title="Servers", description="d", client_id=1, equipment_category="server",
+                                 required_specifications={}, quantity=2, priority="high", status="pending",
+                                 budget_max=100.0, currency="USD", created_at=now))
+        session.add(OfferModel(id=1, request_id=1, equipment_id=2, price=400, currency="USD", quantity=1,
+                               warranty_period_months=12, status="pending", payment_terms="30_days", created_at=now))
+        await session.commit()
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with UnitOfWork(session_factory, read_only=True) as uow:
+        handler = MatchRequestEquipmentHandler(uow.repositories.get_request_repository(), uow.repositories)
+        # Equipment comes from the unit of work's factory, with its session and read caching
+        assert handler.equipment is uow.repositories.get_equipment_repository() and handler.equipment.cache_reads
+        matches = await handler.handle(MatchRequestEquipmentQuery(request_id="1"))
+        assert await handler.handle(MatchRequestEquipmentQuery(request_id="99")) is None
+    await engine.dispose()
+
+    # Equipment 2 is available but priced far over budget; network and retired items are skipped
+    assert [(match.equipment.id, match.breakdown["price"]) for match in matches] == [(2, 0.0), (1, 0.5)]
+    assert matches[0].breakdown["availability"] == 1.0 and matches[1].breakdown["availability"] == 0.3
@@ -0,0 +1,170 @@
+import asyncio
+from datetime import date, datetime
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.application.search.cache import CachingTranslator
+from src.application.search.model import LocalModelStub, ModelTranslator
+from src.application.search.rules import RuleBasedTranslator
+from src.application.search.translation import TranslationError, query_to_filters
+from src.application.use_cases.search.queries import natural_language_search
+from src.application.use_cases.search.queries.natural_language_search import (
+    NaturalLanguageSearchHandler, NaturalLanguageSearchQuery
+)
+from src.domain.services.specifications import SpecConstraint
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel, Request as RequestModel
+)
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.repositories.factory import RepositoryFactory
+
+TODAY = date(2025, 3, 18)
+
+def translate(text):
+    translation = RuleBasedTranslator().translate_text(text, TODAY)
+    return translation.entity, query_to_filters(translation.query), translation.notes
+
+def test_rules_translate_phrases():
+    assert translate("Urgent server requests over 10k EUR from last month") == ("requests", {
+        "equipment_category": ["server"], "priority": "high", "min_budget": 10000.0, "currency": "EUR",
+        "created_from": "2025-02-01T00:00:00", "created_to": "2025-03-01T00:00:00",
+    }, [])
+    assert translate("pending quotes under $5,000 for request 12 in the past 7 days") == ("offers", {
+        "request_id": 12, "status": ["pending"], "max_price": 5000.0, "currency": "USD",
+        "created_from": "2025-03-12T00:00:00", "created_to": "2025-03-19T00:00:00",
+    }, [])
+    entity, filters, _ = translate("available servers with power over 0.4kW and weight at most 40kg")
+    assert entity == "equipment"
+    assert filters == {"category": ["server"], "status": ["available"], "spec_ranges": ["power>400W", "weight<=40kg"]}
+    # Understood but meaningless for the entity: reported rather than silently applied
+    assert translate("equipment over 500 EUR") == ("equipment", {}, ["Amounts and currencies do not apply to equipment"])
+    with pytest.raises(TranslationError):
+        translate(" ?! ")
+
+def test_rules_reject_empty_or_out_of_range_dates():
+    for text in ("requests last 5000 years", "requests from the past 99999 years", "requests from the past 0 days",
+                 "requests in the past 99999999999999999999 days", "offers last 10000000000000 weeks"):
+        with pytest.raises(TranslationError):
+            translate(text)
+
+    with pytest.raises(TranslationError, match="Empty"):
+        translate("offers in the past 0 weeks")
+
+def test_rules_reject_inverted_ranges_and_report_ignored_words():
+    for text, error in (("requests between 10k and 5k", "Empty amount range"), ("offers over $9k under $2k", "Empty"),
+                        ("over 1e400 EUR", "Amount out of range"), ("requests since 2025-13-01", "Invalid date"),
+                        ("requests since 2025-05-01 before 2025-04-01", "Empty date range")):
+        with pytest.raises(TranslationError, match=error):
+            translate(text)
+    assert translate("requests over 1.5e4 usd")[1] == {"min_budget": 15000.0, "currency": "USD"}
+    assert translate("equipment made by cisco") == ("equipment", {}, ["Ignored 'made by cisco'"])
+    assert translate("show me the open rfqs for client #4, please")[2] == []
+    assert translate("offers for client 3, green ones")[2] == ["Ignored 'client 3'", "Ignored 'green ones'"]
+
+def test_rules_reject_ids_out_of_range():
+    assert translate("requests for client 2147483647")[1] == {"client_id": 2147483647}
+    for text in ("requests for client 99999999999999999999", "offers for request 0", "offers for equipment #2147483648"):
+        with pytest.raises(TranslationError):
+            translate(text)
+    with pytest.raises(TranslationError):
+        ModelTranslator(LocalModelStub()).parse('{"entity": "offers", "filters": {"request_id": 4294967296}}')
+
+@pytest.mark.asyncio
+async def test_relative_dates_default_to_the_utc_day(monkeypatch):
+    days = []
+
+    class Recording(RuleBasedTranslator):
+        async def translate(self, text, today):
+            days.append(today)
+            raise TranslationError("stop")
+
+    class LateEvening(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            # 23:30 in UTC-5 is already the next day in UTC
+            return datetime(2025, 3, 19, 4, 30, tzinfo=tz)
+
+    monkeypatch.setattr(natural_language_search, "datetime", LateEvening)
+    handler = NaturalLanguageSearchHandler(RepositoryFactory(None), CachingTranslator(Recording(), LRUCache(maxsize=10)))
+    with pytest.raises(TranslationError):
+        await handler.handle(NaturalLanguageSearchQuery(text="requests from today"))
+    assert days == [date(2025, 3, 19)]
+
+@pytest.mark.asyncio
+async def test_model_translator_validates_answers():
+    model = ModelTranslator(LocalModelStub(), timeout=1)
+    translation = await model.translate("storage requests between 5k and 8k usd since 2025-01-01", TODAY)
+    rules = RuleBasedTranslator().translate_text("storage requests between 5k and 8k usd since 2025-01-01", TODAY)
+    assert translation.translator == "model" and translation.query == rules.query
+
+    spec = await model.translate("devices with power over 400W", TODAY)
+    assert spec.query.spec_ranges == [SpecConstraint("power", "W", minimum=400.0, min_inclusive=False, max_inclusive=False)]
+
+    for answer in ('Sure! {"entity": "requests", "filters": {"colour": "red"}}', "no idea",
+                   '{"entity": "invoices", "filters": {}}', '{"entity": "offers", "filters": {"min_price": "cheap"}}'):
+        with pytest.raises(TranslationError):
+            model.parse(answer)
+
+    async def slow(prompt):
+        await asyncio.sleep(1)
+    with pytest.raises(TranslationError):
+        await ModelTranslator(slow, timeout=0.01).translate("requests", TODAY)
+
+@pytest.mark.asyncio
+async def test_repeated_questions_skip_the_translator():
+    class Counting(RuleBasedTranslator):
+        calls = 0
+
+        async def translate(self, text, today):
+            Counting.calls += 1
+            return await super().translate(text, today)
+
+    translator = CachingTranslator(Counting(), LRUCache(maxsize=10))
+    first, cached, _ = await translator.translate("Urgent server requests", TODAY)
+    again, cached_again, elapsed = await translator.translate("  urgent   SERVER requests?", TODAY)
+    assert (cached, cached_again, elapsed) == (False, True, 0.0) and again is first
+    # Relative dates depend on the day, so it is part of the key
+    await translator.translate("urgent server requests", date(2025, 3, 19))
+    with pytest.raises(TranslationError):
+        await translator.translate("", TODAY)
+    stats = translator.stats()
+    assert Counting.calls == 3
+    assert (stats.calls, stats.cache_hits, stats.cache_misses, stats.errors) == (3, 1, 3, 1)
+    assert stats.latency_max_ms >= stats.latency_p95_ms >= 0
+
+@pytest.mark.asyncio
+async def test_search_runs_the_translated_query(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'nl.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(ClientModel(id=1, name="Acme", email="ops@acme.test"))
+        session.add(EquipmentModel(id=1, name="Item", model="M", serial_number="SN-1", manufacturer="Maker",
+                                   category="server", status="available", is_active=True))
+        requests = [(1, "high", 12000, "EUR", 2), (2, "high", 12000, "USD", 2), (3, "low", 20000, "EUR", 2),
+                    (4, "high", 15000, "EUR", 3)]
+        for request_id, priority, budget, currency, month in requests:
+            session.add(RequestModel(id=request_id, title=f"Request {request_id}", description="d", client_id=1,
+                                     equipment_category="server", required_specifications={}, quantity=1,
+                                     priority=priority, status="pending", budget_min=budget, budget_max=budget,
+                                     currency=currency, created_at=datetime(2025, month, 10)))
+        session.add(OfferModel(id=1, request_id=1, equipment_id=1, price=900, currency="EUR", quantity=1,
+                               warranty_period_months=12, status="pending", payment_terms="30_days"))
+        await session.commit()
+
+    translator = CachingTranslator(RuleBasedTranslator(), LRUCache(maxsize=10))
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with UnitOfWork(session_factory, read_only=True) as uow:
+        handler = NaturalLanguageSearchHandler(uow.repositories, translator=translator)
+        result = await handler.handle(NaturalLanguageSearchQuery(
+            text="urgent server requests over 10k EUR from last month", today=TODAY
+        ))
+        offers = await handler.handle(NaturalLanguageSearchQuery(text="offers under 1000 eur", today=TODAY))
+    await engine.dispose()
+
+    assert result.entity == "requests" and not result.cached
+    assert [item.id for item in result.items] == [1]
+    assert [item.id for item in offers.items] == [1] and offers.filters == {"max_price": 1000.0, "currency": "EUR"}
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from src.application.dto.pagination import InvalidCursorError, Page, decode_cursor, encode_cursor
+from src.application.use_cases.offer.queries.list_offers import ListOffersHandler, ListOffersQuery
+from src.domain.entities.offer import Offer
+from src.infrastructure.repositories.offer import OfferRepository
+
+def compile_sql(query):
+    return str(query.compile(dialect=postgresql.dialect()))
+
+class FakeOfferRepository:
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = []
+
+    async def list(self, filters=None, skip=0, limit=100, after_id=None):
+        self.calls.append({"filters": filters, "skip": skip, "limit": limit, "after_id": after_id})
+        remaining = [i for i in self.ids if after_id is None or i > after_id][skip:]
+        return [
+            Offer(id=i, request_id=1, equipment_id=1, price=10, currency="EUR", quantity=1,
+                  warranty_period_months=12, status="pending", payment_terms="immediate")
+            for i in remaining[:limit]
+        ]
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42)) == 42
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(1)[:-2] + "!!"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+def test_page_only_has_next_cursor_when_more_rows_exist():
+    class Row:
+        def __init__(self, id):
+            self.id = id
+
+    full = Page.from_items([Row(1), Row(2), Row(3)], limit=2)
+    assert [row.id for row in full.items] == [1, 2]
+    assert decode_cursor(full.next_cursor) == 2
+
+    last = Page.from_items([Row(3)], limit=2)
+    assert last.next_cursor is None
+
+    ranked = Page.from_items([Row(3), Row(1), Row(2)], limit=2, keyset=False)
+    assert [row.id for row in ranked.items] == [3, 1]
+    assert ranked.next_cursor is None
+
+def test_keyset_query_orders_by_id_without_offset():
+    repository = OfferRepository(session=None)
+    sql = compile_sql(repository._paginate(select(repository.model_class), skip=0, limit=10, after_id=5))
+    assert "offers.id > " in sql
+    assert "ORDER BY offers.id" in sql
+    assert "OFFSET" not in sql
+
+def test_offset_query_is_ordered():
+    repository = OfferRepository(session=None)
+    sql = compile_sql(repository._paginate(select(repository.model_class), skip=20, limit=10, after_id=None))
+    assert "ORDER BY offers.id" in sql
+    assert "OFFSET" in sql
+
+@pytest.mark.asyncio
+async def test_handler_walks_pages_with_cursor():
+    repository = FakeOfferRepository(ids=list(range(1, 6)))
+    handler = ListOffersHandler(repository)
+
+    seen = []
+    cursor = None
+    while True:
+        page = await handler.handle(ListOffersQuery(limit=2, cursor=cursor))
+        seen.extend(offer.id for offer in page.items)
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert seen == [1, 2, 3, 4, 5]
+    assert repository.calls[-1]["after_id"] == 4
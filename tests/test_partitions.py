@@ -0,0 +1,146 @@
+import json
+import os
+from datetime import date, datetime
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.application.use_cases.request.queries.list_requests import ListRequestsHandler, ListRequestsQuery
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel, Request as RequestModel
+)
+from src.infrastructure.database.partitions import (
+    PartitionMaintainer, add_months, dependent_columns, partition_month, partitioned_tables
+)
+from src.infrastructure.repositories.request import RequestRepository
+from src.interface.api.date_filters import created_window
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+def test_partitioned_tables():
+    assert [table.name for table in partitioned_tables()] == ["requests", "offers"]
+    table = RequestModel.__table__
+    assert [column.name for column in table.primary_key.columns] == ["id", "created_at"]
+
+def test_month_arithmetic_and_names():
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_month("requests", "requests_2025_06") == date(2025, 6, 1)
+    assert partition_month("requests", "requests_default") is None
+    assert partition_month("requests", "offers_2025_06") is None
+
+def test_maintainer_premakes_and_expires_whole_months():
+    maintainer = PartitionMaintainer(engine=None, premake=2, retention_months=3)
+    assert maintainer.wanted_months(date(2025, 12, 15)) == [date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)]
+    partitions = ["requests_default", "requests_2025_07", "requests_2025_08", "requests_2025_09", "requests_2025_10"]
+    # Three full months are kept before the current one
+    assert maintainer.expired("requests", partitions, date(2025, 12, 15)) == ["requests_2025_07", "requests_2025_08"]
+    assert PartitionMaintainer(engine=None).expired("requests", partitions, date(2025, 12, 15)) == []
+    assert maintainer.create_statement("offers", date(2025, 12, 1)) == (
+        "CREATE TABLE IF NOT EXISTS offers_2025_12 PARTITION OF offers "
+        "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')"
+    )
+
+def test_requests_partitions_check_the_offers_referencing_them():
+    [(column, referenced)] = dependent_columns(RequestModel.__table__)
+    assert (str(column), str(referenced)) == ("offers.request_id", "requests.id")
+    assert dependent_columns(OfferModel.__table__) == []
+    assert PartitionMaintainer.referenced_statement(column, referenced, "requests_2025_01") == (
+        "SELECT 1 FROM offers WHERE request_id IN (SELECT id FROM requests_2025_01) LIMIT 1"
+    )
+
+def test_created_window_is_half_open_and_utc():
+    query = ListRequestsQuery(created_from=datetime(2025, 5, 1), created_to=datetime(2025, 6, 1))
+    filters = ListRequestsHandler.build_filters(query)
+    assert filters == {"created_at__gte": datetime(2025, 5, 1), "created_at__lt": datetime(2025, 6, 1)}
+    sql = str(RequestRepository(session=None).list_query(filters, limit=10).compile(dialect=postgresql.dialect()))
+    assert "requests.created_at >=" in sql and "requests.created_at <" in sql
+
+    aware = datetime.fromisoformat("2025-05-01T02:00:00+02:00")
+    assert created_window(aware, None) == (datetime(2025, 5, 1), None)
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_created_window_prunes_partitions():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                await connection.execute(text("CREATE SCHEMA partition_check"))
+                await connection.execute(text("SET LOCAL search_path TO partition_check, public"))
+                await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+                await connection.run_sync(Base.metadata.create_all)
+                for month in (date(2025, 4, 1), date(2025, 5, 1), date(2025, 6, 1)):
+                    await connection.execute(text(PartitionMaintainer.create_statement("requests", month)))
+                await connection.execute(insert(ClientModel).values(id=1, name="Acme", email="ops@acme.test"))
+                await connection.execute(insert(RequestModel), [
+                    {"title": f"Request {day}", "description": "d", "client_id": 1, "equipment_category": "server",
+                     "quantity": 1, "priority": "low", "status": "pending", "currency": "USD",
+                     "created_at": datetime(2025, 4 + day % 3, 1 + day % 28)}
+                    for day in range(90)
+                ])
+
+                filters = ListRequestsHandler.build_filters(
+                    ListRequestsQuery(created_from=datetime(2025, 5, 1), created_to=datetime(2025, 6, 1))
+                )
+                statement = RequestRepository(session=None).list_query(filters, limit=11)
+                compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+                plan = result.scalar_one()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+
+                def relations(node):
+                    if "Relation Name" in node:
+                        yield node["Relation Name"]
+                    for child in node.get("Plans", []):
+                        yield from relations(child)
+
+                assert set(relations(plan[0]["Plan"])) == {"requests_2025_05"}
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_expired_requests_partitions_outlive_their_offers():
+    admin = create_async_engine(TEST_DATABASE_URL)
+    engine = create_async_engine(
+        TEST_DATABASE_URL, connect_args={"server_settings": {"search_path": "retention_check, public"}}
+    )
+    try:
+        async with admin.begin() as connection:
+            await connection.execute(text("CREATE SCHEMA retention_check"))
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            for table in ("requests", "offers"):
+                for month in (date(2025, 1, 1), date(2025, 2, 1)):
+                    await connection.execute(text(PartitionMaintainer.create_statement(table, month)))
+            await connection.execute(insert(ClientModel).values(id=1, name="Acme", email="ops@acme.test"))
+            await connection.execute(insert(EquipmentModel).values(
+                id=1, name="Pump", model="P1", serial_number="SN-1", manufacturer="Siemens", category="medical",
+                status="available"
+            ))
+            await connection.execute(insert(RequestModel).values(
+                id=1, title="Pumps", description="d", client_id=1, equipment_category="server", quantity=1,
+                priority="low", status="pending", currency="USD", created_at=datetime(2025, 1, 5)
+            ))
+            await connection.execute(insert(OfferModel).values(
+                id=1, request_id=1, equipment_id=1, price=10, currency="USD", quantity=1, warranty_period_months=12,
+                status="pending", payment_terms="30_days", created_at=datetime(2025, 2, 3)
+            ))
+
+        maintainer = PartitionMaintainer(engine, premake=0, retention_months=1)
+        # January expires, but an offer of February still points at a January request
+        assert (await maintainer.maintain(date(2025, 3, 15)))["dropped"] == ["offers_2025_01"]
+        async with engine.begin() as connection:
+            await connection.execute(text("DELETE FROM offers"))
+        assert (await maintainer.maintain(date(2025, 3, 15)))["dropped"] == ["requests_2025_01"]
+    finally:
+        await engine.dispose()
+        async with admin.begin() as connection:
+            await connection.execute(text("DROP SCHEMA IF EXISTS retention_check CASCADE"))
+        await admin.dispose()
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.application.use_cases.request.queries.list_request_summaries import ListRequestSummariesHandler
+from src.application.use_cases.request.queries.list_requests import ListRequestsQuery
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel, Request as RequestModel
+)
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.repositories.request import RequestRepository
+
+def test_summary_is_one_statement_over_the_page():
+    query = RequestRepository(session=None).summary_query({"status": "pending"}, limit=11, after_id=5)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH page AS")
+    # Offers are only read for the requests of the page
+    assert "FROM offers JOIN page ON page.id = offers.request_id" in sql
+    assert "requests.id > %(id_1)s ORDER BY requests.id" in sql
+    assert "OVER (PARTITION BY offers.request_id" in sql
+
+@pytest.mark.asyncio
+async def test_summaries_carry_offer_figures(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'summary.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    now = datetime.utcnow()
+    async with AsyncSession(engine) as session:
+        session.add(ClientModel(id=1, name="Acme", email="ops@acme.test"))
+        session.add(EquipmentModel(id=1, name="Item", model="M", serial_number="SN-1", manufacturer="Maker",
+                                   category="server", status="available", is_active=True))
+        for request_id in (1, 2, 3):
+            session.add(RequestModel(id=request_id, title=f"Request {request_id}", description="d", client_id=1,
+                                     equipment_category="server", required_specifications={}, quantity=1,
+                                     priority="high", status="pending", currency="USD", created_at=now))
+        offers = [
+            # (id, request, price, currency, status, age in days, deleted)
+            (1, 1, 300, "USD", "pending", 3, False),
+            (2, 1, 100, "USD", "rejected", 2, False),
+            (3, 1, 50, "EUR", "accepted", 1, False),
+            (4, 1, 10, "USD", "pending", 0, True),
+            (5, 2, 80, "GBP", "pending", 0, False),
+        ]
+        for offer_id, request_id, price, currency, status, age, deleted in offers:
+            session.add(OfferModel(id=offer_id, request_id=request_id, equipment_id=1, price=price, currency=currency,
+                                   quantity=1, warranty_period_months=12, status=status, payment_terms="30_days",
+                                   created_at=now - timedelta(days=age), deleted_at=now if deleted else None))
+        await session.commit()
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with UnitOfWork(session_factory, read_only=True) as uow:
+        handler = ListRequestSummariesHandler(uow.repositories.get_request_repository())
+        first = await handler.handle(ListRequestsQuery(limit=2, count="exact"))
+        second = await handler.handle(ListRequestsQuery(limit=2, cursor=first.next_cursor))
+    await engine.dispose()
+
+    assert [summary.request.id for summary in first.items] == [1, 2] and first.total == 3
+    one, two = first.items
+    # The deleted offer is ignored; the EUR offer counts but is not priced against USD
+    assert (one.offer_count, one.min_price, one.max_price, one.avg_price) == (3, Decimal("100"), Decimal("300"), 200.0)
+    assert (one.best_offer_id, one.latest_offer_id, one.latest_offer_status) == (2, 3, "accepted")
+    assert (two.offer_count, two.min_price, two.best_offer_id, two.latest_offer_id) == (1, None, None, 5)
+
+    assert [summary.request.id for summary in second.items] == [3] and second.next_cursor is None
+    assert second.items[0].offer_count == 0 and second.items[0].latest_offer_status is None
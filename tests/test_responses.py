@@ -0,0 +1,28 @@
+import json
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from src.domain.entities.equipment import Equipment
+from src.interface.api.responses import entity_list_response
+
+def make_equipment(i):
+    return Equipment(
+        id=i, name=f"pump-{i}", model="MOD-1", serial_number=f"SN-{i}", manufacturer="Siemens",
+        category="medical", status="available", specifications={"power": "500W"}
+    )
+
+def test_entity_list_response_matches_default_serialization():
+    items = [make_equipment(1), make_equipment(2)]
+    response = entity_list_response(items, Equipment, Response())
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(items)
+
+def test_entity_list_response_keeps_headers_set_on_injected_response():
+    injected = Response()
+    del injected.headers["content-length"]
+    injected.headers["X-Next-Cursor"] = "abc"
+    injected.set_cookie("db_primary_until", "1")
+    response = entity_list_response([], Equipment, injected)
+    assert response.body == b"[]"
+    assert response.headers["x-next-cursor"] == "abc"
+    assert "db_primary_until" in response.headers["set-cookie"]
+    assert response.headers["content-length"] == "2"
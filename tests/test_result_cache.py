@@ -0,0 +1,108 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.equipment import Equipment
+from src.infrastructure.cache import entities
+from src.infrastructure.cache.results import VersionedResultCache
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.repositories import base_sql
+
+@pytest.mark.asyncio
+async def test_stale_result_is_served_while_one_caller_refreshes():
+    cache = VersionedResultCache(maxsize=10)
+    calls = []
+    release = asyncio.Event()
+
+    async def load():
+        calls.append(len(calls))
+        if len(calls) > 1:
+            await release.wait()
+        return [len(calls)]
+
+    assert await cache.get_or_load("offers", "key", load) == [1]
+    assert await cache.get_or_load("offers", "key", load) == [1]
+    cache.bump("offers")
+    refresh = asyncio.create_task(cache.get_or_load("offers", "key", load))
+    await asyncio.sleep(0)
+    # Another caller gets the previous result instead of running the query again
+    assert await cache.get_or_load("offers", "key", load) == [1]
+    release.set()
+    assert await refresh == [2]
+    assert await cache.get_or_load("offers", "key", load) == [2]
+    assert len(calls) == 2
+    assert cache.stats()["stale_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_write_during_load_leaves_result_stale():
+    cache = VersionedResultCache(maxsize=10)
+    results = iter([["old"], ["new"]])
+
+    async def load():
+        value = next(results)
+        cache.bump("offers")
+        return value
+
+    assert await cache.get_or_load("offers", "key", load) == ["old"]
+    assert await cache.get_or_load("offers", "key", load) == ["new"]
+
+@pytest.mark.asyncio
+async def test_replica_results_are_not_stored_right_after_a_write():
+    now = [0.0]
+    cache = VersionedResultCache(maxsize=10, lag=30, clock=lambda: now[0])
+    loads = []
+
+    async def load():
+        loads.append(now[0])
+        return len(loads)
+
+    assert await cache.get_or_load("offers", "key", load, replica=True) == 1
+    cache.bump("offers")
+    now[0] = 10
+    # The replica may not have the write yet: served, but loaded again next time
+    assert await cache.get_or_load("offers", "key", load, replica=True) == 2
+    assert await cache.get_or_load("offers", "key", load, replica=True) == 3
+    assert cache.stats()["uncached"] == 2
+    # The primary has it; so do replicas once the lag window is over
+    assert await cache.get_or_load("offers", "key", load) == 4
+    assert await cache.get_or_load("offers", "key", load, replica=True) == 4
+    cache.bump("offers")
+    now[0] = 45
+    assert await cache.get_or_load("offers", "key", load, replica=True) == 5
+    assert await cache.get_or_load("offers", "key", load, replica=True) == 5
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    cache = VersionedResultCache(maxsize=10)
+    monkeypatch.setattr(base_sql, "list_cache", cache)
+    monkeypatch.setattr(entities, "list_cache", cache)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lists.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+async def list_names(session_factory, **options):
+    async with UnitOfWork(session_factory, read_only=True, **options) as uow:
+        return [entity.name for entity in await uow.repositories.get_equipment_repository().list()]
+
+@pytest.mark.asyncio
+async def test_creating_a_row_refreshes_cached_lists(session_factory):
+    assert await list_names(session_factory) == []
+    assert await list_names(session_factory) == []
+    async with UnitOfWork(session_factory) as uow:
+        await uow.repositories.get_equipment_repository().create(Equipment(
+            name="Pump", model="P1", serial_number="SN-1", manufacturer="Siemens",
+            category="medical", status="available"
+        ))
+    assert await list_names(session_factory) == ["Pump"]
+    assert base_sql.list_cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_reads_pinned_to_the_primary_skip_cached_lists(session_factory):
+    assert await list_names(session_factory) == []
+    assert await list_names(session_factory, prefer_primary=True) == []
+    assert base_sql.list_cache.stats()["hits"] == 0 and base_sql.list_cache.stats()["misses"] == 1
@@ -0,0 +1,61 @@
+from datetime import datetime
+from decimal import Decimal
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel,
+    Request as RequestModel, User as UserModel
+)
+from src.infrastructure.repositories.factory import RepositoryFactory
+
+pytest.importorskip("aiosqlite")
+
+NOW = datetime(2024, 5, 1, 12, 0)
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([
+            UserModel(id=1, username="ann", email="ann@example.com", full_name="Ann",
+                      hashed_password="x", role="admin", phone_number="0044 20 7946", created_at=NOW, updated_at=NOW),
+            ClientModel(id=1, name="Acme", email="acme@example.com", phone_number="(555) 010",
+                        tags={"tier": "gold"}, created_at=NOW, updated_at=NOW),
+            EquipmentModel(id=1, name="Pump", model="P1", serial_number="SN-1", manufacturer="Siemens",
+                           category="medical", status="available", specifications=None, tags={"a": "b"},
+                           created_at=NOW, updated_at=NOW),
+            RequestModel(id=1, title="Pumps", description="Need pumps", client_id=1, equipment_category="medical",
+                         required_specifications={}, quantity=2, priority="urgent", status="in_progress",
+                         budget_min=10.0, budget_max=20.0, currency="USD", tags={"k": "v"},
+                         created_at=NOW, updated_at=NOW),
+            OfferModel(id=1, request_id=1, equipment_id=1, price=Decimal("99.50"), currency="USD", quantity=2,
+                       warranty_period_months=12, status="pending", additional_services={"install": True, "train": False},
+                       payment_terms="30_days", created_at=NOW, updated_at=NOW),
+        ])
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["user", "client", "equipment", "request", "offer"])
+async def test_row_path_matches_orm_mapping(session, name):
+    repository = getattr(RepositoryFactory(session), f"get_{name}_repository")()
+    assert repository.entity_class is not None
+    expected = repository._to_entity(await repository.get(1))
+    session.expunge_all()
+    listed = await repository.list()
+    streamed = [entity async for entity in repository.iter_all()]
+    assert listed == [expected]
+    assert streamed == [expected]
+
+@pytest.mark.asyncio
+async def test_version_queries_match_listed_entities(session):
+    repository = RepositoryFactory(session).get_equipment_repository()
+    listed = await repository.list()
+    assert await repository.list_versions() == [(entity.id, entity.updated_at) for entity in listed]
+    assert await repository.get_version(1) == (1, NOW)
+    assert await repository.get_version(2) is None
@@ -0,0 +1,102 @@
+import os
+from datetime import datetime
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.application.dto.pagination import InvalidCursorError, Page, decode_rank_cursor, encode_cursor, encode_rank_cursor
+from src.application.use_cases.request.queries.list_requests import ListRequestsQuery
+from src.application.use_cases.request.queries.search_requests import SearchRequestsHandler, SearchRequestsQuery
+from src.domain.entities.equipment import Equipment
+from src.domain.repositories.base import SearchHit
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import Client as ClientModel, Request as RequestModel
+from src.infrastructure.repositories.request import RequestRepository
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+def make_hit(i, rank):
+    item = Equipment(
+        id=i, name=f"pump-{i}", model="MOD-1", serial_number=f"SN-{i}", manufacturer="Siemens",
+        category="medical", status="available"
+    )
+    return SearchHit[Equipment](item=item, rank=rank, headline=f"<b>pump</b>-{i}")
+
+def test_rank_cursor_round_trip():
+    assert decode_rank_cursor(encode_rank_cursor(0.0607927, 42)) == (0.0607927, 42)
+    with pytest.raises(InvalidCursorError):
+        decode_rank_cursor(encode_cursor(42))
+
+def test_ranked_page_continues_after_the_last_hit():
+    page = Page.from_ranked([make_hit(7, 0.9), make_hit(3, 0.5), make_hit(4, 0.5)], limit=2)
+    assert [hit.item.id for hit in page.items] == [7, 3]
+    assert decode_rank_cursor(page.next_cursor) == (0.5, 3)
+    assert Page.from_ranked([make_hit(4, 0.5)], limit=2).next_cursor is None
+
+def test_search_query_ranks_ids_before_loading_the_page():
+    statement = RequestRepository(session=None).search_query(
+        "pump -vacuum", {"status": "pending"}, limit=21, after=(0.5, 10)
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    inner = sql[sql.index("JOIN (") :]
+    # Matching, filters and the keyset condition are applied before the join
+    assert "requests.search_vector @@ websearch_to_tsquery" in inner
+    assert "requests.status = " in inner
+    assert "ts_rank(requests.search_vector" in inner and "requests.id > " in inner
+    # The snippet is computed by the outer query only
+    assert "ts_headline" in sql[: sql.index("JOIN (")]
+    assert sql.rstrip().endswith("ORDER BY anon_1.rank DESC, requests.id")
+
+@pytest.mark.asyncio
+async def test_search_handler_passes_filters_and_cursor():
+    class FakeRepository:
+        async def search(self, text, filters=None, limit=20, after=None):
+            self.call = (text, filters, limit, after)
+            return [make_hit(1, 0.4), make_hit(2, 0.3)]
+
+    repository = FakeRepository()
+    page = await SearchRequestsHandler(repository).handle(SearchRequestsQuery(
+        text="pump", filters=ListRequestsQuery(priority="high"), limit=1, cursor=encode_rank_cursor(0.5, 9)
+    ))
+    assert repository.call == ("pump", {"priority": "high"}, 2, (0.5, 9))
+    assert [hit.item.id for hit in page.items] == [1]
+    assert decode_rank_cursor(page.next_cursor) == (0.4, 1)
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_search_ranks_highlights_and_pages_through_matches():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                await connection.execute(text("CREATE SCHEMA search_check"))
+                await connection.execute(text("SET LOCAL search_path TO search_check, public"))
+                await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+                await connection.run_sync(Base.metadata.create_all)
+                now = datetime.utcnow()
+                await connection.execute(insert(ClientModel), [
+                    {"id": 1, "name": "Client", "email": "client@example.com", "created_at": now, "updated_at": now}
+                ])
+                titles = ["Infusion pump", "Vacuum pump for lab", "Centrifuge", "Spare parts", "Pump station"]
+                await connection.execute(insert(RequestModel), [
+                    {"id": i, "title": title, "description": "pump" if i == 4 else "equipment request",
+                     "client_id": 1, "equipment_category": "medical", "quantity": 1, "priority": "high",
+                     "status": "pending", "currency": "USD", "created_at": now, "updated_at": now}
+                    for i, title in enumerate(titles, start=1)
+                ])
+
+                repository = RequestRepository(AsyncSession(bind=connection))
+                hits = await repository.search("pump -vacuum", limit=10)
+                # Title matches (weight A) rank above the description match (weight B)
+                assert [hit.item.id for hit in hits][-1] == "4"
+                assert {hit.item.id for hit in hits} == {"1", "4", "5"}
+                assert "<b>pump</b>" in hits[0].headline.lower()
+
+                first = await repository.search("pump -vacuum", limit=2)
+                rest = await repository.search("pump -vacuum", limit=10, after=(first[-1].rank, int(first[-1].item.id)))
+                assert [hit.item.id for hit in first + rest] == [hit.item.id for hit in hits]
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
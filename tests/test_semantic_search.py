@@ -0,0 +1,120 @@
+import time
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.application.use_cases.equipment.queries.semantic_search_equipment import (
+    SemanticSearchEquipmentHandler, SemanticSearchEquipmentQuery
+)
+from src.application.use_cases.request.queries.similar_requests import SimilarRequestsHandler, SimilarRequestsQuery
+from src.domain.entities.equipment import Equipment
+from src.domain.entities.request import Request
+from src.domain.services.embeddings import HashingEncoder, document_text
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Request as RequestModel
+)
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.search.semantic import SemanticIndex, semantic_indexes
+from src.infrastructure.search.vector_index import VectorIndex
+
+def test_hashing_encoder_ranks_related_text_higher():
+    encoder = HashingEncoder(dimensions=256)
+    texts = ["rack server with 64GB memory", "48 port network switch", "servers with lots of memory", ""]
+    encoder.fit(texts)
+    vectors = encoder.encode(texts)
+    assert vectors.dtype == np.float32 and vectors.shape == (4, 256)
+    assert np.allclose(np.linalg.norm(vectors[:3], axis=1), 1) and not vectors[3].any()
+    similarity = vectors @ vectors[2]
+    assert similarity[0] > similarity[1]
+    # The same in every process: the buckets do not depend on hash()
+    assert np.array_equal(HashingEncoder(dimensions=256, idf=encoder.idf).encode(texts), vectors)
+    assert document_text(["Title", None, {"form_factor": "1U", "ports": [1, 2]}, True]) == "Title form factor 1U ports 1 2"
+
+def test_vector_index_updates_in_place():
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(5, 8)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = VectorIndex(8, capacity=2)
+    index.upsert_many([10, 20, 30, 40], vectors[:4])
+    assert index.search(vectors[2], 1) == [(30, pytest.approx(1.0))]
+    assert index.search(vectors[2], 3, exclude=[30])[0][0] != 30
+
+    index.remove(10)
+    index.upsert(30, vectors[4])
+    assert len(index) == 3 and sorted(index.ids.tolist()) == [20, 30, 40]
+    assert index.search(vectors[4], 1)[0][0] == 30 and 10 not in index
+    assert np.array_equal(index.vector(40), vectors[3])
+
+def test_top_k_over_many_rows_is_fast():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(100_000, 256)).astype(np.float32)
+    index = VectorIndex.from_arrays(np.arange(1, 100_001), vectors)
+    started = time.perf_counter()
+    hits = index.search(vectors[123], 10)
+    assert hits[0][0] == 124 and len(hits) == 10
+    # Generous bound for slow CI machines; typically a few milliseconds
+    assert time.perf_counter() - started < 0.5
+
+@pytest.mark.asyncio
+async def test_indexes_follow_writes(tmp_path, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'semantic.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(ClientModel(id=1, name="Acme", email="ops@acme.test"))
+        for request_id, title, description in (
+            (1, "GPU servers", "Rack servers with GPUs for model training"),
+            (2, "Switches", "Access switches with 48 PoE ports"),
+            (3, "Training cluster", "GPU servers for deep learning training"),
+            (4, "Storage array", "All-flash storage with 200TB"),
+        ):
+            session.add(RequestModel(id=request_id, title=title, description=description, client_id=1,
+                                     equipment_category="server", required_specifications={}, quantity=1,
+                                     priority="medium", status="pending", currency="USD"))
+        session.add(EquipmentModel(id=1, name="PowerEdge R750", model="R750", serial_number="SN-1", manufacturer="Dell",
+                                   category="server", status="available", specifications={"memory": "512GB"}))
+        await session.commit()
+
+    requests = SemanticIndex(RequestModel, HashingEncoder(dimensions=128), batch_size=2, recheck=0)
+    equipment = SemanticIndex(EquipmentModel, HashingEncoder(dimensions=128), batch_size=2, recheck=0)
+    # Writes reach the indexes through the entity cache invalidation
+    monkeypatch.setitem(semantic_indexes, "requests", requests)
+    monkeypatch.setitem(semantic_indexes, "equipment", equipment)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def similar(request_id):
+        async with UnitOfWork(session_factory, read_only=True) as uow:
+            hits = await SimilarRequestsHandler(uow.repositories.get_request_repository()).handle(
+                SimilarRequestsQuery(request_id=request_id, limit=2)
+            )
+        return None if hits is None else [hit.item.id for hit in hits]
+
+    assert await similar("1") == [3, 2]
+    assert requests.builds == 1 and await similar("99") is None
+
+    # Updates and deletes are applied without a rebuild
+    async with UnitOfWork(session_factory) as uow:
+        repository = uow.repositories.get_request_repository()
+        switches = await repository.get_by_id(2)
+        await repository.update(switches.model_copy(update={"description": "Rack servers with GPUs for model training"}))
+        await repository.delete(3)
+    assert (await similar("1"))[0] == 2 and await similar("3") is None
+    assert requests.builds == 1 and requests.stats()["rows"] == 3
+
+    async def search_equipment(text):
+        async with UnitOfWork(session_factory, read_only=True) as uow:
+            handler = SemanticSearchEquipmentHandler(uow.repositories.get_equipment_repository())
+            return await handler.handle(SemanticSearchEquipmentQuery(text=text))
+
+    assert [hit.item.name for hit in await search_equipment("a switch with poe ports")] == ["PowerEdge R750"]
+    async with UnitOfWork(session_factory) as uow:
+        await uow.repositories.get_equipment_repository().create(Equipment(
+            name="Catalyst 9300", model="C9300-48P", serial_number="SN-2", manufacturer="Cisco", category="network",
+            status="available", specifications={"ports": 48, "poe": "yes"}
+        ))
+    hits = await search_equipment("a switch with poe ports")
+    assert hits[0].item.name == "Catalyst 9300" and 0 < hits[0].score <= 1
+    assert equipment.builds == 1
+    await engine.dispose()
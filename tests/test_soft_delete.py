@@ -0,0 +1,99 @@
+from datetime import datetime, time, timedelta
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.offer import Offer
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Client as ClientModel, Equipment as EquipmentModel, Offer as OfferModel, Request as RequestModel
+)
+from src.infrastructure.database.purge import SoftDeletePurger
+from src.infrastructure.database.unit_of_work import UnitOfWork
+
+def test_purge_window_may_span_midnight():
+    purger = SoftDeletePurger(engine=None, retention=timedelta(days=1), window_start=time(23, 0), window_end=time(2, 0))
+    assert purger.in_window(datetime(2025, 1, 1, 23, 30))
+    assert purger.in_window(datetime(2025, 1, 2, 1, 59))
+    assert not purger.in_window(datetime(2025, 1, 2, 2, 0))
+    assert purger.window_closes_at(datetime(2025, 1, 1, 23, 30)) == datetime(2025, 1, 2, 2, 0)
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'soft_delete.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(ClientModel(id=1, name="Acme", email="ops@acme.test"))
+        session.add(EquipmentModel(id=1, name="Pump", model="P1", serial_number="SN-1", manufacturer="Siemens",
+                                   category="medical", status="available"))
+        for request_id in (1, 2):
+            session.add(RequestModel(id=request_id, title=f"Request {request_id}", description="d", client_id=1,
+                                     equipment_category="medical", required_specifications={}, quantity=1, priority="high",
+                                     status="pending", currency="USD"))
+        for offer_id, request_id in ((1, 1), (2, 1), (3, 2)):
+            session.add(OfferModel(id=offer_id, request_id=request_id, equipment_id=1, price=10, currency="USD",
+                                   quantity=1, warranty_period_months=12, status="pending", payment_terms="30_days"))
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+async def live_ids(engine, model):
+    async with AsyncSession(engine) as session:
+        result = await session.execute(select(model.id).where(model.deleted_at.is_(None)).order_by(model.id))
+        return list(result.scalars())
+
+@pytest.mark.asyncio
+async def test_delete_marks_row_and_children_and_hides_them(engine):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with UnitOfWork(session_factory) as uow:
+        assert await uow.repositories.get_request_repository().delete("1")
+        assert not await uow.repositories.get_request_repository().delete("1")
+
+    assert await live_ids(engine, RequestModel) == [2]
+    assert await live_ids(engine, OfferModel) == [3]
+    async with UnitOfWork(session_factory, read_only=True) as uow:
+        requests = uow.repositories.get_request_repository()
+        offers = uow.repositories.get_offer_repository()
+        assert await requests.get_by_id(1) is None
+        assert await requests.get_version(1) is None
+        assert [str(request.id) for request in await requests.list()] == ["2"]
+        assert await offers.count({"request_id": 1}) == 0
+    # The rows themselves are still there until purged
+    async with AsyncSession(engine) as session:
+        assert len((await session.execute(select(OfferModel.id))).all()) == 3
+
+@pytest.mark.asyncio
+async def test_purge_removes_old_deletions_children_first(engine):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with UnitOfWork(session_factory) as uow:
+        await uow.repositories.get_client_repository().delete(1)
+    # Request 2 was deleted recently; its offer was deleted long ago
+    async with engine.begin() as connection:
+        long_ago = datetime.utcnow() - timedelta(days=60)
+        for model in (ClientModel, RequestModel, OfferModel):
+            await connection.execute(update(model).values(deleted_at=long_ago))
+        await connection.execute(update(RequestModel).where(RequestModel.id == 2).values(deleted_at=datetime.utcnow()))
+
+    purger = SoftDeletePurger(engine, retention=timedelta(days=30), batch_size=1, pause=0)
+    purged = await purger.purge()
+    assert purged["offers"] == 3 and purged["requests"] == 1
+    # The client is still referenced by request 2, which is not old enough yet
+    assert purged["clients"] == 0 and purged["equipment"] == 0
+    async with AsyncSession(engine) as session:
+        assert list((await session.execute(select(RequestModel.id))).scalars()) == [2]
+        assert list((await session.execute(select(ClientModel.id))).scalars()) == [1]
+
+@pytest.mark.asyncio
+async def test_offers_need_a_live_request(engine):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with UnitOfWork(session_factory) as uow:
+        await uow.repositories.get_request_repository().delete(2)
+        offers = uow.repositories.get_offer_repository()
+        for request_id in (2, 99):
+            offer = Offer(request_id=request_id, equipment_id=1, price=10, currency="USD", quantity=1,
+                          warranty_period_months=12, status="pending", payment_terms="30_days")
+            assert await offers.create(offer) is None
+    assert await live_ids(engine, OfferModel) == [1, 2]
@@ -0,0 +1,113 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.application.use_cases.equipment.queries.list_equipment import ListEquipmentHandler, ListEquipmentQuery
+from src.domain.entities.equipment import Equipment
+from src.domain.services.specifications import (
+    SpecConstraint, SpecValue, SpecificationError, parse_quantities, parse_range_filter, requirement_constraints,
+    spec_values
+)
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models import (
+    Equipment as EquipmentModel, EquipmentSpecValue as SpecValueModel, referencing_columns
+)
+from src.infrastructure.database.spec_values import backfill_spec_values
+from src.infrastructure.repositories.equipment import EquipmentRepository
+
+def test_values_are_stored_in_canonical_units():
+    assert spec_values({
+        "Power": "1.5 kW", "weight": "max 40kg", "dimensions": "120x80x60mm", "ports": 48, "os": "linux",
+        "memory": "64GB", "speed": "fast"
+    }) == [
+        SpecValue("power", 1500.0, "W"),
+        SpecValue("weight", 40.0, "kg"),
+        SpecValue("dimensions.length", 0.12, "m"),
+        SpecValue("dimensions.width", 0.08, "m"),
+        SpecValue("dimensions.height", 0.06, "m"),
+        SpecValue("ports", 48.0, ""),
+        SpecValue("memory", 64e9, "B"),
+    ]
+    # Keys too long for the normalized table are skipped rather than failing the write
+    assert spec_values({"x" * 100: "1W", "y" * 101: "1W", "z" * 95: "1x2mm"}) == [SpecValue("x" * 100, 1.0, "W")]
+    assert parse_quantities("50000 g") == parse_quantities("50kg")
+    for value in ("fast", "12 parsecs", True, None, "1x2x3x4m"):
+        with pytest.raises(SpecificationError):
+            parse_quantities(value)
+
+def test_requirements_become_constraints():
+    constraints = requirement_constraints({
+        "power": "500W", "weight": "max 40kg", "voltage": "100-240V", "noise": "< 30", "os": "linux"
+    })
+    assert constraints == {
+        "power": [SpecConstraint("power", "W", minimum=500.0)],
+        "weight": [SpecConstraint("weight", "kg", maximum=40.0)],
+        "voltage": [SpecConstraint("voltage", "V", minimum=100.0, maximum=240.0)],
+        "noise": [SpecConstraint("noise", "", maximum=30.0, max_inclusive=False)],
+    }
+    assert constraints["power"][0].accepts(750.0) and not constraints["power"][0].accepts(400.0)
+    assert not constraints["noise"][0].accepts(30.0)
+
+def test_range_filters():
+    assert parse_range_filter("power>=0.4kW") == [SpecConstraint("power", "W", minimum=400.0)]
+    assert parse_range_filter("ports=48") == [SpecConstraint("ports", "", minimum=48.0, maximum=48.0)]
+    assert [constraint.maximum for constraint in parse_range_filter("dimensions<=120x80x60cm")] == [1.2, 0.8, 0.6]
+    with pytest.raises(SpecificationError):
+        parse_range_filter("power 400W")
+
+def test_spec_values_go_with_their_equipment():
+    # Soft deletes and the purger only follow tables that have deleted_at
+    assert SpecValueModel.__table__.c.equipment_id not in referencing_columns(EquipmentModel.__table__)
+
+@pytest.mark.asyncio
+async def test_range_filters_use_normalized_values(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'specs.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        repository = EquipmentRepository(session)
+        for number, specifications in enumerate(
+            ({"power": "500W", "weight": "35kg"}, {"power": "0.3 kW", "weight": "20kg"},
+             {"power": "1.2kW", "weight": "60000g"}, {"os": "linux"}),
+            start=1
+        ):
+            await repository.create(Equipment(
+                name=f"Item {number}", model="M", serial_number=f"SN-{number}", manufacturer="Maker",
+                category="server", status="available", specifications=specifications
+            ))
+        await session.commit()
+
+        handler = ListEquipmentHandler(repository)
+
+        async def names(*ranges):
+            constraints = [constraint for text in ranges for constraint in parse_range_filter(text)]
+            page = await handler.handle(ListEquipmentQuery(spec_ranges=constraints))
+            return [item.name for item in page.items]
+
+        assert await names("power>=400W") == ["Item 1", "Item 3"]
+        assert await names("power>=400W", "weight<=50kg") == ["Item 1"]
+        assert await names("weight>60kg") == []
+
+        # Updates renormalize the specifications
+        item = (await repository.list(filters={"name": "Item 2"}))[0]
+        await repository.update(item.model_copy(update={"specifications": {"power": "2kW"}}))
+        await session.commit()
+        assert await names("power>=400W", "weight<=50kg") == ["Item 1"]
+        assert await names("power>1.5kW") == ["Item 2"]
+
+        # The backfill rebuilds the same values from scratch
+        await session.execute(SpecValueModel.__table__.delete())
+        await session.commit()
+    assert await backfill_spec_values(engine, batch_size=3, pause=0) == 4
+    async with session_factory() as session:
+        result = await session.execute(
+            select(SpecValueModel.equipment_id, SpecValueModel.key, SpecValueModel.value)
+            .order_by(SpecValueModel.equipment_id, SpecValueModel.key)
+        )
+        assert result.all() == [
+            (1, "power", 500.0), (1, "weight", 35.0), (2, "power", 2000.0), (3, "power", 1200.0), (3, "weight", 60.0)
+        ]
+    await engine.dispose()
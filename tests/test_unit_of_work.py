@@ -0,0 +1,64 @@
+import pytest
+from src.infrastructure.database.unit_of_work import UnitOfWork
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+        self.execution_options = None
+        self.info = {}
+
+    async def connection(self, execution_options=None):
+        self.calls.append("connection")
+        self.execution_options = execution_options
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    async def close(self):
+        self.calls.append("close")
+
+class SessionFactory:
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+@pytest.mark.asyncio
+async def test_command_unit_of_work_commits():
+    factory = SessionFactory()
+    async with UnitOfWork(factory) as uow:
+        assert uow.repositories.get_offer_repository().session is uow.session
+    session = factory.sessions[0]
+    assert session.execution_options == {}
+    assert session.calls == ["connection", "commit", "close"]
+
+@pytest.mark.asyncio
+async def test_command_unit_of_work_rolls_back_on_error():
+    factory = SessionFactory()
+    with pytest.raises(ValueError):
+        async with UnitOfWork(factory):
+            raise ValueError("boom")
+    assert factory.sessions[0].calls == ["connection", "rollback", "close"]
+
+@pytest.mark.asyncio
+async def test_query_unit_of_work_is_read_only():
+    factory = SessionFactory()
+    async with UnitOfWork(factory, read_only=True):
+        pass
+    session = factory.sessions[0]
+    assert session.execution_options == {"postgresql_readonly": True}
+    assert session.calls == ["connection", "rollback", "close"]
+
+@pytest.mark.asyncio
+async def test_each_unit_of_work_gets_its_own_session():
+    factory = SessionFactory()
+    async with UnitOfWork(factory) as first, UnitOfWork(factory) as second:
+        assert first.session is not second.session
+    with pytest.raises(RuntimeError):
+        first.session